@@ -1,4 +1,15 @@
 from .single_hand_actions import SingleHandActions
 from .two_hands_actions import TwoHandsActions
+from .backends import ActionBackend, DryRunBackend, LinuxBackend, MacOSBackend, create_backend
+from .macros import MacroAutomaton
 
-__all__ = ["SingleHandActions", "TwoHandsActions"]
+__all__ = [
+    "SingleHandActions",
+    "TwoHandsActions",
+    "ActionBackend",
+    "DryRunBackend",
+    "LinuxBackend",
+    "MacOSBackend",
+    "create_backend",
+    "MacroAutomaton",
+]
@@ -0,0 +1,351 @@
+import itertools
+import json
+from abc import ABC, abstractmethod
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.actions.process_state import ProcessMonitor
+from src.event_log import log_event
+from src.settings.config import Settings
+
+HELPER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "helper.py")
+
+
+@dataclass
+class CommandResult:
+    argv: List[str]
+    returncode: Optional[int] = None
+    stderr: str = ""
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.returncode == 0
+
+
+class _Helper:
+    """One helper process with a reader thread that resolves pending futures."""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", HELPER_PATH],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self.pending: Dict[int, Future] = {}
+        self.argv: Dict[int, List[str]] = {}
+        self.exited = False
+        self.lock = threading.Lock()
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return not self.exited and self.process.poll() is None
+
+    def submit(self, request_id: int, argv: List[str], timeout: float, future: Future, detach: bool = False) -> None:
+        request = {"id": request_id, "argv": argv, "timeout": timeout, "detach": detach}
+        with self.lock:
+            if self.exited:
+                raise OSError("helper exited")
+            try:
+                self.process.stdin.write(json.dumps(request) + "\n")
+                self.process.stdin.flush()
+            except ValueError as e:
+                raise OSError(str(e))
+            self.pending[request_id] = future
+            self.argv[request_id] = argv
+
+    def _read(self) -> None:
+        for line in self.process.stdout:
+            try:
+                response = json.loads(line)
+                request_id = response["id"]
+                result = (response["returncode"], response["stderr"], response["error"])
+            except (ValueError, KeyError, TypeError) as e:
+                # The request a garbled line answers cannot be told, so the helper is treated as dead
+                log_event("helper_failed", error=f"malformed response: {e}", line=line[:200])
+                self.process.kill()
+                break
+            with self.lock:
+                future = self.pending.pop(request_id, None)
+                argv = self.argv.pop(request_id, [])
+            if future is not None:
+                future.set_result(CommandResult(argv, *result))
+
+        # The helper exited: fail everything it did not answer
+        with self.lock:
+            self.exited = True
+            pending, self.pending = self.pending, {}
+            argv, self.argv = self.argv, {}
+        for request_id, future in pending.items():
+            future.set_result(CommandResult(argv.get(request_id, []), error="helper exited"))
+
+    def close(self) -> None:
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self.reader.join(timeout=1)
+
+
+class CommandPool:
+    """
+    Runs commands through long-lived helper processes, so a trigger costs a pipe
+    write instead of forking the (large) application process. Helpers are started
+    on first use and restarted if they die. Results, including failures and
+    timeouts, are delivered through futures.
+    """
+
+    def __init__(self, size: int = 1, timeout: float = 10.0):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._helpers: List[Optional[_Helper]] = [None] * self.size
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _helper(self, request_id: int) -> _Helper:
+        slot = request_id % self.size
+        with self._lock:
+            helper = self._helpers[slot]
+            if helper is None or not helper.alive:
+                helper = self._helpers[slot] = _Helper()
+            return helper
+
+    def submit(
+        self, argv: List[str], timeout: Optional[float] = None, detach: bool = False
+    ) -> "Future[CommandResult]":
+        """
+        :param argv: Command line.
+        :param timeout: Seconds the command may run before it is killed, the pool's timeout by default.
+        :param detach: Start the command in its own session and resolve as soon as it started, without
+            a timeout; for launching apps, which keep running in the foreground.
+        """
+
+        future: Future = Future()
+        request_id = next(self._ids)
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            self._helper(request_id).submit(request_id, list(argv), timeout, future, detach)
+        except OSError as e:
+            future.set_result(CommandResult(list(argv), error=str(e)))
+        return future
+
+    def warm_up(self) -> None:
+        """Starts all helpers ahead of the first trigger."""
+        for slot in range(self.size):
+            self._helper(slot)
+
+    def close(self) -> None:
+        with self._lock:
+            helpers, self._helpers = self._helpers, [None] * self.size
+        for helper in helpers:
+            if helper is not None:
+                helper.close()
+
+
+class ActionBackend(ABC):
+    """Platform specific way to perform the actions bound to gestures."""
+
+    name = "base"
+
+    def __init__(self, pool: Optional[CommandPool] = None, processes: Optional[ProcessMonitor] = None):
+        self.pool = pool or CommandPool()
+        self.processes = processes
+
+    @abstractmethod
+    def open_app(self, app: str) -> "Future[CommandResult]":
+        ...
+
+    def process_name(self, app: str) -> Optional[str]:
+        """
+        Name of the process `open_app` starts for an app, None if it cannot be told.
+        Apps without a name are never looked up, so they do not start the process monitor.
+        """
+        return app
+
+    def ensure_app(self, app: str, activate: bool = False) -> "Optional[Future[CommandResult]]":
+        """
+        Opens an app unless the last process snapshot shows it running. Bringing a running app
+        forward costs as much as launching it (a command on macOS, a relaunch on Linux), so a
+        running app is left as it is. Without a process monitor the app is always opened.
+        :param app: Application name.
+        :param activate: Use `activate_app` rather than `open_app` to start the app.
+        :return: Future of the command, or None if the app is running and nothing was run.
+        """
+
+        name = self.process_name(app) if self.processes is not None else None
+        if name is not None and self.processes.is_running(name):
+            log_event("action_skipped", action="open_app", app=app, reason="running")
+            return None
+        return self.activate_app(app) if activate else self.open_app(app)
+
+    def activate_app(self, app: str) -> "Future[CommandResult]":
+        return self.open_app(app)
+
+    @abstractmethod
+    def screenshot(self, path: str) -> "Future[CommandResult]":
+        ...
+
+    @abstractmethod
+    def change_volume(self, percent: int) -> "Future[CommandResult]":
+        """:param percent: Percentage points to add to the output volume, negative lowers it."""
+
+    @abstractmethod
+    def scroll(self, lines: int) -> "Future[CommandResult]":
+        """:param lines: Lines to scroll, positive scrolls up."""
+
+    def close(self) -> None:
+        self.pool.close()
+        if self.processes is not None:
+            self.processes.close()
+
+
+class MacOSBackend(ActionBackend):
+    name = "macos"
+
+    def open_app(self, app: str) -> "Future[CommandResult]":
+        return self.pool.submit(["open", "-a", app])
+
+    def activate_app(self, app: str) -> "Future[CommandResult]":
+        return self.pool.submit(["osascript", "-e", f'tell application "{app}" to activate'])
+
+    def screenshot(self, path: str) -> "Future[CommandResult]":
+        return self.pool.submit(["screencapture", path])
+
+    def change_volume(self, percent: int) -> "Future[CommandResult]":
+        script = f"set volume output volume ((output volume of (get volume settings)) + {percent})"
+        return self.pool.submit(["osascript", "-e", script])
+
+    def scroll(self, lines: int) -> "Future[CommandResult]":
+        script = f"ObjC.import('CoreGraphics'); $.CGEventPost(0, $.CGEventCreateScrollWheelEvent(null, 1, 1, {lines}))"
+        return self.pool.submit(["osascript", "-l", "JavaScript", "-e", script])
+
+
+class LinuxBackend(ActionBackend):
+    name = "linux"
+
+    DEFAULT_APPS = {
+        "Photos": ["xdg-open", os.path.expanduser("~/Pictures")],
+        "Notes": ["xdg-open", os.path.expanduser("~/Documents")],
+        "Calendar": ["gnome-calendar"],
+        "Music": ["xdg-open", os.path.expanduser("~/Music")],
+    }
+
+    SCREENSHOT_TOOLS = [
+        ("gnome-screenshot", ["gnome-screenshot", "-f"]),
+        ("spectacle", ["spectacle", "-b", "-n", "-o"]),
+        ("grim", ["grim"]),
+        ("scrot", ["scrot", "-o"]),
+        ("import", ["import", "-window", "root"]),
+    ]
+
+    def __init__(
+        self,
+        pool: Optional[CommandPool] = None,
+        apps: Optional[Dict[str, List[str]]] = None,
+        processes: Optional[ProcessMonitor] = None,
+    ):
+        super().__init__(pool, processes)
+        self.apps = dict(self.DEFAULT_APPS if apps is None else apps)
+        if self.processes is not None and not any(self.process_name(app) for app in self.apps):
+            # Every app goes through xdg-open, so no snapshot could ever tell one is running
+            self.processes.close()
+            self.processes = None
+        self.screenshot_command = next(
+            (command for tool, command in self.SCREENSHOT_TOOLS if shutil.which(tool)), None
+        )
+
+    def open_app(self, app: str) -> "Future[CommandResult]":
+        # Apps such as gnome-calendar stay in the foreground until closed, so they are not timed out
+        argv = self.apps.get(app, [app.lower()])
+        return self.pool.submit(argv, detach=True)
+
+    def process_name(self, app: str) -> Optional[str]:
+        # xdg-open hands the path to whatever file manager is configured
+        tool = os.path.basename(self.apps.get(app, [app.lower()])[0])
+        return None if tool == "xdg-open" else tool
+
+    def screenshot(self, path: str) -> "Future[CommandResult]":
+        if self.screenshot_command is None:
+            future: Future = Future()
+            future.set_result(CommandResult([], error="no screenshot tool found"))
+            return future
+        return self.pool.submit(self.screenshot_command + [path])
+
+    def change_volume(self, percent: int) -> "Future[CommandResult]":
+        return self.pool.submit(["pactl", "set-sink-volume", "@DEFAULT_SINK@", f"{percent:+d}%"])
+
+    def scroll(self, lines: int) -> "Future[CommandResult]":
+        # Mouse buttons 4 and 5 are the wheel up and down
+        return self.pool.submit(["xdotool", "click", "--repeat", str(abs(lines)), "4" if lines > 0 else "5"])
+
+
+class DryRunBackend(ActionBackend):
+    """Records requested actions instead of running them; for tests and benchmarks."""
+
+    name = "dry-run"
+
+    def __init__(self, processes: Optional[ProcessMonitor] = None):
+        self.calls: List[tuple] = []
+        self.processes = processes
+
+    def _record(self, *call) -> "Future[CommandResult]":
+        self.calls.append(call)
+        future: Future = Future()
+        future.set_result(CommandResult(list(call), returncode=0))
+        return future
+
+    def open_app(self, app: str) -> "Future[CommandResult]":
+        return self._record("open_app", app)
+
+    def activate_app(self, app: str) -> "Future[CommandResult]":
+        return self._record("activate_app", app)
+
+    def screenshot(self, path: str) -> "Future[CommandResult]":
+        return self._record("screenshot", path)
+
+    def change_volume(self, percent: int) -> "Future[CommandResult]":
+        return self._record("change_volume", percent)
+
+    def scroll(self, lines: int) -> "Future[CommandResult]":
+        return self._record("scroll", lines)
+
+    def close(self) -> None:
+        pass
+
+
+def create_backend(settings: Settings) -> ActionBackend:
+    """
+    Creates the action backend selected in Settings.
+    :param settings: Application settings; "auto" picks the backend for the current platform.
+    :return: Action backend. Helper processes are started on first use.
+    """
+
+    name = settings.action_backend
+    if name == "auto":
+        name = "macos" if sys.platform == "darwin" else "linux"
+
+    if name == "dry-run":
+        return DryRunBackend()
+    pool = CommandPool(size=settings.action_workers, timeout=settings.action_timeout)
+    interval = settings.process_refresh_interval
+    processes = ProcessMonitor(interval) if interval > 0 else None
+    if name == "macos":
+        return MacOSBackend(pool, processes)
+    if name == "linux":
+        return LinuxBackend(pool, processes=processes)
+    raise ValueError(f"Unknown action backend: {settings.action_backend}")
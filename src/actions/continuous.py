@@ -0,0 +1,151 @@
+"""
+Output side of continuous controls: targets that turn a channel value into a backend
+command, and a dispatcher that keeps their commands from piling up.
+"""
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from src.detection.channels import CONTROL_CHANNELS, ControlChannel
+from src.event_log import log_event
+
+# Lines scrolled and volume percentage points changed when the channel value sweeps the whole range
+SCROLL_LINES = 30
+VOLUME_PERCENT = 100
+
+
+class _RelativeTarget(ABC):
+    """
+    Moves a target by how far the channel value moved since the last command, in whole steps.
+    The first value of an engagement only sets the reference point, so grabbing the control
+    never makes the target jump to wherever the hand happens to be.
+    """
+
+    def __init__(self, backend, steps: int):
+        self.backend = backend
+        self.steps = steps
+        self.anchor: Optional[float] = None
+
+    def __call__(self, value: float) -> Optional[Future]:
+        if self.anchor is None:
+            self.anchor = value
+            return None
+        steps = round((value - self.anchor) * self.steps)
+        if not steps:
+            return None
+        # Keep the remainder, so slow movement still adds up to whole steps
+        self.anchor += steps / self.steps
+        return self._command(steps)
+
+    @abstractmethod
+    def _command(self, steps: int) -> Optional[Future]:
+        """:param steps: Whole steps to move the target by, negative moves it back."""
+
+    def reset(self) -> None:
+        self.anchor = None
+
+
+class VolumeTarget(_RelativeTarget):
+    """Raises or lowers the output volume as the channel value moves."""
+
+    def __init__(self, backend, percent: int = VOLUME_PERCENT):
+        super().__init__(backend, percent)
+
+    def _command(self, steps: int) -> Optional[Future]:
+        return self.backend.change_volume(steps)
+
+
+class ScrollTarget(_RelativeTarget):
+    """Scrolls by how far the channel value moved since the last command."""
+
+    def __init__(self, backend, lines: int = SCROLL_LINES):
+        super().__init__(backend, lines)
+
+    def _command(self, steps: int) -> Optional[Future]:
+        return self.backend.scroll(steps)
+
+
+CONTROL_TARGETS = {"volume": VolumeTarget, "scroll": ScrollTarget}
+
+
+class CoalescingDispatcher:
+    """
+    Sends the newest value of a channel at most `rate` times per second.
+    Values submitted between sends replace each other, and nothing is sent while the
+    previous command is still running, so the backend never works through a backlog of
+    stale values: the command that eventually runs always carries the latest one.
+    """
+
+    def __init__(self, send: Callable[[float], Optional[Future]], rate: float = 10.0):
+        """
+        :param send: Target issuing the command for a value; may return a future of its result.
+        :param rate: Highest number of commands per second.
+        """
+
+        self.send = send
+        self.interval = 1.0 / rate
+        self.pending: Optional[float] = None
+        self.in_flight: Optional[Future] = None
+        self.last_sent = float("-inf")
+        self.sent = 0
+        self.coalesced = 0
+
+    def submit(self, value: float) -> None:
+        if self.pending is not None:
+            self.coalesced += 1
+        self.pending = value
+
+    def poll(self, now: float) -> bool:
+        """
+        Sends the pending value if the rate and the previous command allow it.
+        :param now: Current time in seconds.
+        :return: True if a command was sent.
+        """
+
+        if self.pending is None or now - self.last_sent < self.interval:
+            return False
+        if self.in_flight is not None and not self.in_flight.done():
+            return False
+        value, self.pending = self.pending, None
+        self.in_flight = self.send(value)
+        self.last_sent = now
+        self.sent += 1
+        return True
+
+    def reset(self) -> None:
+        """Drops the pending value, e.g. when the hand leaves the control pose."""
+        self.pending = None
+        if hasattr(self.send, "reset"):
+            self.send.reset()
+
+
+def create_dispatcher(target: str, backend, rate: float) -> CoalescingDispatcher:
+    """
+    :param target: Name from CONTROL_TARGETS.
+    :param backend: Action backend running the commands.
+    :param rate: Highest number of commands per second.
+    :raises ValueError: On an unknown target.
+    """
+
+    if target not in CONTROL_TARGETS:
+        raise ValueError(f"Unknown control target: {target!r}")
+    log_event("component_initialized", component="ControlDispatcher", target=target, rate=rate)
+    return CoalescingDispatcher(CONTROL_TARGETS[target](backend), rate)
+
+
+def create_controls(settings, backend) -> List[Tuple[ControlChannel, CoalescingDispatcher]]:
+    """
+    Binds the channels of `Settings.controls` to their targets.
+    :raises ValueError: On an unknown channel or target.
+    """
+
+    controls = []
+    for name, target in settings.controls.items():
+        if name not in CONTROL_CHANNELS:
+            raise ValueError(f"Unknown control channel: {name!r}")
+        measure, pose = CONTROL_CHANNELS[name]
+        channel = ControlChannel(
+            name, measure, pose, smoothing=settings.control_smoothing, deadband=settings.control_deadband
+        )
+        controls.append((channel, create_dispatcher(target, backend, settings.control_rate)))
+    return controls
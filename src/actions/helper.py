@@ -0,0 +1,78 @@
+"""
+Long-lived command runner used by CommandPool.
+
+Reads one JSON request per line from stdin: {"id": 1, "argv": [...], "timeout": 10.0, "detach": false}
+and writes one JSON response per line to stdout: {"id": 1, "returncode": 0, "stderr": "", "error": null}.
+Commands run concurrently, each in its own thread. A detached command (an app launch) is
+started in its own session and answered with returncode 0 as soon as it has started; it is
+never timed out. Only the standard library is used, so the helper starts fast and does not
+import the application.
+"""
+import json
+import subprocess
+import sys
+import threading
+
+_write_lock = threading.Lock()
+
+
+def _respond(response: dict) -> None:
+    line = json.dumps(response) + "\n"
+    with _write_lock:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+
+def _run(request: dict) -> None:
+    response = {"id": request["id"], "returncode": None, "stderr": "", "error": None}
+    if request.get("detach"):
+        try:
+            process = subprocess.Popen(
+                request["argv"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            response["returncode"] = 0
+        except Exception as e:
+            response["error"] = str(e)
+        else:
+            # Reap the app whenever it exits, so it does not stay a zombie of the helper;
+            # the helper does not wait for it when stdin closes
+            threading.Thread(target=process.wait, daemon=True).start()
+        _respond(response)
+        return
+    try:
+        completed = subprocess.run(
+            request["argv"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=request.get("timeout"),
+        )
+        response["returncode"] = completed.returncode
+        response["stderr"] = completed.stderr.decode(errors="replace")[-1000:]
+    except subprocess.TimeoutExpired:
+        response["error"] = "timeout"
+    except Exception as e:
+        response["error"] = str(e)
+    _respond(response)
+
+
+def main() -> None:
+    workers = []
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        worker = threading.Thread(target=_run, args=(json.loads(line),), daemon=True)
+        worker.start()
+        workers = [w for w in workers if w.is_alive()] + [worker]
+
+    # stdin closed: let commands that are still running report back
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Gesture sequence macros, e.g. like → stop bound to an action.
+
+All sequences are compiled into one deterministic automaton (an Aho–Corasick trie whose
+failure links are folded into a dense transition table indexed by gesture code), so every
+confirmed gesture advances it with a single table lookup, whatever the number of macros.
+A gesture arriving more than `timeout` seconds after the previous one starts over from
+the root, and a state that completes a macro fires it and returns to the root.
+
+Macros are shortcuts on top of the gestures, not instead of them: every gesture of a
+sequence still runs its own action when it is confirmed, so "like > stop" opens Photos and
+Calendar on the way and then runs the macro action. Holding step actions back until a
+sequence is decided would delay every gesture that starts some macro by up to `timeout`.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.actions.single_hand_actions import SingleHandActions
+from src.actions.two_hands_actions import TwoHandsActions
+from src.event_log import log_event
+from src.models import GESTURE_NAMES, GestureCode, to_code
+
+SEQUENCE_SEPARATOR = ">"
+
+# Action keys a macro can run: the keys gestures can be mapped to
+MACRO_ACTIONS = frozenset(SingleHandActions.ACTION_KEYS) | frozenset(TwoHandsActions.ACTION_KEYS)
+
+
+def parse_sequence(text: str) -> Tuple[GestureCode, ...]:
+    """
+    Parses a sequence such as "is_like > is_stop"; two-hand gestures may be written as "is_stop is_stop".
+    :param text: Gesture names separated by SEQUENCE_SEPARATOR.
+    :return: Gesture codes.
+    :raises ValueError: If the sequence is empty or a name is not a gesture.
+    """
+
+    names = [name.strip() for name in text.split(SEQUENCE_SEPARATOR)]
+    codes = tuple(to_code(name) for name in names)
+    if not all(codes):
+        raise ValueError(f"Invalid gesture sequence: {text!r}")
+    return codes
+
+
+def format_sequence(codes: Sequence[int]) -> str:
+    return f" {SEQUENCE_SEPARATOR} ".join(GESTURE_NAMES[code] for code in codes)
+
+
+class MacroAutomaton:
+    def __init__(self, macros: Optional[Dict[str, str]] = None, timeout: float = 3.0):
+        """
+        :param macros: Sequence text (see `parse_sequence`) -> action key from MACRO_ACTIONS.
+        :param timeout: Longest pause in seconds between two gestures of a sequence.
+        """
+
+        self.timeout = timeout
+        self.state = 0
+        self.last_time = float("-inf")
+        self.compile(macros or {})
+
+    def compile(self, macros: Dict[str, str]) -> None:
+        """
+        Builds the transition table. Later calls replace all macros and reset the state.
+        :raises ValueError: On an invalid sequence or an unknown action key.
+        """
+
+        width = len(GestureCode)
+        goto: List[List[int]] = [[0] * width]
+        outputs: List[Optional[str]] = [None]
+        gestures = set()
+        for text, action in macros.items():
+            if action not in MACRO_ACTIONS:
+                raise ValueError(f"Unknown macro action: {action!r}")
+            state = 0
+            sequence = parse_sequence(text)
+            gestures.update(sequence)
+            for code in sequence:
+                if not goto[state][code]:
+                    goto.append([0] * width)
+                    outputs.append(None)
+                    goto[state][code] = len(goto) - 1
+                state = goto[state][code]
+            outputs[state] = action
+
+        # Breadth-first: a missing transition follows the failure link, i.e. continues from the
+        # longest suffix of the gestures seen so far that is also a prefix of some macro
+        fail = [0] * len(goto)
+        queue = [state for state in goto[0] if state]
+        for state in queue:
+            for code in range(width):
+                child = goto[state][code]
+                if child:
+                    fail[child] = goto[fail[state]][code]
+                    outputs[child] = outputs[child] or outputs[fail[child]]
+                    queue.append(child)
+                else:
+                    goto[state][code] = goto[fail[state]][code]
+
+        self.table: Tuple[Tuple[int, ...], ...] = tuple(tuple(row) for row in goto)
+        self.outputs: Tuple[Optional[str], ...] = tuple(outputs)
+        # Every gesture some macro uses, e.g. to know whether two hands have to be detected
+        self.gestures = frozenset(gestures)
+        self.reset()
+
+    def advance(self, gesture: int, timestamp: float) -> Optional[str]:
+        """
+        Feeds one confirmed gesture.
+        :param gesture: Gesture code.
+        :param timestamp: Time of the gesture in seconds.
+        :return: Action key of the macro completed by this gesture, or None.
+        """
+
+        if timestamp - self.last_time > self.timeout:
+            self.state = 0
+        self.last_time = timestamp
+        self.state = self.table[self.state][gesture]
+        action = self.outputs[self.state]
+        if action:
+            self.state = 0
+        return action
+
+    def reset(self) -> None:
+        self.state = 0
+        self.last_time = float("-inf")
+
+
+def run_macro_action(action: str, single_actions, two_actions) -> Optional[str]:
+    """
+    Runs a macro action through the public `run_action` of the same action objects the gestures use.
+    :param action: Action key from MACRO_ACTIONS.
+    :return: Whatever the action returned, e.g. a status message.
+    """
+
+    log_event("macro_fired", action=action)
+    actions = two_actions if action in TwoHandsActions.ACTION_KEYS else single_actions
+    return actions.run_action(action)
@@ -0,0 +1,86 @@
+"""
+Cached view of the running processes, so actions can skip launching an app that is
+already running instead of spawning a command on every trigger.
+"""
+import subprocess
+import threading
+from typing import Callable, FrozenSet, List, Optional
+
+import psutil
+
+from src.event_log import log_event
+
+
+class ProcessMonitor:
+    """
+    Snapshot of running process names, refreshed by a background thread every `interval`
+    seconds. Lookups read the last snapshot and never touch the process table themselves.
+    The thread starts on the first lookup, so a monitor nobody asks costs nothing.
+    """
+
+    def __init__(self, interval: float = 2.0, process_iter: Callable = psutil.process_iter):
+        """
+        :param interval: Seconds between two snapshots.
+        :param process_iter: `psutil.process_iter`-like source of processes with `info["name"]`.
+        """
+
+        self.interval = interval
+        self.process_iter = process_iter
+        self.names: FrozenSet[str] = frozenset()
+        self.refreshes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> "ProcessMonitor":
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="process-monitor", daemon=True)
+                self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.refresh()
+            except psutil.Error as e:
+                log_event("process_snapshot_failed", error=str(e))
+            if self._stop.wait(self.interval):
+                return
+
+    def refresh(self) -> None:
+        names = set()
+        for process in self.process_iter(["name"]):
+            name = process.info.get("name")
+            if name:
+                names.add(name.lower())
+        # Readers see either the old or the new snapshot, never a partial one
+        self.names = frozenset(names)
+        self.refreshes += 1
+
+    def is_running(self, name: str) -> bool:
+        """
+        :param name: Process name, compared case-insensitively.
+        :return: Whether the process was running at the last snapshot; False before the first one.
+        """
+
+        self.start()
+        return name.lower() in self.names
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+
+def spawn(argv: List[str]) -> subprocess.Popen:
+    """
+    Starts a command without waiting for it. A daemon thread waits for the child and reaps
+    it as soon as it exits, so direct launches do not leave zombies behind.
+    :param argv: Command line.
+    :return: The started process.
+    """
+
+    process = subprocess.Popen(argv)
+    threading.Thread(target=process.wait, name="reap", daemon=True).start()
+    return process
@@ -1,46 +1,92 @@
-import subprocess
 import os
 import time
 
+from src.actions.process_state import spawn
+from src.event_log import log_event
+from src.models import GESTURE_NAMES, GestureCode, code_table, to_code
+
 
 class SingleHandActions:
+    def __init__(self, backend=None):
+        """
+        backend: ActionBackend для запуска команд через пул помощников;
+        None — запуск напрямую через subprocess.Popen (завершившиеся процессы собираются, см. spawn)
+        """
+        self.backend = backend
+
     def get_action(self, gesture):
-        """Главный метод для обработки жестов одной рукой"""
-        print(f"Gesture recognized: {gesture}")
-
-        if gesture == "is_like":
-            return self._like_gesture_action()
-        elif gesture == "is_dislike":
-            return self._dislike_gesture_action()
-        elif gesture == "is_stop":
-            return self._stop_gesture_action()
-        elif gesture == "is_okay":
-            return self._okay_gesture_action()
-        else:
-            return None
+        """Главный метод для обработки жестов одной рукой (код GestureCode или имя жеста)"""
+        code = to_code(gesture)
+        log_event("gesture_recognized", gesture=GESTURE_NAMES[code] or gesture)
+
+        action = self._ACTIONS[code]
+        return action(self) if action else None
+
+    def run_action(self, key):
+        """Выполняет действие по его ключу ('open_photos', ...) — так же, как при привязке жеста в интерфейсе"""
+        return self.ACTION_KEYS[key](self)
 
     def _like_gesture_action(self):
         """Если жест 'лайк', то открывается галерея (Фото)"""
-        print("Opening Photos...")
-        subprocess.Popen(["open", "-a", "Photos"])
+        self._open_app("Photos")
         return "👍"
 
     def _dislike_gesture_action(self):
         """Если жест 'дизлайк', то открываются Заметки"""
-        print("Opening Notes...")
-        subprocess.Popen(["open", "-a", "Notes"])
+        self._open_app("Notes")
         return "👎"
 
     def _stop_gesture_action(self):
         """Если жест 'стоп', то открывается Календарь"""
-        print("Opening Calendar...")
-        subprocess.Popen(["open", "-a", "Calendar"])
+        self._open_app("Calendar")
         return "✋"
 
     def _okay_gesture_action(self):
         """Если жест 'окей', то делается скриншот"""
-        print("Taking screenshot...")
+        log_event("action_started", action="screenshot")
         timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
         screenshot_path = os.path.expanduser(f"~/Desktop/screenshot_{timestamp}.png")
-        subprocess.Popen(["screencapture", screenshot_path])
-        return "👌"
\ No newline at end of file
+        if self.backend is None:
+            spawn(["screencapture", screenshot_path])
+        else:
+            self.backend.screenshot(screenshot_path).add_done_callback(_report_failure)
+        return "👌"
+
+    def _open_app(self, app):
+        """Открывает приложение через выбранный backend; уже запущенное приложение не перезапускается"""
+        if self.backend is None:
+            log_event("action_started", action="open_app", app=app)
+            spawn(["open", "-a", app])
+            return
+        future = self.backend.ensure_app(app)
+        if future is not None:
+            log_event("action_started", action="open_app", app=app)
+            future.add_done_callback(_report_failure)
+
+    # Таблица действий, индексируемая кодом жеста
+    _ACTIONS = code_table({
+        GestureCode.LIKE: _like_gesture_action,
+        GestureCode.DISLIKE: _dislike_gesture_action,
+        GestureCode.STOP: _stop_gesture_action,
+        GestureCode.OKAY: _okay_gesture_action,
+    })
+
+    # Действия, доступные по ключу: для привязок из интерфейса и для макросов
+    ACTION_KEYS = {
+        "open_photos": _like_gesture_action,
+        "open_notes": _dislike_gesture_action,
+        "open_calendar": _stop_gesture_action,
+        "take_screenshot": _okay_gesture_action,
+    }
+
+
+def _report_failure(future):
+    """Сообщает об ошибке команды, которая завершилась асинхронно"""
+    result = future.result()
+    if not result.ok:
+        log_event(
+            "action_failed",
+            argv=result.argv,
+            returncode=result.returncode,
+            error=result.error or result.stderr.strip(),
+        )
\ No newline at end of file
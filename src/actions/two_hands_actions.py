@@ -1,21 +1,52 @@
 import subprocess
 
+from src.event_log import log_event
+from src.models import GESTURE_NAMES, TWO_HAND_CODES, GestureCode, code_table, to_code
+from .single_hand_actions import _report_failure
+
 
 class TwoHandsActions:
-    def __init__(self):
+    def __init__(self, backend=None):
+        self.backend = backend
         self.both_hands_detected = False
         self.previous_gesture = None
         self.gesture_count = 0
 
     def get_action(self, gesture):
-        print(f"Gesture recognized: {gesture}")
-        if gesture == "is_two_stops":
-            return self._two_gesture_action()
-        else:
-            return None
+        """Обработка жестов двумя руками (код GestureCode или имя жеста)"""
+        code = to_code(gesture)
+        log_event("gesture_recognized", gesture=GESTURE_NAMES[code] or gesture)
+
+        action = self._ACTIONS[code]
+        return action(self) if action else None
+
+    def run_action(self, key):
+        """Выполняет действие по его ключу ('turn_music', ...) — так же, как при привязке жеста в интерфейсе"""
+        return self.ACTION_KEYS[key](self)
+
+    def is_active(self):
+        """Назначено ли действие хотя бы одному жесту двумя руками (с учётом привязок из интерфейса)"""
+        ui_mapping = getattr(self, "_ui_mapping", None)
+        for code in TWO_HAND_CODES:
+            action = (ui_mapping[code] if ui_mapping else None) or self._ACTIONS[code]
+            if action and action is not TwoHandsActions._no_action:
+                return True
+        return False
+
+    def _no_action(self):
+        """Действие 'none' из интерфейса: жест распознаётся, но ничего не делает"""
+        return None
 
     def _two_gesture_action(self):
         """Если жест 'две открытых ладони', то открывает приложение Музыка"""
+        if self.backend is not None:
+            # Ошибки придут асинхронно через future; уже запущенная Музыка не трогается
+            future = self.backend.ensure_app("Music", activate=True)
+            if future is not None:
+                log_event("action_started", action="activate_app", app="Music")
+                future.add_done_callback(_report_failure)
+            return "🎵 Music opened"
+
         try:
             # AppleScript для открытия приложения Музыка
             script = '''
@@ -25,12 +56,18 @@ class TwoHandsActions:
             '''
 
             subprocess.run(["osascript", "-e", script], check=True)
-            print("Music app opened successfully")
+            log_event("action_done", action="activate_app", app="Music")
             return "🎵 Music opened"
 
         except subprocess.CalledProcessError as e:
-            print(f"Error opening Music app: {e}")
+            log_event("action_failed", action="activate_app", app="Music", error=str(e))
             return "❌ Error opening Music"
         except Exception as e:
-            print(f"Unexpected error: {e}")
-            return "❌ Error"
\ No newline at end of file
+            log_event("action_failed", action="activate_app", app="Music", error=f"Unexpected error: {e}")
+            return "❌ Error"
+
+    # Таблица действий, индексируемая кодом жеста
+    _ACTIONS = code_table({GestureCode.TWO_STOPS: _two_gesture_action})
+
+    # Действия, доступные по ключу: для привязок из интерфейса и для макросов
+    ACTION_KEYS = {"turn_music": _two_gesture_action}
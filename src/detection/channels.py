@@ -0,0 +1,111 @@
+"""
+Continuous control channels: a value stream derived from the landmarks of every frame,
+as opposed to discrete gestures that fire once when confirmed.
+"""
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.detection.landmarks import MIDDLE_MCP, WRIST
+from src.settings.constants import FINGER_TIPS, INDEX_TIP, PINCH_MAX_SPREAD, THUMB_TIP
+
+# Middle (PIP) joints of the middle, ring and pinky fingers
+_PIP_JOINTS = [10, 14, 18]
+INDEX_PIP = 6
+
+
+def pinch_distance(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Thumb tip to index tip distance of every hand, in palm sizes (wrist to middle finger
+    base), so it does not change with the distance from the camera.
+    :param landmarks: Array of shape (N, 21, 3).
+    :return: Distances of shape (N,).
+    """
+
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    pinch = np.linalg.norm(landmarks[:, THUMB_TIP, :2] - landmarks[:, INDEX_TIP, :2], axis=1)
+    palm = np.linalg.norm(landmarks[:, MIDDLE_MCP, :2] - landmarks[:, WRIST, :2], axis=1)
+    return pinch / np.maximum(palm, 1e-6)
+
+
+def pinch_pose(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Whether each hand holds the control pose: middle, ring and pinky fingers folded, index
+    finger extended (its tip farther from the wrist than its middle joint) and the thumb tip
+    within `PINCH_MAX_SPREAD` of the index tip, so that only the thumb and index finger move.
+    An open palm, a fist or a thumb up or down does not steer anything.
+    :param landmarks: Array of shape (N, 21, 3).
+    :return: Boolean mask of shape (N,).
+    """
+
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    folded = np.all(landmarks[:, FINGER_TIPS[2:], 1] > landmarks[:, _PIP_JOINTS, 1], axis=1)
+    wrist = landmarks[:, WRIST, :2]
+    extended = np.linalg.norm(landmarks[:, INDEX_TIP, :2] - wrist, axis=1) > np.linalg.norm(
+        landmarks[:, INDEX_PIP, :2] - wrist, axis=1
+    )
+    return folded & extended & (pinch_distance(landmarks) <= PINCH_MAX_SPREAD)
+
+
+# Channel name -> (per-hand measurement, mask of hands allowed to steer)
+CONTROL_CHANNELS: Dict[str, Tuple[Callable, Callable]] = {"pinch": (pinch_distance, pinch_pose)}
+
+
+class ControlChannel:
+    """
+    Turns a per-hand measurement into a smoothed value in [0, 1].
+    The first hand in the control pose steers the channel; the value is smoothed with an
+    exponential moving average and only reported when it moved by more than the deadband
+    since the last reported value, so hand tremor does not produce a stream of updates.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        measure: Callable[[np.ndarray], np.ndarray] = pinch_distance,
+        pose: Callable[[np.ndarray], np.ndarray] = pinch_pose,
+        value_range: Tuple[float, float] = (0.2, 1.5),
+        smoothing: float = 0.3,
+        deadband: float = 0.02,
+    ):
+        """
+        :param name: Channel name, e.g. "pinch".
+        :param measure: Per-hand raw measurement of a (N, 21, 3) batch.
+        :param pose: Per-hand mask of hands allowed to steer the channel.
+        :param value_range: Raw values mapped to 0 and 1; values outside are clipped.
+        :param smoothing: Weight of the newest sample in the moving average, 1 disables smoothing.
+        :param deadband: Smallest change of the smoothed value that is reported.
+        """
+
+        self.name = name
+        self.measure = measure
+        self.pose = pose
+        self.value_range = value_range
+        self.smoothing = smoothing
+        self.deadband = deadband
+        self.value: Optional[float] = None
+        self.reported: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        return self.value is not None
+
+    def update(self, landmarks: np.ndarray) -> Optional[float]:
+        """
+        :param landmarks: Array of shape (N, 21, 3) of all detected hands.
+        :return: The new value if it moved past the deadband, otherwise None.
+            The channel becomes inactive when no hand holds the pose.
+        """
+
+        steering = np.flatnonzero(self.pose(landmarks)) if len(landmarks) else ()
+        if not len(steering):
+            self.value = self.reported = None
+            return None
+
+        low, high = self.value_range
+        raw = float(np.clip((self.measure(landmarks[steering[:1]])[0] - low) / (high - low), 0.0, 1.0))
+        self.value = raw if self.value is None else self.value + self.smoothing * (raw - self.value)
+        if self.reported is not None and abs(self.value - self.reported) < self.deadband:
+            return None
+        self.reported = self.value
+        return self.value
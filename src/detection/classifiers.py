@@ -0,0 +1,199 @@
+import os
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.detection.landmarks import normalize_landmarks
+from src.models import GestureCode, to_code
+from src.settings.config import Settings
+
+NO_GESTURE_LABEL = "none"
+
+
+class MLPClassifier:
+    """
+    Small multilayer perceptron over normalized landmark features.
+    With an empty hidden layer the model degenerates to a linear softmax classifier.
+    Weights are plain NumPy arrays stored in a single `.npz` file.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        weights: List[np.ndarray],
+        biases: List[np.ndarray],
+        mean: np.ndarray,
+        std: np.ndarray,
+        threshold: float = 0.6,
+    ):
+        self.labels = list(labels)
+        self.weights = [np.asarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.std = np.asarray(std, dtype=np.float32)
+        self.threshold = threshold
+        self._gestures = [None if label == NO_GESTURE_LABEL else label for label in self.labels]
+        self._codes = [to_code(label) for label in self.labels]
+
+    @classmethod
+    def load(cls, path: str, threshold: float = 0.6) -> "MLPClassifier":
+        with np.load(path, allow_pickle=False) as data:
+            num_layers = int(data["num_layers"])
+            return cls(
+                labels=[str(label) for label in data["labels"]],
+                weights=[data[f"w{i}"] for i in range(num_layers)],
+                biases=[data[f"b{i}"] for i in range(num_layers)],
+                mean=data["mean"],
+                std=data["std"],
+                threshold=threshold,
+            )
+
+    def save(self, path: str) -> None:
+        arrays = {f"w{i}": w for i, w in enumerate(self.weights)}
+        arrays.update({f"b{i}": b for i, b in enumerate(self.biases)})
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez(
+            path,
+            num_layers=len(self.weights),
+            labels=np.array(self.labels),
+            mean=self.mean,
+            std=self.std,
+            **arrays,
+        )
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        Runs the network on a batch of feature vectors.
+        :param features: Feature matrix of shape (N, 63).
+        :return: Class probabilities of shape (N, num_labels).
+        """
+
+        x = (features - self.mean) / self.std
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            x = x @ w + b
+            if i < last:
+                np.maximum(x, 0, out=x)
+        x -= x.max(axis=1, keepdims=True)
+        np.exp(x, out=x)
+        x /= x.sum(axis=1, keepdims=True)
+        return x
+
+    def classify_batch(self, landmarks: np.ndarray) -> List[Optional[str]]:
+        """
+        Classifies a batch of hands in one pass.
+        :param landmarks: Array of shape (N, 21, 3).
+        :return: Gesture name for each hand, or None when the prediction is not confident.
+        """
+
+        return self.classify_scored(landmarks)[0]
+
+    def classify_scored(self, landmarks: np.ndarray) -> Tuple[List[Optional[str]], np.ndarray]:
+        """
+        Classifies a batch of hands and reports how confident each prediction is.
+        :param landmarks: Array of shape (N, 21, 3).
+        :return: Gesture name or None for each hand, and the probability of the best class, shape (N,).
+        """
+
+        best, scores = self._best_classes(landmarks)
+        confident = scores >= self.threshold
+        return [self._gestures[i] if ok else None for i, ok in zip(best, confident)], scores
+
+    def classify_codes(self, landmarks: np.ndarray) -> Tuple[List[GestureCode], np.ndarray]:
+        """
+        Same as `classify_scored`, but returns gesture codes for the recognition pipeline.
+        :param landmarks: Array of shape (N, 21, 3).
+        :return: Gesture code (GestureCode.NONE when not confident) and best class probability for each hand.
+        """
+
+        best, scores = self._best_classes(landmarks)
+        confident = scores >= self.threshold
+        return [self._codes[i] if ok else GestureCode.NONE for i, ok in zip(best, confident)], scores
+
+    def _best_classes(self, landmarks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if len(landmarks) == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        proba = self.predict_proba(normalize_landmarks(landmarks))
+        best = proba.argmax(axis=1)
+        return best, proba[np.arange(len(best)), best]
+
+
+def train_mlp(
+    landmarks: np.ndarray,
+    labels: Sequence[str],
+    hidden_size: int = 32,
+    epochs: int = 300,
+    learning_rate: float = 0.01,
+    weight_decay: float = 1e-4,
+    seed: int = 0,
+) -> MLPClassifier:
+    """
+    Trains an MLPClassifier with full-batch Adam on cross-entropy loss.
+    :param landmarks: Array of shape (N, 21, 3).
+    :param labels: Gesture name of every sample; "none" marks negative samples.
+    :param hidden_size: Size of the hidden layer, 0 for a linear model.
+    :param epochs: Number of optimization steps.
+    :param learning_rate: Adam step size.
+    :param weight_decay: L2 penalty on weights.
+    :param seed: Seed for weight initialization.
+    :return: Trained classifier.
+    """
+
+    rng = np.random.default_rng(seed)
+    features = normalize_landmarks(landmarks)
+    classes, targets = np.unique(np.asarray(labels), return_inverse=True)
+    mean = features.mean(axis=0)
+    std = features.std(axis=0) + 1e-6
+    x = (features - mean) / std
+    onehot = np.eye(len(classes), dtype=np.float32)[targets]
+
+    sizes = [x.shape[1]] + ([hidden_size] if hidden_size else []) + [len(classes)]
+    weights = [rng.normal(0, np.sqrt(2.0 / n_in), (n_in, n_out)).astype(np.float32) for n_in, n_out in zip(sizes, sizes[1:])]
+    biases = [np.zeros(n_out, dtype=np.float32) for n_out in sizes[1:]]
+    params = weights + biases
+    moments = [np.zeros_like(p) for p in params]
+    velocities = [np.zeros_like(p) for p in params]
+    beta1, beta2 = 0.9, 0.999
+
+    for step in range(1, epochs + 1):
+        activations = [x]
+        for i, (w, b) in enumerate(zip(weights, biases)):
+            z = activations[-1] @ w + b
+            activations.append(np.maximum(z, 0) if i < len(weights) - 1 else z)
+
+        logits = activations[-1] - activations[-1].max(axis=1, keepdims=True)
+        proba = np.exp(logits)
+        proba /= proba.sum(axis=1, keepdims=True)
+
+        grad = (proba - onehot) / len(x)
+        grad_w, grad_b = [None] * len(weights), [None] * len(biases)
+        for i in reversed(range(len(weights))):
+            grad_w[i] = activations[i].T @ grad + weight_decay * weights[i]
+            grad_b[i] = grad.sum(axis=0)
+            if i:
+                grad = (grad @ weights[i].T) * (activations[i] > 0)
+
+        for j, (p, g) in enumerate(zip(params, grad_w + grad_b)):
+            moments[j] = beta1 * moments[j] + (1 - beta1) * g
+            velocities[j] = beta2 * velocities[j] + (1 - beta2) * g * g
+            m_hat = moments[j] / (1 - beta1 ** step)
+            v_hat = velocities[j] / (1 - beta2 ** step)
+            p -= learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+    return MLPClassifier([str(c) for c in classes], weights, biases, mean, std)
+
+
+def build_classifier(settings: Settings) -> Optional[MLPClassifier]:
+    """
+    Creates the landmark classifier selected in Settings.
+    :param settings: Application settings.
+    :return: A batch classifier, or None for the built-in rule-based classifier.
+    """
+
+    if settings.classifier == "rules":
+        return None
+    if settings.classifier == "mlp":
+        return MLPClassifier.load(settings.classifier_weights, threshold=settings.classifier_threshold)
+    raise ValueError(f"Unknown classifier: {settings.classifier}")
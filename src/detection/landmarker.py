@@ -0,0 +1,204 @@
+"""
+Hand landmark inference backends behind one `process(rgb) -> results` interface.
+
+"solutions" is the legacy `mp.solutions.hands.Hands`, which blocks until each frame is done.
+"tasks" is the MediaPipe Tasks `HandLandmarker` loaded from a local `.task` model file:
+in LIVE_STREAM mode frames are submitted with `detect_async` and `process` returns the
+newest finished result, so capture and inference overlap; VIDEO mode runs synchronously
+frame by frame, for offline tools that must not skip frames. Both return results shaped
+like the legacy ones (`multi_hand_landmarks` / `multi_handedness`), so the rest of the
+pipeline does not care which backend produced them. Tasks results also carry the
+`timestamp_ms` of the frame they were computed from, which tells a result returned again
+for a later frame from a new one.
+"""
+import os
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.settings.config import Settings
+
+LIVE_STREAM = "live_stream"
+VIDEO = "video"
+
+# A LIVE_STREAM frame without a result after this long is considered lost
+STALE_FRAME_MS = 1000
+
+EMPTY_RESULTS = SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+
+def results_from_task(result, timestamp_ms: Optional[int] = None) -> SimpleNamespace:
+    """
+    Converts a `HandLandmarkerResult` into the structure of legacy Hands results.
+    Landmark objects are reused as they are; they already have x, y and z.
+    :param result: Result of `HandLandmarker.detect_for_video` or of the LIVE_STREAM callback.
+    :param timestamp_ms: Timestamp of the frame the result belongs to, kept as `timestamp_ms`.
+    :return: Results with `multi_hand_landmarks` and `multi_handedness`, None when no hand was found.
+    """
+
+    if result is None or not result.hand_landmarks:
+        if timestamp_ms is None:
+            return EMPTY_RESULTS
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None, timestamp_ms=timestamp_ms)
+    landmarks = [SimpleNamespace(landmark=hand) for hand in result.hand_landmarks]
+    handedness = [
+        SimpleNamespace(
+            classification=[SimpleNamespace(index=category.index, label=category.category_name, score=category.score)]
+        )
+        for category in (categories[0] for categories in result.handedness)
+    ]
+    results = SimpleNamespace(multi_hand_landmarks=landmarks, multi_handedness=handedness)
+    if timestamp_ms is not None:
+        results.timestamp_ms = timestamp_ms
+    return results
+
+
+class TasksHands:
+    """
+    MediaPipe Tasks `HandLandmarker` with the `process` / `close` interface of legacy Hands.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        mode: str = LIVE_STREAM,
+        max_num_hands: int = 2,
+        min_detection_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        landmarker=None,
+    ):
+        """
+        :param model_path: Local `hand_landmarker.task` file.
+        :param mode: LIVE_STREAM (asynchronous, returns the newest finished result) or VIDEO (synchronous).
+        :param max_num_hands: Maximum number of hands to detect.
+        :param min_detection_confidence: Minimum palm detection and hand presence confidence.
+        :param min_tracking_confidence: Minimum confidence to keep tracking a hand between frames.
+        :param clock: Source of frame timestamps in seconds; they are made strictly increasing.
+        :param landmarker: Ready-made landmarker (for tests); created from the model file when None.
+        """
+
+        if mode not in (LIVE_STREAM, VIDEO):
+            raise ValueError(f"Unknown landmarker mode: {mode!r}")
+        self.mode = mode
+        self.clock = clock
+        self._last_timestamp = -1
+        self._lock = threading.Lock()
+        # Nothing has been detected before the first frame
+        self._latest = results_from_task(None, -1)
+        self._submitted_at = 0
+        # Frames submitted in LIVE_STREAM mode whose result has not arrived yet
+        self.in_flight = 0
+        self.submitted = 0
+        self.dropped = 0
+        self.completed = 0
+        self.landmarker = landmarker or self._create(
+            model_path, max_num_hands, min_detection_confidence, min_tracking_confidence
+        )
+
+    def _create(self, model_path: str, max_num_hands: int, min_detection: float, min_tracking: float):
+        if not os.path.isfile(model_path):
+            raise FileNotFoundError(
+                f"Hand landmarker model not found: {model_path}. "
+                "Download hand_landmarker.task and set Settings.hand_landmarker_model."
+            )
+        import mediapipe as mp
+        from mediapipe.tasks.python import vision
+
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM if self.mode == LIVE_STREAM else vision.RunningMode.VIDEO,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection,
+            min_hand_presence_confidence=min_detection,
+            min_tracking_confidence=min_tracking,
+            result_callback=self._on_result if self.mode == LIVE_STREAM else None,
+        )
+        return vision.HandLandmarker.create_from_options(options)
+
+    def process(self, image: np.ndarray):
+        """
+        :param image: RGB image.
+        :return: In VIDEO mode the result for this image; in LIVE_STREAM mode the newest
+            finished result, which may belong to an earlier frame and may have been returned
+            before; its `timestamp_ms` tells which frame it belongs to.
+        """
+
+        import mediapipe as mp
+
+        timestamp = self._timestamp_ms()
+        if self.mode == VIDEO:
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(image))
+            result = self.landmarker.detect_for_video(mp_image, timestamp)
+            self.completed += 1
+            return results_from_task(result, timestamp)
+
+        with self._lock:
+            # One frame in flight at a time: newer frames are not queued behind a slow one
+            busy = self.in_flight > 0 and timestamp - self._submitted_at < STALE_FRAME_MS
+            if not busy:
+                self.in_flight = 1
+                self._submitted_at = timestamp
+            latest = self._latest
+        if busy:
+            self.dropped += 1
+            return latest
+
+        self.submitted += 1
+        try:
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(image))
+            self.landmarker.detect_async(mp_image, timestamp)
+        except Exception:
+            with self._lock:
+                self.in_flight = 0
+            raise
+        return latest
+
+    def latest(self):
+        """Newest finished LIVE_STREAM result."""
+        with self._lock:
+            return self._latest
+
+    def _on_result(self, result, image, timestamp_ms: int) -> None:
+        converted = results_from_task(result, timestamp_ms)
+        with self._lock:
+            self._latest = converted
+            self.in_flight = 0
+            self.completed += 1
+
+    def _timestamp_ms(self) -> int:
+        # MediaPipe rejects timestamps that do not increase
+        timestamp = max(int(self.clock() * 1000), self._last_timestamp + 1)
+        self._last_timestamp = timestamp
+        return timestamp
+
+    def close(self) -> None:
+        self.landmarker.close()
+
+
+def create_hands(settings: Settings, max_num_hands: int = 2, mode: Optional[str] = None, model_complexity: int = 1):
+    """
+    Creates the inference backend chosen in Settings.
+    :param settings: Application settings (`inference_backend`, `hand_landmarker_model`, `landmarker_mode`).
+    :param max_num_hands: Maximum number of hands to detect.
+    :param mode: Overrides `Settings.landmarker_mode` for the "tasks" backend, e.g. VIDEO for offline tools.
+    :param model_complexity: Landmark model of the "solutions" backend: 1 full, 0 lite.
+        The "tasks" backend has a single model and ignores it.
+    :return: Object with `process(rgb)` and `close()`.
+    """
+
+    if settings.inference_backend == "tasks":
+        return TasksHands(
+            settings.hand_landmarker_model,
+            mode=mode or settings.landmarker_mode,
+            max_num_hands=max_num_hands,
+        )
+    if settings.inference_backend != "solutions":
+        raise ValueError(f"Unknown inference backend: {settings.inference_backend!r}")
+
+    import mediapipe as mp
+
+    return mp.solutions.hands.Hands(max_num_hands=max_num_hands, model_complexity=model_complexity)
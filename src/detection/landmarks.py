@@ -0,0 +1,64 @@
+from typing import Iterable
+
+import numpy as np
+
+from src.settings.constants import MIN_PALM_SIZE
+
+NUM_LANDMARKS = 21
+WRIST = 0
+MIDDLE_MCP = 9
+
+
+def landmarks_to_array(hand_landmarks) -> np.ndarray:
+    """
+    Converts MediaPipe hand landmarks into a compact array.
+    :param hand_landmarks: A single entry of `results.multi_hand_landmarks`.
+    :return: Array of shape (21, 3) with normalized x, y, z coordinates.
+    """
+
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+def stack_landmarks(hand_landmarks_list: Iterable) -> np.ndarray:
+    """
+    Converts several hands into one batch.
+    :param hand_landmarks_list: `results.multi_hand_landmarks` from MediaPipe.
+    :return: Array of shape (N, 21, 3).
+    """
+
+    hands = [landmarks_to_array(hand) for hand in hand_landmarks_list]
+    if not hands:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return np.stack(hands)
+
+
+def normalize_landmarks(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Builds position and scale invariant features from a batch of hands.
+    Coordinates are taken relative to the wrist and divided by the wrist to
+    middle finger base distance, so the features do not depend on where the
+    hand is in the frame or how far it is from the camera.
+    :param landmarks: Array of shape (N, 21, 3).
+    :return: Feature matrix of shape (N, 63).
+    """
+
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    centered = landmarks - landmarks[:, WRIST:WRIST + 1, :]
+    scale = np.linalg.norm(centered[:, MIDDLE_MCP, :2], axis=1)
+    scale = np.maximum(scale, 1e-6)
+    return (centered / scale[:, None, None]).reshape(len(landmarks), -1)
+
+
+def landmark_quality(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Estimates how reliable the landmarks of each hand are, without any model.
+    A hand partly outside the frame or too small to resolve the fingers gets a low score.
+    :param landmarks: Array of shape (N, 21, 3).
+    :return: Scores in [0, 1] of shape (N,): the fraction of landmarks inside the frame
+        multiplied by the palm size relative to `MIN_PALM_SIZE` (capped at 1).
+    """
+
+    xy = np.asarray(landmarks, dtype=np.float32)[:, :, :2]
+    in_frame = np.all((xy >= 0) & (xy <= 1), axis=2).mean(axis=1)
+    palm = np.linalg.norm(xy[:, MIDDLE_MCP] - xy[:, WRIST], axis=1)
+    return in_frame * np.minimum(palm / MIN_PALM_SIZE, 1.0)
@@ -0,0 +1,174 @@
+import math
+from typing import Optional
+
+import numpy as np
+
+from src.models import GestureCode
+from src.settings.constants import (
+    CIRCLE_MAX_CLOSURE,
+    CIRCLE_MIN_PATH,
+    CIRCLE_MIN_TURN,
+    FINGER_TIPS,
+    MOTION_HISTORY_SIZE,
+    MOTION_MAX_GAP,
+    MOTION_MAX_STEP,
+    MOTION_MIN_STEP,
+    SWIPE_MAX_DURATION,
+    SWIPE_MAX_SPEED,
+    SWIPE_MIN_DISTANCE,
+    SWIPE_MIN_DURATION,
+    SWIPE_MIN_SAMPLES,
+    SWIPE_MIN_SPEED,
+    SWIPE_MIN_STRAIGHTNESS,
+    SWIPE_WINDOW,
+)
+
+# Wrist followed by the five fingertips
+MOTION_POINTS = [0] + FINGER_TIPS
+
+
+class LandmarkHistory:
+    """
+    Fixed-size ring buffer of recent wrist and fingertip positions of one hand.
+    Besides the positions, every slot stores the cumulative path length and the
+    cumulative turning angle of the hand anchor up to that sample, so path length,
+    displacement and turning over any window are two lookups instead of a scan.
+    A sample that jumps farther than `MOTION_MAX_STEP` or arrives more than `MOTION_MAX_GAP`
+    after the previous one cannot be the same continuous motion and restarts the history.
+    """
+
+    def __init__(self, capacity: int = MOTION_HISTORY_SIZE):
+        self.capacity = capacity
+        self.points = np.zeros((capacity, len(MOTION_POINTS), 2), dtype=np.float32)
+        self.anchors = np.zeros((capacity, 2), dtype=np.float64)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.cum_path = np.zeros(capacity, dtype=np.float64)
+        self.cum_turn = np.zeros(capacity, dtype=np.float64)
+        self.velocity = np.zeros(2, dtype=np.float64)
+        self.head = 0
+        self.size = 0
+        self._last_step: Optional[np.ndarray] = None
+
+    def push(self, points: np.ndarray, timestamp: float) -> None:
+        """
+        Appends the positions of the current frame, overwriting the oldest slot.
+        :param points: Array of shape (6, 2) with wrist and fingertip x, y.
+        :param timestamp: Frame time in seconds.
+        """
+
+        if self.size:
+            prev = self._slot(0)
+            center = points.mean(axis=0)
+            jump = math.hypot(center[0] - self.anchors[prev, 0], center[1] - self.anchors[prev, 1])
+            if jump > MOTION_MAX_STEP or timestamp - self.timestamps[prev] > MOTION_MAX_GAP:
+                self.clear()
+
+        slot = self.head
+        self.points[slot] = points
+        anchor = self.anchors[slot]
+        anchor[:] = points.mean(axis=0)
+        self.timestamps[slot] = timestamp
+
+        if self.size:
+            prev = (slot - 1) % self.capacity
+            step = anchor - self.anchors[prev]
+            length = math.hypot(step[0], step[1])
+            turn = 0.0
+            if length >= MOTION_MIN_STEP:
+                if self._last_step is not None:
+                    last = self._last_step
+                    turn = math.atan2(last[0] * step[1] - last[1] * step[0], last[0] * step[0] + last[1] * step[1])
+                self._last_step = step
+            dt = timestamp - self.timestamps[prev]
+            if dt > 0:
+                self.velocity = step / dt
+            self.cum_path[slot] = self.cum_path[prev] + length
+            self.cum_turn[slot] = self.cum_turn[prev] + turn
+        else:
+            self.cum_path[slot] = 0.0
+            self.cum_turn[slot] = 0.0
+
+        self.head = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def clear(self) -> None:
+        self.head = 0
+        self.size = 0
+        self._last_step = None
+        self.velocity[:] = 0
+
+    def _slot(self, age: int) -> int:
+        """Slot of the sample pushed `age` frames ago (0 is the newest)."""
+        return (self.head - 1 - age) % self.capacity
+
+    def displacement(self, frames: int) -> np.ndarray:
+        return self.anchors[self._slot(0)] - self.anchors[self._slot(frames)]
+
+    def path_length(self, frames: int) -> float:
+        return float(self.cum_path[self._slot(0)] - self.cum_path[self._slot(frames)])
+
+    def turning(self, frames: int) -> float:
+        """Signed turning angle accumulated over the last `frames` steps, in radians."""
+        return float(self.cum_turn[self._slot(0)] - self.cum_turn[self._slot(frames - 1)])
+
+    def duration(self, frames: int) -> float:
+        return float(self.timestamps[self._slot(0)] - self.timestamps[self._slot(frames)])
+
+
+class MotionDetector:
+    def __init__(self, capacity: int = MOTION_HISTORY_SIZE):
+        self.history = LandmarkHistory(capacity)
+
+    def reset(self) -> None:
+        """Forgets the history, e.g. when the hand it follows is no longer the same physical hand."""
+        self.history.clear()
+
+    def update(self, points: np.ndarray, timestamp: float) -> Optional[GestureCode]:
+        """
+        Adds a frame to the hand history and checks for a completed motion gesture.
+        Directions are in image coordinates: x grows to the right and y grows downwards.
+        :param points: Array of shape (6, 2) with wrist and fingertip x, y.
+        :param timestamp: Frame time in seconds.
+        :return: Code of the motion gesture or None.
+        """
+
+        history = self.history
+        history.push(points, timestamp)
+
+        gesture = self._detect_circle() or self._detect_swipe()
+        if gesture:
+            history.clear()
+        return gesture
+
+    def _detect_swipe(self) -> Optional[GestureCode]:
+        frames = min(SWIPE_WINDOW, self.history.size - 1)
+        if frames < SWIPE_MIN_SAMPLES - 1:
+            return None
+
+        dx, dy = self.history.displacement(frames)
+        distance = math.hypot(dx, dy)
+        if distance < SWIPE_MIN_DISTANCE or distance < SWIPE_MIN_STRAIGHTNESS * self.history.path_length(frames):
+            return None
+        duration = self.history.duration(frames)
+        if not SWIPE_MIN_DURATION <= duration <= SWIPE_MAX_DURATION:
+            return None
+        if not SWIPE_MIN_SPEED <= distance / duration <= SWIPE_MAX_SPEED:
+            return None
+
+        if abs(dx) >= abs(dy):
+            return GestureCode.SWIPE_RIGHT if dx > 0 else GestureCode.SWIPE_LEFT
+        return GestureCode.SWIPE_DOWN if dy > 0 else GestureCode.SWIPE_UP
+
+    def _detect_circle(self) -> Optional[GestureCode]:
+        frames = self.history.size - 1
+        if frames < 3:
+            return None
+
+        path = self.history.path_length(frames)
+        if path < CIRCLE_MIN_PATH or abs(self.history.turning(frames)) < CIRCLE_MIN_TURN:
+            return None
+
+        dx, dy = self.history.displacement(frames)
+        if math.hypot(dx, dy) > CIRCLE_MAX_CLOSURE * path:
+            return None
+        return GestureCode.CIRCLE
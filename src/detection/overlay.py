@@ -0,0 +1,94 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Same topology as mp.solutions.hands.HAND_CONNECTIONS
+HAND_CONNECTIONS = np.array(
+    [
+        (0, 1), (1, 2), (2, 3), (3, 4),
+        (0, 5), (5, 6), (6, 7), (7, 8),
+        (5, 9), (9, 10), (10, 11), (11, 12),
+        (9, 13), (13, 14), (14, 15), (15, 16),
+        (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+    ],
+    dtype=np.intp,
+)
+
+
+class LandmarkOverlay:
+    """
+    Draws the skeleton of all detected hands in two batched OpenCV calls:
+    one for every connection of every hand and one for every joint.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        joint_color: Tuple[int, int, int] = (0, 255, 0),
+        connection_color: Tuple[int, int, int] = (255, 0, 0),
+        thickness: int = 2,
+        joint_radius: int = 2,
+    ):
+        self.enabled = enabled
+        self.joint_color = joint_color
+        self.connection_color = connection_color
+        self.thickness = thickness
+        # A zero-length thick segment is rendered as a filled disc
+        self.joint_thickness = 2 * joint_radius + 1
+
+    def draw(self, frame: np.ndarray, landmarks: np.ndarray) -> np.ndarray:
+        """
+        Draws hands on the frame in place.
+        :param frame: BGR image.
+        :param landmarks: Array of shape (N, 21, 2+) with normalized coordinates.
+        :return: The same frame.
+        """
+
+        if not self.enabled or len(landmarks) == 0:
+            return frame
+
+        height, width = frame.shape[:2]
+        points = np.rint(landmarks[..., :2] * (width, height)).astype(np.int32)
+
+        segments = points[:, HAND_CONNECTIONS].reshape(-1, 2, 2)
+        cv2.polylines(frame, list(segments), False, self.connection_color, self.thickness, cv2.LINE_8)
+
+        joints = np.repeat(points.reshape(-1, 1, 2), 2, axis=1)
+        cv2.polylines(frame, list(joints), False, self.joint_color, self.joint_thickness, cv2.LINE_8)
+        return frame
+
+    def render(
+        self,
+        frame: np.ndarray,
+        landmarks: np.ndarray,
+        size: Optional[Tuple[int, int]] = None,
+        interpolation: int = cv2.INTER_AREA,
+    ) -> np.ndarray:
+        """
+        Optionally downscales the frame to the preview size before drawing, so the
+        overlay cost depends on the preview resolution instead of the capture one.
+        :param frame: BGR image at capture resolution.
+        :param landmarks: Array of shape (N, 21, 2+) with normalized coordinates.
+        :param size: Target (width, height), or None to draw at capture resolution.
+        :param interpolation: OpenCV interpolation used for downscaling.
+        :return: Frame with the overlay; a new array when resized.
+        """
+
+        if size and size != (frame.shape[1], frame.shape[0]):
+            frame = cv2.resize(frame, size, interpolation=interpolation)
+        return self.draw(frame, landmarks)
+
+
+def fit_size(frame_size: Tuple[int, int], bounds: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Largest size with the frame aspect ratio that fits into bounds.
+    :param frame_size: (width, height) of the frame.
+    :param bounds: (width, height) of the target area; 0 or less leaves that dimension unbounded.
+    :return: (width, height), never smaller than 1x1.
+    """
+
+    width, height = max(1, frame_size[0]), max(1, frame_size[1])
+    scales = [bound / size for bound, size in zip(bounds, (width, height)) if bound > 0]
+    scale = min(scales) if scales else 1.0
+    return max(1, int(width * scale)), max(1, int(height * scale))
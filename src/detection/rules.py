@@ -0,0 +1,103 @@
+"""
+Vectorized versions of the hand-tuned gesture rules and of the rules that combine
+the gestures of several hands into one.
+
+`classify_rules` implements the extended-finger rules of `HandsProcessor`;
+`classify_pip_rules` is an alternative set of fingertip-versus-middle-joint rules,
+kept for comparison in the classifier benchmark.
+"""
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from src.models import PAIR_CODES, GestureCode
+from src.detection.landmarks import WRIST
+from src.settings.constants import FINGER_BASES, FINGER_TIPS, INDEX_TIP, THUMB_BASE, THUMB_TIP
+
+# Middle (PIP) joints of the index, middle, ring and pinky fingers, and the thumb's IP joint
+_PIP_JOINTS = [6, 10, 14, 18]
+_THUMB_IP = 3
+
+_RULE_CODES = np.array([GestureCode.LIKE, GestureCode.DISLIKE, GestureCode.STOP, GestureCode.OKAY], dtype=np.uint8)
+
+
+def classify_rules(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Classifies all hands of a frame in one pass with the extended-finger rules.
+    :param landmarks: Array of shape (N, 21, 3).
+    :return: GestureCode values of shape (N,), GestureCode.NONE where no rule matches.
+    """
+
+    landmarks = np.asarray(landmarks)
+    tips = landmarks[:, FINGER_TIPS]
+    bases = landmarks[:, FINGER_BASES]
+
+    # Fingers other than the thumb: tip clearly above and closer to the camera than the base
+    fingers = (tips[:, 1:, 1] < bases[:, 1:, 1] - 0.02) & (tips[:, 1:, 2] < bases[:, 1:, 2])
+    thumb_tip, thumb_base = landmarks[:, THUMB_TIP], landmarks[:, THUMB_BASE]
+    thumb = (thumb_tip[:, 1] < thumb_base[:, 1] - 0.05) & (thumb_tip[:, 2] < thumb_base[:, 2])
+    is_fist = np.all(np.abs(tips[:, :, 0] - bases[:, :, 0]) < 0.05, axis=1)
+    any_finger = fingers.any(axis=1)
+    pinch = np.all(np.abs(landmarks[:, INDEX_TIP, :2] - thumb_tip[:, :2]) < 0.05, axis=1)
+
+    # The first matching rule wins, in the same order as the per-hand rules
+    rules = [
+        ~is_fist & thumb & ~any_finger,
+        ~is_fist & ~thumb & ~any_finger,
+        thumb & fingers.all(axis=1),
+        pinch,
+    ]
+    return np.select(rules, _RULE_CODES, default=GestureCode.NONE).astype(np.uint8)
+
+
+def classify_pip_rules(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Classifies all hands of a frame in one pass by comparing fingertips with the middle joints.
+    :param landmarks: Array of shape (N, 21, 3).
+    :return: GestureCode values of shape (N,), GestureCode.NONE where no rule matches.
+    """
+
+    landmarks = np.asarray(landmarks)
+    tips_y = landmarks[:, FINGER_TIPS[1:], 1]
+    joints_y = landmarks[:, _PIP_JOINTS, 1]
+    thumb_tip, thumb_ip, wrist = landmarks[:, THUMB_TIP], landmarks[:, _THUMB_IP], landmarks[:, WRIST]
+
+    folded = np.all(tips_y > joints_y, axis=1)
+    raised = tips_y < joints_y
+    pinch = np.linalg.norm(thumb_tip[:, :2] - landmarks[:, INDEX_TIP, :2], axis=1) < 0.05
+
+    rules = [
+        (thumb_tip[:, 1] < thumb_ip[:, 1]) & (thumb_ip[:, 1] < wrist[:, 1]) & folded,
+        (thumb_tip[:, 1] > thumb_ip[:, 1]) & (thumb_ip[:, 1] > wrist[:, 1]) & folded,
+        (thumb_tip[:, 0] > thumb_ip[:, 0]) & raised.all(axis=1),
+        pinch & raised[:, 1:].all(axis=1),
+    ]
+    return np.select(rules, _RULE_CODES, default=GestureCode.NONE).astype(np.uint8)
+
+
+def combine_codes(codes: Sequence[int]) -> Tuple[GestureCode, np.ndarray]:
+    """
+    Combines the gestures of any number of hands into one gesture:
+    - a gesture shown by two or more hands that has a two-hand combination in PAIR_CODES
+      gives that combination (the one shown by the most hands wins);
+    - otherwise a gesture shown by exactly one hand while the others show nothing is
+      that hand's gesture;
+    - anything else is ambiguous and gives GestureCode.NONE.
+    :param codes: Gesture code of each hand, 0 for no gesture.
+    :return: The combined gesture and the indices of the hands showing it.
+    """
+
+    codes = np.asarray(codes, dtype=np.intp)
+    shown = codes[codes > 0]
+    if len(shown) == 0:
+        return GestureCode.NONE, np.empty(0, dtype=np.intp)
+
+    counts = np.bincount(shown, minlength=len(GestureCode))
+    pairable = np.array([PAIR_CODES[code][code] for code in range(len(GestureCode))]) > 0
+    candidates = np.where(pairable & (counts >= 2), counts, 0)
+    if candidates.any():
+        gesture = int(candidates.argmax())
+        return PAIR_CODES[gesture][gesture], np.flatnonzero(codes == gesture)
+    if len(shown) == 1:
+        return GestureCode(int(shown[0])), np.flatnonzero(codes > 0)
+    return GestureCode.NONE, np.empty(0, dtype=np.intp)
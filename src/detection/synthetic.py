@@ -0,0 +1,118 @@
+"""
+Parametric generator of labeled hand landmarks for load-testing and training the classifiers.
+Every static pose is a canonical (21, 3) template in MediaPipe's normalized image coordinates
+(y grows downwards, negative z is closer to the camera) that both rule-based classifiers
+recognize; samples are produced by randomly rotating, scaling, moving, jittering and
+occluding the templates in one vectorized pass.
+"""
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.detection.classifiers import NO_GESTURE_LABEL
+from src.detection.landmarks import NUM_LANDMARKS, WRIST
+from src.models import GestureSet
+
+# Displacement of landmarks hidden behind other fingers, like MediaPipe guessing their position
+OCCLUSION_SIGMA = 0.05
+
+_WRIST = (0.5, 0.8, 0.0)
+_FINGER_X = (0.55, 0.5, 0.45, 0.4)  # index, middle, ring, pinky
+_EXTENDED = ((0.6, 0.0), (0.5, -0.02), (0.42, -0.03), (0.35, -0.04))
+_FOLDED = ((0.6, 0.0), (0.52, -0.03), (0.58, -0.05), (0.64, -0.03))
+
+_THUMBS = {
+    "up": ((0.58, 0.75, 0.0), (0.63, 0.7, 0.0), (0.68, 0.6, -0.02), (0.74, 0.5, -0.04)),
+    "down": ((0.58, 0.75, 0.0), (0.63, 0.7, 0.0), (0.7, 0.85, -0.02), (0.76, 0.95, -0.03)),
+    "out": ((0.58, 0.75, 0.0), (0.63, 0.7, 0.0), (0.68, 0.62, -0.02), (0.72, 0.56, -0.04)),
+    "pinch": ((0.58, 0.75, 0.0), (0.63, 0.7, 0.0), (0.62, 0.62, -0.02), (0.58, 0.56, 0.01)),
+    "across": ((0.58, 0.75, 0.0), (0.63, 0.7, 0.0), (0.6, 0.66, -0.02), (0.56, 0.64, -0.03)),
+}
+_PINCH_INDEX = ((0.6, 0.0), (0.5, -0.03), (0.52, -0.05), (0.555, -0.05))
+
+
+def _pose(thumb: str, fingers: Sequence, index_x: Sequence[float] = None) -> np.ndarray:
+    hand = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    hand[WRIST] = _WRIST
+    hand[1:5] = _THUMBS[thumb]
+    for finger, (x, joints) in enumerate(zip(_FINGER_X, fingers)):
+        for joint, (y, z) in enumerate(joints):
+            hand[5 + finger * 4 + joint] = (x if index_x is None or finger else index_x[joint], y, z)
+    return hand
+
+
+POSES: Dict[str, np.ndarray] = {
+    GestureSet.LIKE.value: _pose("up", [_FOLDED] * 4),
+    GestureSet.DISLIKE.value: _pose("down", [_FOLDED] * 4),
+    GestureSet.STOP.value: _pose("out", [_EXTENDED] * 4),
+    GestureSet.OKAY.value: _pose("pinch", [_PINCH_INDEX] + [_EXTENDED] * 3, index_x=(0.55, 0.55, 0.56, 0.575)),
+    # Pointing index finger: a hand that must not trigger anything
+    NO_GESTURE_LABEL: _pose("across", [_EXTENDED] + [_FOLDED] * 3),
+}
+
+
+def generate_poses(
+    label: str,
+    count: int,
+    rotation: float = 15.0,
+    scale: Tuple[float, float] = (0.8, 1.2),
+    translation: float = 0.1,
+    noise: float = 0.003,
+    occlusion: float = 0.0,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Generates randomized samples of one pose.
+    :param label: Key of `POSES`.
+    :param count: Number of samples.
+    :param rotation: Maximum in-plane rotation around the wrist, in degrees.
+    :param scale: Range of hand size relative to the template.
+    :param translation: Maximum shift of the whole hand, in normalized image units.
+    :param noise: Standard deviation of per-landmark Gaussian jitter.
+    :param occlusion: Probability of every landmark being occluded and displaced by `OCCLUSION_SIGMA`.
+    :param rng: Random generator, for reproducible datasets.
+    :return: Array of shape (count, 21, 3).
+    """
+
+    rng = rng or np.random.default_rng()
+    template = POSES[label]
+    wrist = template[WRIST]
+
+    angles = np.radians(rng.uniform(-rotation, rotation, count))
+    cos, sin = np.cos(angles), np.sin(angles)
+    rotations = np.stack([np.stack([cos, -sin], -1), np.stack([sin, cos], -1)], -2)  # (count, 2, 2)
+    factors = rng.uniform(scale[0], scale[1], (count, 1, 1))
+
+    relative = template - wrist
+    hands = np.empty((count, NUM_LANDMARKS, 3), dtype=np.float32)
+    hands[:, :, :2] = np.einsum("nij,kj->nki", rotations, relative[:, :2]) * factors
+    hands[:, :, 2] = relative[:, 2] * factors[:, :, 0]
+    hands += wrist
+    hands[:, :, :2] += rng.uniform(-translation, translation, (count, 1, 2))
+
+    if noise:
+        hands += rng.normal(0, noise, hands.shape)
+    if occlusion:
+        hidden = rng.random((count, NUM_LANDMARKS, 1)) < occlusion
+        hands += np.where(hidden, rng.normal(0, OCCLUSION_SIGMA, hands.shape), 0)
+    return hands
+
+
+def generate_dataset(
+    count_per_label: int, labels: Optional[Sequence[str]] = None, seed: Optional[int] = None, **variation
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generates a shuffled labeled dataset in the format written by `record_landmarks`.
+    :param count_per_label: Number of samples of every pose.
+    :param labels: Poses to include, all of `POSES` by default.
+    :param seed: Random seed.
+    :param variation: Keyword arguments of `generate_poses`.
+    :return: Landmarks of shape (N, 21, 3) and labels of shape (N,).
+    """
+
+    rng = np.random.default_rng(seed)
+    labels = list(labels or POSES)
+    landmarks = np.concatenate([generate_poses(label, count_per_label, rng=rng, **variation) for label in labels])
+    names = np.repeat(np.array(labels), count_per_label)
+    order = rng.permutation(len(names))
+    return landmarks[order], names[order]
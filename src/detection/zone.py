@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+from typing import Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from src.detection.landmarks import stack_landmarks
+
+FULL_FRAME = (0.0, 0.0, 1.0, 1.0)
+
+
+class ActiveZone:
+    """
+    Rectangle of the camera view where gestures count. Frames are cropped to it
+    before inference, so hands outside it are never seen and inference cost shrinks
+    with the zone area; landmarks found in the crop are mapped back to full-frame
+    coordinates for classification and display.
+    """
+
+    def __init__(self, rect: Sequence[float] = FULL_FRAME, color: Tuple[int, int, int] = (0, 200, 255)):
+        """
+        :param rect: (left, top, right, bottom) in normalized frame coordinates.
+        :param color: BGR color of the zone outline.
+        """
+
+        left, top, right, bottom = (min(max(float(v), 0.0), 1.0) for v in rect)
+        if right <= left or bottom <= top:
+            raise ValueError(f"Active zone {tuple(rect)} is empty")
+        self.rect = (left, top, right, bottom)
+        self.color = color
+
+    @property
+    def is_full(self) -> bool:
+        return self.rect == FULL_FRAME
+
+    def pixels(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """
+        Converts the zone to pixel bounds of a frame, at least one pixel in size.
+        :param width: Frame width.
+        :param height: Frame height.
+        :return: (x0, y0, x1, y1), end exclusive.
+        """
+
+        left, top, right, bottom = self.rect
+        x0, y0 = min(int(left * width), width - 1), min(int(top * height), height - 1)
+        x1, y1 = max(int(np.ceil(right * width)), x0 + 1), max(int(np.ceil(bottom * height)), y0 + 1)
+        return x0, y0, min(x1, width), min(y1, height)
+
+    def crop(self, frame: np.ndarray) -> np.ndarray:
+        """
+        :param frame: Full frame.
+        :return: View of the zone, without copying pixels.
+        """
+
+        if self.is_full:
+            return frame
+        x0, y0, x1, y1 = self.pixels(frame.shape[1], frame.shape[0])
+        return frame[y0:y1, x0:x1]
+
+    def to_frame(self, landmarks: np.ndarray, frame_size: Tuple[int, int]) -> np.ndarray:
+        """
+        Maps landmarks normalized to the crop into full-frame normalized coordinates.
+        Depth is scaled like x, as MediaPipe measures it on the same scale as the image width.
+        :param landmarks: Array of shape (N, 21, 3) found in the crop.
+        :param frame_size: (width, height) of the full frame.
+        :return: Array of shape (N, 21, 3) in full-frame coordinates.
+        """
+
+        width, height = frame_size
+        x0, y0, x1, y1 = self.pixels(width, height)
+        scale = np.array([(x1 - x0) / width, (y1 - y0) / height, (x1 - x0) / width], dtype=np.float32)
+        offset = np.array([x0 / width, y0 / height, 0.0], dtype=np.float32)
+        return np.asarray(landmarks, dtype=np.float32) * scale + offset
+
+    def map_results(self, results, frame_size: Tuple[int, int]):
+        """
+        Maps MediaPipe results computed on the crop back to the full frame.
+        The input is left untouched; a results-like object with the same fields is returned.
+        :param results: Output of `hands.process` on `crop(frame)`.
+        :param frame_size: (width, height) of the full frame.
+        :return: Results whose landmarks are in full-frame coordinates.
+        """
+
+        if self.is_full or not results.multi_hand_landmarks:
+            return results
+        mapped = self.to_frame(stack_landmarks(results.multi_hand_landmarks), frame_size)
+        hands = [
+            SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in hand])
+            for hand in mapped.tolist()
+        ]
+        return SimpleNamespace(multi_hand_landmarks=hands, multi_handedness=results.multi_handedness)
+
+    def draw(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Outlines the zone on a frame of any size (full or preview); nothing is drawn for the full frame.
+        :param frame: BGR image, modified in place.
+        :return: The same frame.
+        """
+
+        if not self.is_full:
+            x0, y0, x1, y1 = self.pixels(frame.shape[1], frame.shape[0])
+            cv2.rectangle(frame, (x0, y0), (x1 - 1, y1 - 1), self.color, 2)
+        return frame
@@ -0,0 +1,189 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import IO, Dict, List, Optional, Tuple
+
+from src.settings.config import Settings
+
+
+class EventLog:
+    """
+    Structured JSONL event log that is cheap to call from the frame loop.
+    `log()` only appends a record to a bounded deque; a background thread
+    serializes and writes records in batches, rotates the file by size, and
+    collapses identical events repeated within `rate_limit` seconds into one
+    record with a `suppressed` count. Rate-limit state of events that stopped
+    recurring is swept once they expire, and never holds more than `max_keys` events.
+    `log()` is called from many threads (frame loop, helper readers, camera executor,
+    clip writer), so the rate-limit state is only touched under a lock.
+    """
+
+    def __init__(
+        self,
+        path: str = "",
+        stream: Optional[IO[str]] = None,
+        max_bytes: int = 1_000_000,
+        backups: int = 3,
+        rate_limit: float = 1.0,
+        flush_interval: float = 0.5,
+        max_queue: int = 10_000,
+        max_keys: int = 1024,
+    ):
+        self.path = path
+        self.stream = stream
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.rate_limit = rate_limit
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+
+        self._records: deque = deque(maxlen=max_queue)
+        self._last_seen: Dict[Tuple, float] = {}
+        self._suppressed: Dict[Tuple, int] = {}
+        self._last_sweep = 0.0
+        self._rate_lock = threading.Lock()
+        self._file: Optional[IO[str]] = None
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def log(self, event: str, **fields) -> None:
+        """
+        Queues an event. Never blocks on I/O.
+        :param event: Event type, e.g. "gesture_recognized".
+        :param fields: JSON-serializable event attributes.
+        """
+
+        now = time.time()
+        if self.rate_limit:
+            try:
+                key = (event, *fields.values())
+                hash(key)
+            except TypeError:
+                key = None
+            if key is not None:
+                with self._rate_lock:
+                    last = self._last_seen.get(key)
+                    if last is not None and now - last < self.rate_limit:
+                        self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                        return
+                    self._last_seen[key] = now
+                    suppressed = self._suppressed.pop(key, 0)
+                    self._sweep(now)
+                if suppressed:
+                    fields["suppressed"] = suppressed
+
+        fields["event"] = event
+        fields["ts"] = now
+        self._records.append(fields)
+
+    def _sweep(self, now: float) -> None:
+        """
+        Forgets events not seen for `rate_limit` seconds, at most once per `rate_limit`.
+        Their suppressed counts are dropped, as no later record will carry them.
+        Called with `_rate_lock` held.
+        """
+
+        if now - self._last_sweep < self.rate_limit and len(self._last_seen) <= self.max_keys:
+            return
+        self._last_sweep = now
+        expired = [key for key, last in self._last_seen.items() if now - last >= self.rate_limit]
+        for key in expired:
+            del self._last_seen[key]
+            self._suppressed.pop(key, None)
+        if len(self._last_seen) > self.max_keys:
+            self._last_seen.clear()
+            self._suppressed.clear()
+
+    def _write_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all queued records; safe to call from any thread."""
+        with self._write_lock:
+            batch: List[str] = []
+            while self._records:
+                batch.append(json.dumps(self._records.popleft(), ensure_ascii=False, default=str))
+            if not batch:
+                return
+            target = self._target()
+            target.write("\n".join(batch) + "\n")
+            target.flush()
+            if self.path and self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def _target(self) -> IO[str]:
+        if not self.path:
+            return self.stream or sys.stdout
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        return self._file
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._writer.join(timeout=2)
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_event_log: Optional[EventLog] = None
+
+
+def get_event_log() -> EventLog:
+    """Returns the process-wide event log, creating it from Settings on first use."""
+    global _event_log
+    if _event_log is None:
+        settings = Settings()
+        set_event_log(
+            EventLog(
+                path=settings.event_log_path,
+                max_bytes=settings.event_log_max_bytes,
+                backups=settings.event_log_backups,
+                rate_limit=settings.event_log_rate_limit,
+            )
+        )
+    return _event_log
+
+
+def set_event_log(event_log: Optional[EventLog]) -> Optional[EventLog]:
+    """
+    Replaces the process-wide event log.
+    :param event_log: New log, or None to create one from Settings on next use.
+    :return: The previous log, which is not closed.
+    """
+
+    global _event_log
+    previous, _event_log = _event_log, event_log
+    return previous
+
+
+def log_event(event: str, **fields) -> None:
+    get_event_log().log(event, **fields)
+
+
+@atexit.register
+def _close_event_log() -> None:
+    if _event_log is not None:
+        _event_log.close()
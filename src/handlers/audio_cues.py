@@ -0,0 +1,175 @@
+"""
+Short audio cues for gesture feedback: a tick when a hand starts holding a gesture and a
+chime when a gesture fires.
+
+All cues are synthesized into PCM buffers once, when the player is created, and played by
+mixing them into a single output stream that stays open for the whole session. `play` only
+appends to a queue read by the audio callback, so the frame loop never waits on the device,
+and no device is opened and no file is decoded per event.
+"""
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.event_log import log_event
+from src.settings.config import Settings
+
+SAMPLE_RATE = 44100
+# Samples per callback: about 6 ms at 44.1 kHz
+BLOCK_SIZE = 256
+# Cues mixed at the same time; older ones are cut off beyond that
+MAX_VOICES = 4
+
+
+def tone(frequency: float, duration: float, samplerate: int = SAMPLE_RATE, decay: float = 30.0) -> np.ndarray:
+    """
+    A sine tone with a short attack and an exponential decay, so it starts and ends without clicks.
+    :param frequency: Frequency in Hz.
+    :param duration: Length in seconds.
+    :param decay: Decay rate of the envelope per second.
+    :return: Mono float32 samples in [-1, 1].
+    """
+
+    t = np.arange(int(duration * samplerate), dtype=np.float32) / samplerate
+    envelope = np.exp(-decay * t) * np.minimum(t * samplerate / 64, 1.0)
+    return (np.sin(2 * np.pi * frequency * t) * envelope).astype(np.float32)
+
+
+def default_cues(samplerate: int = SAMPLE_RATE) -> Dict[str, np.ndarray]:
+    return {
+        "candidate": tone(2000, 0.02, samplerate, decay=200.0),
+        "confirm": np.concatenate([tone(660, 0.06, samplerate, decay=20.0), tone(990, 0.12, samplerate)]),
+    }
+
+
+class NullOutputStream:
+    """
+    Output stream that goes nowhere: the callback only runs when `pull` asks for samples.
+    Used when no audio device is wanted, e.g. in tests and headless runs.
+    """
+
+    def __init__(self, samplerate: int, blocksize: int, callback: Callable):
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.callback = callback
+        self.active = False
+        self.closed = False
+
+    def start(self) -> None:
+        self.active = True
+
+    def stop(self) -> None:
+        self.active = False
+
+    def close(self) -> None:
+        self.active = False
+        self.closed = True
+
+    def pull(self, frames: Optional[int] = None) -> np.ndarray:
+        """Runs the callback once, as the audio device would, and returns what it wrote."""
+        outdata = np.zeros((frames or self.blocksize, 1), dtype=np.float32)
+        self.callback(outdata, len(outdata), None, None)
+        return outdata[:, 0]
+
+
+def _open_sounddevice(device: str, samplerate: int, blocksize: int, callback: Callable):
+    import sounddevice as sd
+
+    return sd.OutputStream(
+        device=device or None,
+        samplerate=samplerate,
+        blocksize=blocksize,
+        channels=1,
+        dtype="float32",
+        latency="low",
+        callback=callback,
+    )
+
+
+class CuePlayer:
+    def __init__(
+        self,
+        device: str = "",
+        volume: float = 0.3,
+        samplerate: int = SAMPLE_RATE,
+        blocksize: int = BLOCK_SIZE,
+        cues: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        :param device: Output device name or index; "" is the default output, "null" a `NullOutputStream`.
+        :param volume: Gain applied to every cue when it is prepared.
+        :param samplerate: Sample rate of the stream and the cue buffers.
+        :param blocksize: Samples the device asks for per callback.
+        :param cues: Cue name -> mono float32 samples; `default_cues` when None.
+        """
+
+        self.device = device
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.buffers = {
+            name: np.ascontiguousarray(samples * volume, dtype=np.float32)
+            for name, samples in (cues or default_cues(samplerate)).items()
+        }
+        self.stream = None
+        self.played = 0
+        # Written by `play` in the frame loop, drained by the audio callback; deque appends and pops are atomic
+        self._queue: deque = deque()
+        # [samples, position] of every cue being played; only the callback touches it
+        self._voices: List[list] = []
+
+    def start(self) -> "CuePlayer":
+        """Opens the output stream. Without a usable device the player stays silent instead of failing."""
+        if self.stream is not None:
+            return self
+        try:
+            if self.device == "null":
+                self.stream = NullOutputStream(self.samplerate, self.blocksize, self._callback)
+            else:
+                self.stream = _open_sounddevice(self.device, self.samplerate, self.blocksize, self._callback)
+            self.stream.start()
+        # sounddevice raises OSError when PortAudio is missing and its own PortAudioError for device errors
+        except Exception as e:
+            log_event("audio_unavailable", device=self.device, error=str(e))
+            self.stream = None
+        return self
+
+    def play(self, name: str) -> None:
+        """Queues a cue; returns immediately. Does nothing while no stream is open."""
+        if self.stream is not None:
+            self._queue.append(self.buffers[name])
+            self.played += 1
+
+    def _callback(self, outdata, frames, time_info, status) -> None:
+        # A view of the device buffer: the cues are mixed in place, so no sample buffer is
+        # allocated per block, and finished voices are removed from the list in place
+        out = outdata[:, 0]
+        out.fill(0)
+        while self._queue:
+            self._voices.append([self._queue.popleft(), 0])
+        del self._voices[:-MAX_VOICES]
+        for voice in self._voices:
+            samples, position = voice
+            chunk = samples[position:position + frames]
+            out[:len(chunk)] += chunk
+            voice[1] = position + len(chunk)
+        for i in range(len(self._voices) - 1, -1, -1):
+            if self._voices[i][1] >= len(self._voices[i][0]):
+                del self._voices[i]
+        np.clip(out, -1.0, 1.0, out=out)
+
+    def close(self) -> None:
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+
+def create_cue_player(settings: Settings) -> Optional[CuePlayer]:
+    """
+    :return: A started player when `Settings.audio_cues` is on, otherwise None.
+    """
+
+    if not settings.audio_cues:
+        return None
+    return CuePlayer(settings.audio_device, settings.audio_volume).start()
@@ -1,34 +1,100 @@
+import time
+from typing import Callable, Optional
+
 import cv2
-import mediapipe as mp
 
 from src.handlers import HandsProcessor
+from src.handlers.audio_cues import create_cue_player
+from src.handlers.capture import configure_capture, open_capture
+from src.handlers.clip_recorder import ClipRecorder
+from src.handlers.governor import create_governor
+from src.handlers.memory_profiler import MemoryProfiler
+from src.handlers.pipeline import Cues, Display, Pipeline, RecordClips, Render, capture_frames, recognition_stages
+from src.detection.landmarker import create_hands
+from src.detection.overlay import LandmarkOverlay
+from src.detection.zone import ActiveZone
 from src.settings.config import Settings
-
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
+from src.event_log import log_event
 
 
-def process_video():
-    cap = cv2.VideoCapture(Settings().camera_index)
-    hands = mp_hands.Hands()
-    processor = HandsProcessor()
+def process_video(
+    settings: Optional[Settings] = None,
+    capture=None,
+    hands=None,
+    sink=cv2,
+    processor: Optional[HandsProcessor] = None,
+    clock: Callable[[], float] = time.monotonic,
+    profiler: Optional[MemoryProfiler] = None,
+) -> HandsProcessor:
+    """
+    Assembles the command-line pipeline (capture → preprocess → infer → classify → confirm →
+    dispatch → control → cues → render → clips → display) and runs it until the capture ends or 'q' is pressed.
+    Every dependency can be injected, so the loop also runs headless with the stand-ins
+    from `src.handlers.simulation`.
+    :param settings: Application settings.
+    :param capture: Opened `cv2.VideoCapture`-like object; opened from Settings when None.
+    :param hands: Object with a MediaPipe Hands-like `process`; created from Settings when None.
+    :param sink: Display with `imshow`, `waitKey` and `destroyAllWindows`.
+    :param processor: Gesture processor; created from Settings when None.
+    :param clock: Source of frame timestamps in seconds.
+    :param profiler: Memory profiler; created from Settings when None.
+    :return: The processor, for inspecting its state after the run.
+    """
 
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            continue
+    settings = settings or Settings()
+    if capture is None:
+        cap, capture_info = open_capture(settings)
+    else:
+        cap, capture_info = capture, configure_capture(capture, settings)
+    log_event(
+        "camera_opened", index=settings.camera_index, format=str(capture_info), rejected=capture_info.mismatches
+    )
 
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
+    processor = processor or HandsProcessor(settings)
+    # Detects only as many hands as the active gesture mapping can use; injected stand-ins are kept as they are
+    hands_factory = None
+    if hands is None:
+        hands = create_hands(settings, processor.max_num_hands)
+        # The "tasks" backend ignores the model complexity, so the governor has nothing to rebuild it for
+        if settings.inference_backend != "tasks":
+            hands_factory = lambda complexity: create_hands(settings, processor.max_num_hands, model_complexity=complexity)
+    zone = ActiveZone(settings.active_zone)
+    bounds = (settings.preview_width, capture_info.height) if settings.preview_width else None
 
-        if results.multi_hand_landmarks:
-            processor.classify_hands(results.multi_hand_landmarks)
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+    stages = recognition_stages(processor, hands, zone)
+    cue_player = create_cue_player(settings)
+    if cue_player:
+        stages.append(Cues(cue_player))
+    stages.append(
+        Render(LandmarkOverlay(enabled=settings.draw_overlay), zone, bounds, at_preview=settings.overlay_at_preview)
+    )
+    recorder = None
+    if settings.clip_dir:
+        recorder = ClipRecorder(
+            settings.clip_dir,
+            fps=capture_info.fps,
+            pre_seconds=settings.clip_pre_seconds,
+            post_seconds=settings.clip_post_seconds,
+            jpeg_quality=settings.clip_jpeg_quality,
+        )
+        stages.append(RecordClips(recorder))
+    stages.append(Display(sink))
 
-        cv2.imshow("Hand Recognition", frame)
-        if cv2.waitKey(1) & 0xFF == ord("q"):
-            break
+    profiler = profiler or MemoryProfiler(settings.memory_profile, interval=settings.memory_profile_interval)
+    profiler.start()
+    pipeline = Pipeline(stages, profiler)
+    governor = create_governor(settings, pipeline, cap, hands_factory).start() if settings.governor else None
+    for frame in pipeline.run(capture_frames(cap, clock), source_name="capture"):
+        if governor:
+            governor.tick(frame.timestamp)
 
     cap.release()
-    cv2.destroyAllWindows()
+    sink.destroyAllWindows()
+    processor.backend.close()
+    if cue_player:
+        cue_player.close()
+    if recorder:
+        recorder.close()
+    profiler.stop(settings.memory_report_path)
+    log_event("pipeline_timing", stages={name: round(stats.mean * 1000, 3) for name, stats in pipeline.stats.items()})
+    return processor
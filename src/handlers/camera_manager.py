@@ -0,0 +1,161 @@
+"""
+Camera discovery and asynchronous opening, so starting a preview never blocks the GUI thread.
+
+All device work (probing, opening, releasing) runs on one background thread: OpenCV
+capture backends are not safe to drive from several threads at once, and a single worker
+also orders the requests, so an open issued right after start-up simply waits for the
+enumeration instead of racing it. Results are delivered through futures.
+
+Keeping a stopped camera open ("warm") for a quick restart is optional, and a warm camera
+is released after `warm_timeout` seconds without use, so the camera light does not stay on.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import cv2
+
+from src.event_log import log_event
+from src.handlers.capture import CaptureInfo, configure_capture, open_capture
+from src.settings.config import Settings
+
+Opener = Callable[[Settings, int], Tuple[object, CaptureInfo]]
+
+
+@dataclass
+class CameraDevice:
+    """A camera found by enumeration and the format it accepted for the current Settings."""
+
+    index: int
+    info: CaptureInfo
+    backend: str = ""
+
+    def __str__(self) -> str:
+        return f"Camera {self.index} ({self.info.width}x{self.info.height})"
+
+
+class CameraManager:
+    def __init__(
+        self, settings: Settings, opener: Opener = open_capture, keep_warm: bool = False, warm_timeout: float = 0.0
+    ):
+        """
+        :param settings: Application settings with the requested capture format.
+        :param opener: Opens and configures a camera by index, like `open_capture`.
+        :param keep_warm: Keep a released camera open, so the next `open` of it returns at once.
+        :param warm_timeout: Seconds a warm camera stays open without use; 0 keeps it until the next `open`.
+        """
+
+        self.settings = settings
+        self.opener = opener
+        self.keep_warm = keep_warm
+        self.warm_timeout = warm_timeout
+        self.devices: Optional[List[CameraDevice]] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="camera")
+        self._lock = threading.Lock()
+        # Opened but currently unused capture: (index, capture, info, format changed since it was negotiated)
+        self._warm: Optional[Tuple[int, object, CaptureInfo, bool]] = None
+        self._warm_timer: Optional[threading.Timer] = None
+        self._enumeration: Optional[Future] = None
+
+    def enumerate(self, count: int) -> "Future[List[CameraDevice]]":
+        """
+        Probes camera indexes 0..count-1 in the background; the result is cached in `devices`
+        and later calls return the same future. Every probed camera is released again.
+        :param count: Number of indexes to probe.
+        """
+
+        if self._enumeration is None:
+            self._enumeration = self._executor.submit(self._enumerate, count)
+        return self._enumeration
+
+    def open(self, index: int) -> "Future[Tuple[object, CaptureInfo]]":
+        """
+        Opens a camera in the background; a warm capture of the same index is returned at once,
+        or after restoring its format on the device thread if it was changed while in use.
+        :param index: Camera index.
+        :return: Future of the opened capture and its negotiated format; fails if the camera cannot be opened.
+        """
+
+        warm = self._take_warm()
+        if warm and warm[0] == index:
+            _, capture, info, changed = warm
+            if changed:
+                return self._executor.submit(self._restore, capture)
+            future: Future = Future()
+            future.set_result((capture, info))
+            return future
+        if warm:
+            self._executor.submit(warm[1].release)
+        return self._executor.submit(self._open, index)
+
+    def release(self, index: int, capture, info: CaptureInfo, format_changed: bool = False) -> None:
+        """
+        Gives a capture back: it is kept open for the next `open` when keeping cameras warm,
+        otherwise released in the background.
+        :param format_changed: The capture format was changed after opening (e.g. by the resource
+            governor); the negotiated format is requested again before the capture is reused.
+        """
+
+        if not self.keep_warm:
+            self._executor.submit(capture.release)
+            return
+        previous = self._take_warm()
+        with self._lock:
+            self._warm = warm = (index, capture, info, format_changed)
+            if self.warm_timeout > 0:
+                self._warm_timer = threading.Timer(self.warm_timeout, self._expire, (warm,))
+                self._warm_timer.daemon = True
+                self._warm_timer.start()
+        if previous:
+            self._executor.submit(previous[1].release)
+
+    def close(self) -> None:
+        """Releases the warm capture and waits for pending device work."""
+        warm = self._take_warm()
+        if warm:
+            self._executor.submit(warm[1].release)
+        self._executor.shutdown(wait=True)
+
+    def _take_warm(self) -> Optional[Tuple[int, object, CaptureInfo, bool]]:
+        with self._lock:
+            warm, self._warm = self._warm, None
+            if self._warm_timer is not None:
+                self._warm_timer.cancel()
+                self._warm_timer = None
+        return warm
+
+    def _expire(self, warm: Tuple[int, object, CaptureInfo, bool]) -> None:
+        with self._lock:
+            if self._warm is not warm:
+                return
+            self._warm = None
+            self._warm_timer = None
+        log_event("camera_released", index=warm[0], reason="idle")
+        try:
+            self._executor.submit(warm[1].release)
+        except RuntimeError:
+            # Closed meanwhile; close() released it
+            pass
+
+    def _restore(self, capture) -> Tuple[object, CaptureInfo]:
+        return capture, configure_capture(capture, self.settings)
+
+    def _open(self, index: int) -> Tuple[object, CaptureInfo]:
+        capture, info = self.opener(self.settings, index)
+        log_event("camera_opened", index=index, format=str(info), rejected=info.mismatches)
+        return capture, info
+
+    def _enumerate(self, count: int) -> List[CameraDevice]:
+        devices = []
+        for index in range(count):
+            try:
+                capture, info = self.opener(self.settings, index)
+            except (RuntimeError, cv2.error):
+                continue
+            backend = capture.getBackendName() if hasattr(capture, "getBackendName") else ""
+            devices.append(CameraDevice(index, info, backend))
+            capture.release()
+        self.devices = devices
+        log_event("cameras_enumerated", devices=[str(device) for device in devices])
+        return devices
@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import cv2
+
+from src.settings.config import Settings
+
+
+@dataclass
+class CaptureInfo:
+    """Capture format actually accepted by the device."""
+
+    width: int
+    height: int
+    fps: float
+    fourcc: str
+    mismatches: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return f"{self.width}x{self.height} @ {self.fps:g} FPS, {self.fourcc or 'default'}"
+
+
+def decode_fourcc(value: float) -> str:
+    code = int(value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ")
+
+
+def configure_capture(cap: cv2.VideoCapture, settings: Settings) -> CaptureInfo:
+    """
+    Requests the capture format from Settings and reads back what the device accepted.
+    The FourCC is set first, because many drivers only offer high resolutions and
+    frame rates for compressed formats such as MJPG.
+    :param cap: Opened capture.
+    :param settings: Application settings with the requested format.
+    :return: The negotiated format, with a note for every request the device did not honor.
+    """
+
+    if settings.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*settings.fourcc))
+    if settings.frame_width and settings.frame_height:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings.frame_width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings.frame_height)
+    if settings.fps:
+        cap.set(cv2.CAP_PROP_FPS, settings.fps)
+
+    info = CaptureInfo(
+        width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        fps=cap.get(cv2.CAP_PROP_FPS),
+        fourcc=decode_fourcc(cap.get(cv2.CAP_PROP_FOURCC)),
+    )
+
+    if settings.fourcc and info.fourcc != settings.fourcc:
+        info.mismatches.append(f"fourcc {settings.fourcc} -> {info.fourcc or 'unknown'}")
+    if settings.frame_width and (info.width, info.height) != (settings.frame_width, settings.frame_height):
+        info.mismatches.append(
+            f"resolution {settings.frame_width}x{settings.frame_height} -> {info.width}x{info.height}"
+        )
+    if settings.fps and info.fps and abs(info.fps - settings.fps) > 0.5:
+        info.mismatches.append(f"fps {settings.fps} -> {info.fps:g}")
+    return info
+
+
+def open_capture(settings: Settings, index: Optional[int] = None) -> Tuple[cv2.VideoCapture, CaptureInfo]:
+    """
+    Opens a camera and negotiates the capture format.
+    :param settings: Application settings.
+    :param index: Camera index, defaults to `settings.camera_index`.
+    :return: The opened capture and the negotiated format.
+    """
+
+    index = settings.camera_index if index is None else index
+    cap = cv2.VideoCapture(index)
+    if not cap.isOpened():
+        cap.release()
+        raise RuntimeError(f"Cannot open camera index {index}")
+    return cap, configure_capture(cap, settings)
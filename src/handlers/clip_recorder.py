@@ -0,0 +1,178 @@
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from src.event_log import log_event
+
+Frame = Union[np.ndarray, bytes]
+
+
+@dataclass
+class _Clip:
+    label: str
+    started: float
+    frames: List[Frame]
+    remaining: int
+    size: Tuple[int, int]
+    path: Optional[str] = field(default=None)
+
+
+class ClipRecorder:
+    """
+    Keeps the last few seconds of annotated frames in memory and, when a gesture
+    fires, writes the pre-roll and the following post-roll to a video file.
+    The frame loop only appends references to a bounded deque (or JPEG bytes when
+    `jpeg_quality` is set); encoding and disk I/O happen on a background thread.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        fps: float = 30.0,
+        pre_seconds: float = 3.0,
+        post_seconds: float = 2.0,
+        jpeg_quality: int = 0,
+        max_pending: int = 4,
+    ):
+        self.output_dir = output_dir
+        self.fps = fps or 30.0
+        self.post_frames = int(round(post_seconds * self.fps))
+        self.jpeg_quality = jpeg_quality
+        self.buffer: deque = deque(maxlen=max(1, int(round(pre_seconds * self.fps))))
+        self.size: Optional[Tuple[int, int]] = None
+        self.active: List[_Clip] = []
+        self.saved: List[str] = []
+        self.dropped = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def push(self, frame: np.ndarray) -> None:
+        """
+        Adds a frame to the pre-roll and to every clip that is still collecting post-roll.
+        The frame is stored by reference and must not be modified afterwards.
+        :param frame: Annotated BGR frame.
+        """
+
+        self.size = (frame.shape[1], frame.shape[0])
+        if self.jpeg_quality:
+            ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+            if not ok:
+                return
+            item: Frame = encoded.tobytes()
+        else:
+            item = frame
+        self.buffer.append(item)
+
+        if not self.active:
+            return
+        finished = []
+        for clip in self.active:
+            clip.frames.append(item)
+            clip.remaining -= 1
+            if clip.remaining <= 0:
+                finished.append(clip)
+        for clip in finished:
+            self.active.remove(clip)
+            self._enqueue(clip)
+
+    def trigger(self, label: str) -> None:
+        """
+        Starts a clip for a confirmed gesture: snapshots the pre-roll and keeps
+        collecting frames for the post-roll.
+        :param label: Gesture name, used in the file name.
+        """
+
+        if self.size is None:
+            return
+        clip = _Clip(label, time.time(), list(self.buffer), self.post_frames, self.size)
+        if clip.remaining <= 0:
+            self._enqueue(clip)
+        else:
+            self.active.append(clip)
+
+    def _enqueue(self, clip: _Clip) -> None:
+        try:
+            self._queue.put_nowait(clip)
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self) -> None:
+        while True:
+            clip = self._queue.get()
+            if clip is None:
+                self._queue.task_done()
+                return
+            try:
+                self._write(clip)
+            except Exception as e:
+                # A clip that cannot be written is lost, but the writer keeps serving the next ones
+                log_event("clip_failed", label=clip.label, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    def _write(self, clip: _Clip) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(clip.started))
+        millis = int(clip.started * 1000) % 1000
+        path = os.path.join(self.output_dir, f"{stamp}-{millis:03d}_{clip.label.replace(' ', '_')}.mp4")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), self.fps, clip.size)
+        if not writer.isOpened():
+            raise OSError(f"cannot open {path} for writing")
+        try:
+            for item in clip.frames:
+                if isinstance(item, bytes):
+                    item = cv2.imdecode(np.frombuffer(item, dtype=np.uint8), cv2.IMREAD_COLOR)
+                if (item.shape[1], item.shape[0]) != clip.size:
+                    item = cv2.resize(item, clip.size)
+                writer.write(item)
+        finally:
+            writer.release()
+        clip.path = path
+        self.saved.append(path)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Writes clips that are still collecting post-roll and waits for the writer.
+        :param timeout: Longest wait in seconds; None waits until every clip is written.
+        :return: True if every queued clip has been handled.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for clip in self.active:
+            try:
+                self._queue.put(clip, timeout=self._remaining(deadline))
+            except queue.Full:
+                self.dropped += 1
+        self.active = []
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, self._remaining(deadline)
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Flushes pending clips and stops the writer, giving up after `timeout` seconds,
+        so a stuck encoder or disk does not hang the application on exit.
+        """
+
+        deadline = time.monotonic() + timeout
+        if not self.flush(timeout):
+            log_event("clip_failed", error="writer did not finish in time", pending=self._queue.qsize())
+        try:
+            self._queue.put(None, timeout=self._remaining(deadline))
+        except queue.Full:
+            pass
+        self._writer.join(timeout=self._remaining(deadline))
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
@@ -0,0 +1,239 @@
+"""
+Closed-loop quality control: keeps the frame pipeline within a latency and CPU budget.
+
+`ResourceGovernor.tick` is called once per frame but only evaluates every `interval`
+seconds. From the pipeline stage stats it derives the mean processing time of a frame
+since the previous evaluation and compares it, together with the process CPU usage,
+against the budget. Quality is stepped down one level after `GOVERNOR_DOWN_AFTER`
+evaluations over budget and back up after `GOVERNOR_UP_AFTER` evaluations comfortably
+below it (under `recover` times the limits). The band between the two thresholds and the
+longer wait before upgrading keep it from oscillating between two levels.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import cv2
+import psutil
+
+from src.event_log import log_event
+from src.handlers.pipeline import Infer, Render
+from src.settings.config import Settings
+from src.settings.constants import GOVERNOR_DOWN_AFTER, GOVERNOR_UP_AFTER
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    # Landmark model of the "solutions" backend: 1 full, 0 lite
+    model_complexity: int = 1
+    # Requested capture (width, height); (0, 0) keeps the driver default
+    resolution: Tuple[int, int] = (0, 0)
+    # Infer every n-th frame, the frames in between reuse its hands
+    stride: int = 1
+    overlay: bool = True
+    # Smooth (area) or fast (nearest) preview downscaling
+    smooth_preview: bool = True
+
+
+def quality_levels(settings: Settings) -> List[QualityLevel]:
+    """
+    Quality levels from best to cheapest. Levers that cost the least recognition
+    quality go first: preview smoothing, the overlay, the lite model, a lower capture
+    resolution and finally skipping inference on some frames. The "tasks" backend has a
+    single model, so it gets no lite-model step.
+    :param settings: Application settings with the requested capture format, overlay and backend.
+    """
+
+    full = (settings.frame_width, settings.frame_height)
+    half = (settings.frame_width // 2, settings.frame_height // 2) if all(full) else full
+    overlay = settings.draw_overlay
+    lite = 1 if settings.inference_backend == "tasks" else 0
+    levels = [
+        QualityLevel(1, full, 1, overlay, True),
+        QualityLevel(1, full, 1, overlay, False),
+        QualityLevel(1, full, 1, False, False),
+        QualityLevel(lite, full, 1, False, False),
+        QualityLevel(lite, half, 1, False, False),
+        QualityLevel(lite, half, 2, False, False),
+        QualityLevel(lite, half, 3, False, False),
+    ]
+    # Levels that change nothing (overlay already off, no resolution to halve) are skipped
+    return [level for i, level in enumerate(levels) if i == 0 or level != levels[i - 1]]
+
+
+class QualityLevers:
+    """Applies a quality level to a running pipeline, its capture and its inference backend."""
+
+    def __init__(
+        self,
+        pipeline,
+        capture=None,
+        hands_factory: Optional[Callable[[int], object]] = None,
+        model_complexity: int = 1,
+    ):
+        """
+        :param pipeline: `Pipeline` with `Infer` and `Render` stages.
+        :param capture: Opened capture whose resolution is requested; the resolution lever is off when None.
+        :param hands_factory: Creates an inference backend for a model complexity; the complexity
+            lever is off when None (e.g. for injected stand-ins).
+        :param model_complexity: Complexity of the backend the pipeline currently uses.
+        """
+
+        self.pipeline = pipeline
+        self.capture = capture
+        self.hands_factory = hands_factory
+        self.model_complexity = model_complexity
+        self.current: Optional[QualityLevel] = None
+
+    def apply(self, level: QualityLevel) -> None:
+        current = self.current
+        for stage in self.pipeline.stages:
+            if isinstance(stage, Infer):
+                stage.stride = level.stride
+                if self.hands_factory and level.model_complexity != self.model_complexity:
+                    stage.hands.close()
+                    stage.hands = self.hands_factory(level.model_complexity)
+                    self.model_complexity = level.model_complexity
+            elif isinstance(stage, Render):
+                stage.overlay.enabled = level.overlay
+                stage.interpolation = cv2.INTER_AREA if level.smooth_preview else cv2.INTER_NEAREST
+
+        # The capture was opened at the best level's resolution, so only later changes are requested
+        if self.capture is not None and current and all(level.resolution) and level.resolution != current.resolution:
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, level.resolution[0])
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, level.resolution[1])
+        self.current = level
+
+
+class ResourceGovernor:
+    def __init__(
+        self,
+        pipeline,
+        levels: Sequence[QualityLevel],
+        apply: Callable[[QualityLevel], None],
+        budget_ms: float = 33.0,
+        max_cpu: float = 80.0,
+        recover: float = 0.6,
+        interval: float = 1.0,
+        process: Optional[psutil.Process] = None,
+    ):
+        """
+        :param pipeline: `Pipeline` whose stage stats are watched; its first stage counts frames.
+        :param levels: Quality levels from best to cheapest.
+        :param apply: Called with the new level whenever it changes.
+        :param budget_ms: Target processing time of one frame, in milliseconds.
+        :param max_cpu: Highest process CPU usage, in percent of all cores.
+        :param recover: Fraction of both limits that usage must stay under before quality goes back up.
+        :param interval: Seconds between evaluations.
+        :param process: Process whose CPU usage is watched; the current one by default.
+        """
+
+        self.pipeline = pipeline
+        self.levels = list(levels)
+        self.apply = apply
+        self.budget_ms = budget_ms
+        self.max_cpu = max_cpu
+        self.recover = recover
+        self.interval = interval
+        self.process = process or psutil.Process(os.getpid())
+        self.cpu_count = psutil.cpu_count() or 1
+        self.index = 0
+        self.frame_ms = 0.0
+        self.cpu = 0.0
+        self._over = 0
+        self._under = 0
+        self._last_eval: Optional[float] = None
+        self._baseline = (0, 0.0)
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def start(self) -> "ResourceGovernor":
+        """Applies the best level and starts measuring from now."""
+        self.apply(self.level)
+        self.process.cpu_percent(None)
+        self._baseline = self._totals()
+        return self
+
+    def tick(self, now: Optional[float] = None) -> Optional[QualityLevel]:
+        """
+        Evaluates the budget once the interval has passed.
+        :param now: Current time in seconds; the monotonic clock by default.
+        :return: The new quality level if it changed, otherwise None.
+        """
+
+        now = time.monotonic() if now is None else now
+        if self._last_eval is None:
+            self._last_eval = now
+        if now - self._last_eval < self.interval:
+            return None
+        self._last_eval = now
+
+        frames, total = self._totals()
+        if frames == self._baseline[0]:
+            return None
+        self.frame_ms = (total - self._baseline[1]) / (frames - self._baseline[0]) * 1000
+        self.cpu = self.process.cpu_percent(None) / self.cpu_count
+        self._baseline = (frames, total)
+
+        if self.frame_ms > self.budget_ms or self.cpu > self.max_cpu:
+            self._over, self._under = self._over + 1, 0
+        elif self.frame_ms < self.budget_ms * self.recover and self.cpu < self.max_cpu * self.recover:
+            self._over, self._under = 0, self._under + 1
+        else:
+            self._over = self._under = 0
+
+        if self._over >= GOVERNOR_DOWN_AFTER and self.index < len(self.levels) - 1:
+            return self._step(+1)
+        if self._under >= GOVERNOR_UP_AFTER and self.index > 0:
+            return self._step(-1)
+        return None
+
+    def _step(self, direction: int) -> QualityLevel:
+        self.index += direction
+        self._over = self._under = 0
+        log_event(
+            "quality_changed",
+            level=self.index,
+            direction="down" if direction > 0 else "up",
+            frame_ms=round(self.frame_ms, 2),
+            cpu=round(self.cpu, 1),
+        )
+        self.apply(self.level)
+        # Measure the new level on its own frames only
+        self._baseline = self._totals()
+        return self.level
+
+    def _totals(self) -> Tuple[int, float]:
+        """Frames that entered the pipeline and the time all stages spent on them (sources excluded)."""
+        stats = self.pipeline.stats
+        stages = self.pipeline.stages
+        frames = stats[stages[0].name].calls if stages else 0
+        return frames, sum(stats[stage.name].total for stage in stages)
+
+
+def create_governor(
+    settings: Settings, pipeline, capture=None, hands_factory=None, model_complexity: int = 1
+) -> ResourceGovernor:
+    """
+    Builds a governor with the levels and budget from Settings, applying levels through `QualityLevers`.
+    :param settings: Application settings.
+    :param pipeline: Running pipeline.
+    :param capture: Opened capture for the resolution lever.
+    :param hands_factory: Creates an inference backend for a model complexity, for the complexity lever;
+        pass None for backends that ignore the complexity, such as "tasks".
+    :param model_complexity: Complexity of the backend the pipeline currently uses.
+    """
+
+    levers = QualityLevers(pipeline, capture, hands_factory, model_complexity)
+    return ResourceGovernor(
+        pipeline,
+        quality_levels(settings),
+        levers.apply,
+        budget_ms=settings.governor_budget_ms,
+        max_cpu=settings.governor_max_cpu,
+        recover=settings.governor_recover,
+        interval=settings.governor_interval,
+    )
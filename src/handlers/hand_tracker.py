@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.settings.constants import HAND_DROPOUT_FRAMES, HAND_MATCH_DISTANCE
+
+
+@dataclass
+class HandTrack:
+    """Incremental confirmation state of one physical hand."""
+
+    label: str
+    gesture: Optional[int] = None
+    count: int = 0
+    # Confirmation progress: frames weighted by their confidence
+    score: float = 0.0
+    missed: int = 0
+    # Last seen wrist position, used to tell apart hands that handedness cannot
+    position: Optional[Tuple[float, float]] = None
+
+
+class HandTracker:
+    def __init__(self, max_missed: int = HAND_DROPOUT_FRAMES, max_distance: float = HAND_MATCH_DISTANCE):
+        self.max_missed = max_missed
+        self.max_distance = max_distance
+        self.tracks: Dict[str, HandTrack] = {}
+        self._next_id = 0
+
+    def identify(self, positions: np.ndarray) -> List[str]:
+        """
+        Labels hands by matching their wrists to the nearest track seen in earlier frames.
+        Used instead of handedness when it cannot tell hands apart: more than two hands,
+        or two hands reported as the same side. Matching is greedy, closest pairs first.
+        :param positions: Wrist positions of shape (N, 2).
+        :return: One unique label per hand; unmatched hands get a new "hand_<k>" label.
+        """
+
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        labels: List[Optional[str]] = [None] * len(positions)
+        known = [track for track in self.tracks.values() if track.position is not None]
+        if known and len(positions):
+            distances = np.linalg.norm(
+                positions[:, None, :] - np.array([track.position for track in known], dtype=np.float32)[None], axis=2
+            )
+            for flat in np.argsort(distances, axis=None):
+                hand, track = np.unravel_index(flat, distances.shape)
+                if distances[hand, track] > self.max_distance:
+                    break
+                if labels[hand] is None and known[track] is not None:
+                    labels[hand] = known[track].label
+                    known[track] = None
+
+        for i, label in enumerate(labels):
+            if label is None:
+                while f"hand_{self._next_id}" in self.tracks:
+                    self._next_id += 1
+                labels[i] = f"hand_{self._next_id}"
+                self._next_id += 1
+        return labels
+
+    def update(
+        self,
+        labels: List[str],
+        gestures: List[Optional[int]],
+        weights: Optional[Sequence[float]] = None,
+        positions: Optional[np.ndarray] = None,
+    ) -> List[HandTrack]:
+        """
+        Updates per-hand state with the gestures seen in the current frame.
+        Hands that are not reported keep their state for up to `max_missed` frames,
+        so a single dropped frame does not restart confirmation.
+        :param labels: Stable identity of each detected hand ("Left" / "Right").
+        :param gestures: Gesture code of each detected hand, in the same order as labels; 0 or None for no gesture.
+        :param weights: How much each hand's frame counts towards confirmation, 1 by default.
+        :param positions: Wrist position of each hand, shape (N, 2), remembered for `identify`.
+        :return: Tracks that are still alive, ordered by label.
+        """
+
+        if weights is None:
+            weights = [1.0] * len(labels)
+        if positions is None:
+            positions = [None] * len(labels)
+        seen = set()
+        for label, gesture, weight, position in zip(labels, gestures, weights, positions):
+            if label in seen:
+                continue
+            seen.add(label)
+
+            track = self.tracks.get(label)
+            if track is None:
+                track = self.tracks[label] = HandTrack(label)
+
+            if gesture and gesture == track.gesture:
+                track.count += 1
+                track.score += weight
+            else:
+                track.gesture = gesture
+                track.count = 1 if gesture else 0
+                track.score = float(weight) if gesture else 0.0
+            track.missed = 0
+            if position is not None:
+                track.position = (float(position[0]), float(position[1]))
+
+        for label in list(self.tracks):
+            if label in seen:
+                continue
+            track = self.tracks[label]
+            track.missed += 1
+            if track.missed > self.max_missed:
+                del self.tracks[label]
+
+        return self.alive()
+
+    def alive(self) -> List[HandTrack]:
+        """Tracks that are still alive, ordered by label."""
+        return [self.tracks[label] for label in sorted(self.tracks)]
+
+    def reset(self) -> None:
+        self.tracks.clear()
+        self._next_id = 0
+
+
+def has_unique_handedness(multi_handedness: Optional[List], num_hands: int) -> bool:
+    """
+    Checks whether handedness tells every detected hand apart.
+    :param multi_handedness: `results.multi_handedness` or None.
+    :param num_hands: Number of detected hands.
+    :return: True if every hand has a handedness label and no label repeats.
+    """
+
+    if not multi_handedness or len(multi_handedness) != num_hands:
+        return False
+    return len({handedness.classification[0].label for handedness in multi_handedness}) == num_hands
+
+
+def hand_labels(multi_handedness: Optional[List], num_hands: int) -> List[str]:
+    """
+    Extracts handedness labels from MediaPipe results.
+    Falls back to positional labels when handedness is missing or ambiguous
+    (for example, when both hands are reported as the same side).
+    :param multi_handedness: `results.multi_handedness` or None.
+    :param num_hands: Number of detected hands.
+    :return: One unique label per hand.
+    """
+
+    if has_unique_handedness(multi_handedness, num_hands):
+        return [handedness.classification[0].label for handedness in multi_handedness]
+    return [f"hand_{i}" for i in range(num_hands)]
+
+
+def hand_scores(multi_handedness: Optional[List], num_hands: int) -> List[float]:
+    """
+    Extracts handedness confidence scores from MediaPipe results.
+    :param multi_handedness: `results.multi_handedness` or None.
+    :param num_hands: Number of detected hands.
+    :return: One score per hand; 1.0 when handedness is missing.
+    """
+
+    if multi_handedness and len(multi_handedness) == num_hands:
+        return [float(handedness.classification[0].score) for handedness in multi_handedness]
+    return [1.0] * num_hands
@@ -1,117 +1,277 @@
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from src.settings.constants import FINGER_TIPS, FINGER_BASES, GESTURE_THRESHOLD
-from src.models import GestureSet
-from src.actions import SingleHandActions, TwoHandsActions
+import numpy as np
+
+from src.settings.constants import ACTION_COOLDOWN_SECONDS, GESTURE_THRESHOLD
+from src.models import TWO_HAND_CODES, GestureCode
+from src.actions import MacroAutomaton, SingleHandActions, TwoHandsActions, create_backend
+from src.actions.continuous import create_controls
+from src.actions.macros import run_macro_action
+from src.handlers.hand_tracker import HandTrack, HandTracker, hand_labels, hand_scores, has_unique_handedness
+from src.detection.classifiers import build_classifier
+from src.detection.landmarks import WRIST, landmark_quality, stack_landmarks
+from src.detection.rules import classify_rules, combine_codes
+from src.detection.motion import MOTION_POINTS, MotionDetector
+from src.settings.config import Settings
 
 
 class HandsProcessor:
-    def __init__(self):
-        self.gesture = GestureSet
-        self.previous_gesture: Optional[str] = None
+    def __init__(self, settings: Optional[Settings] = None, backend=None):
+        settings = settings or Settings()
+        self.gesture = GestureCode
+        self.classifier = build_classifier(settings)
+        self.backend = backend or create_backend(settings)
+        self.single_actions = SingleHandActions(self.backend)
+        self.two_actions = TwoHandsActions(self.backend)
+        self.macros = MacroAutomaton(settings.macros, settings.macro_timeout)
+        self.controls = create_controls(settings, self.backend)
+        self.tracker = HandTracker()
+        self.motion: Dict[str, MotionDetector] = {}
+        # Hands fed to the motion detectors in the previous frame
+        self._motion_labels: set = set()
+        self.min_handedness_score = settings.min_handedness_score
+        self.min_landmark_quality = settings.min_landmark_quality
+        self.confidence_full = settings.confidence_full
+        self.settings_max_num_hands = settings.max_num_hands
+        self.previous_gesture: Optional[GestureCode] = None
         self.gesture_count: int = 0
+        self.gesture_score: float = 0.0
+        self.cooldown_until: float = float("-inf")
 
-    def classify_hands(self, hand_landmarks_list: List) -> None:
-        num_hands = len(hand_landmarks_list)
-        detected_gestures = [self.classify_single_hand(hand) for hand in hand_landmarks_list if hand]
+    def classify_hands(
+        self,
+        hand_landmarks_list: Optional[List],
+        multi_handedness: Optional[List] = None,
+        timestamp: Optional[float] = None,
+    ) -> Optional[GestureCode]:
+        """
+        Classifies every detected hand and confirms the combined gesture.
+        Call it for every frame, including frames without hands: that is what ages
+        the hand tracks and motion histories of hands that have left.
+        Any number of hands is supported: all hands are classified in one vectorized pass,
+        each keeps its own confirmation state, and `combine_codes` merges them.
+        Hands with a low handedness score or implausible landmarks are rejected before
+        classification and treated as not detected in this frame. Every accepted frame
+        counts towards confirmation in proportion to its confidence.
+        Motion gestures are detected from each hand's recent history and fire immediately.
+        :param hand_landmarks_list: `results.multi_hand_landmarks` from MediaPipe; None when no hand was found.
+        :param multi_handedness: `results.multi_handedness` from MediaPipe, used to keep
+            stable left/right identities when the detection order changes.
+        :param timestamp: Frame time in seconds, defaults to the current monotonic time.
+        :return: Code of the gesture whose action was called in this frame, or None.
+        """
 
-        gesture = self._get_combined_gesture(detected_gestures, num_hands)
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        motion_gesture, tracks = self.classify(stack_landmarks(hand_landmarks_list or []), multi_handedness, timestamp)
+        gesture = self.confirm(motion_gesture, tracks, timestamp)
         if gesture:
-            self._process_detected_gesture(gesture, num_hands)
+            self.dispatch(gesture, timestamp)
+        return gesture
 
-    def classify_single_hand(self, hand_landmarks) -> Optional[str]:
+    def classify(
+        self, landmarks: np.ndarray, multi_handedness: Optional[List], timestamp: float
+    ) -> Tuple[Optional[GestureCode], List[HandTrack]]:
         """
-        Classifies a single hand gesture based on the extended fingers.
-        :param hand_landmarks: A list of landmarks for a single hand.
-        :return: A string representing the detected gesture.
+        Classifies the hands of a frame and updates their confirmation and motion state.
+        :param landmarks: Array of shape (N, 21, 3) of all detected hands.
+        :param multi_handedness: `results.multi_handedness` from MediaPipe or None.
+        :param timestamp: Frame time in seconds.
+        :return: A motion gesture completed in this frame or None, and the alive hand tracks.
         """
 
-        fingers_extended = [
-            self._is_finger_extended(hand_landmarks, tip, base) for tip, base in zip(FINGER_TIPS[1:], FINGER_BASES[1:])
-        ]
-        fingers_extended.insert(0, self._is_thumb_extended(hand_landmarks))
+        scores = np.array(hand_scores(multi_handedness, len(landmarks)), dtype=np.float32)
+        quality = landmark_quality(landmarks)
+        accepted = np.flatnonzero((scores >= self.min_handedness_score) & (quality >= self.min_landmark_quality))
+        landmarks = landmarks[accepted]
+        confidence = scores[accepted] * quality[accepted]
+
+        # Handedness tells at most two hands apart; beyond that hands are followed by wrist position
+        wrists = landmarks[:, WRIST, :2]
+        if has_unique_handedness(multi_handedness, len(scores)):
+            labels = hand_labels(multi_handedness, len(scores))
+            labels = [labels[i] for i in accepted]
+        else:
+            labels = self.tracker.identify(wrists)
 
-        return self._identify_gesture(hand_landmarks, fingers_extended)
+        if self.classifier is not None:
+            detected_gestures, probabilities = self.classifier.classify_codes(landmarks)
+            confidence *= probabilities
+        else:
+            detected_gestures = self.classify_landmarks(landmarks)
+        weights = np.minimum(confidence / self.confidence_full, 1.0)
+        tracks = self.tracker.update(labels, detected_gestures, weights, wrists)
+        return self._update_motion(labels, landmarks, timestamp), tracks
 
-    def _is_finger_extended(self, hand_landmarks, tip: int, base: int) -> bool:
+    def confirm(
+        self, motion_gesture: Optional[GestureCode], tracks: List[HandTrack], timestamp: float
+    ) -> Optional[GestureCode]:
         """
-        Checks if the finger (except the thumb) is extended.
-        :param hand_landmarks: Coordinates of the joints of the hand.
-        :param tip: Index of the fingertip.
-        :param base: Index of the base of the finger.
-        :return: True if the finger is extended, otherwise False.
+        Decides whether a gesture fires in this frame. Motion gestures fire immediately,
+        static ones once held long enough; either is held back during the cooldown.
+        :param motion_gesture: Motion gesture returned by `classify`.
+        :param tracks: Hand tracks returned by `classify`.
+        :param timestamp: Frame time in seconds.
+        :return: The gesture whose action should be called now, or None.
         """
 
-        return (
-            hand_landmarks.landmark[tip].y < hand_landmarks.landmark[base].y - 0.02
-            and hand_landmarks.landmark[tip].z < hand_landmarks.landmark[base].z
-        )
+        if motion_gesture:
+            return motion_gesture if self._start_cooldown(timestamp) else None
 
-    def _is_thumb_extended(self, hand_landmarks) -> bool:
+        gesture, count, score = self._get_combined_gesture(tracks)
+        if gesture and self._process_detected_gesture(gesture, count, score, timestamp):
+            return gesture
+        return None
+
+    def dispatch(self, gesture: GestureCode, timestamp: Optional[float] = None) -> Optional[str]:
         """
-        Checks if the thumb is extended.
-        :param hand_landmarks: Coordinates of the hand joints.
-        :return: True if the thumb is bent, otherwise False.
+        Calls the action bound to a confirmed gesture, then advances the macro automaton;
+        a macro completed by this gesture runs its action as well, after the gesture's own.
+        :param gesture: Gesture returned by `confirm`.
+        :param timestamp: Frame time in seconds, defaults to the current monotonic time.
+        :return: Whatever the macro action, or else the gesture action, returned, e.g. a status message.
         """
 
-        thumb_tip = hand_landmarks.landmark[4]
-        thumb_base = hand_landmarks.landmark[2]
-        return thumb_tip.y < thumb_base.y - 0.05 and thumb_tip.z < thumb_base.z
+        actions = self.two_actions if gesture in TWO_HAND_CODES else self.single_actions
+        result = actions.get_action(gesture)
+        macro = self.macros.advance(gesture, time.monotonic() if timestamp is None else timestamp)
+        if macro:
+            result = run_macro_action(macro, self.single_actions, self.two_actions) or result
+        return result
 
-    def _identify_gesture(self, hand_landmarks, fingers_extended: List[bool]) -> Optional[str]:
+    def update_controls(
+        self, landmarks: np.ndarray, timestamp: float, tracks: Optional[List[HandTrack]] = None
+    ) -> None:
         """
-        Determines the gesture type based on finger position.
-        :param hand_landmarks: Coordinates of the joints of the hand.
-        :param fingers_extended: A list of flags indicating which fingers are extended.
-        :return: Name of the gesture or None if the gesture is not recognized.
+        Feeds the hands of a frame to the continuous control channels. Their values are
+        coalesced and rate limited by the dispatchers rather than queued. A hand whose track
+        currently holds a static gesture is left out, so confirming a gesture does not also steer a control.
+        :param landmarks: Array of shape (N, 21, 3) of all detected hands.
+        :param timestamp: Frame time in seconds.
+        :param tracks: Hand tracks returned by `classify`.
         """
 
-        is_fist = all(
-            abs(hand_landmarks.landmark[tip].x - hand_landmarks.landmark[base].x) < 0.05
-            for tip, base in zip(FINGER_TIPS, FINGER_BASES)
-        )
+        holding = [
+            track.position for track in tracks or () if track.gesture and not track.missed and track.position is not None
+        ]
+        if holding and len(landmarks):
+            distances = np.linalg.norm(
+                landmarks[:, WRIST, None, :2] - np.array(holding, dtype=np.float32)[None], axis=2
+            )
+            landmarks = landmarks[distances.min(axis=1) > self.tracker.max_distance]
 
-        if not is_fist and fingers_extended[0] and not any(fingers_extended[1:]):
-            return self.gesture.LIKE.value
-        if not is_fist and not fingers_extended[0] and not any(fingers_extended[1:]):
-            return self.gesture.DISLIKE.value
-        if all(fingers_extended):
-            return self.gesture.STOP.value
+        for channel, dispatcher in self.controls:
+            value = channel.update(landmarks)
+            if value is not None:
+                dispatcher.submit(value)
+            elif not channel.active:
+                dispatcher.reset()
+            dispatcher.poll(timestamp)
 
-        index_tip = hand_landmarks.landmark[8]
-        thumb_tip = hand_landmarks.landmark[4]
-        if abs(index_tip.x - thumb_tip.x) < 0.05 and abs(index_tip.y - thumb_tip.y) < 0.05:
-            return self.gesture.OKAY.value
+    @property
+    def max_num_hands(self) -> int:
+        """
+        Number of hands worth detecting: `Settings.max_num_hands` while a two-hand
+        gesture has an action or is part of a macro, otherwise 1, so unused detection is not paid for.
+        """
 
-        return None
+        two_hands = self.two_actions.is_active() or not self.macros.gestures.isdisjoint(TWO_HAND_CODES)
+        return self.settings_max_num_hands if two_hands else 1
 
-    def _get_combined_gesture(self, detected_gestures: List[str], num_hands: int) -> Optional[str]:
+    def _update_motion(self, labels: List[str], landmarks, timestamp: float) -> Optional[GestureCode]:
         """
-        Forms a string with gestures of both hands if they match.
-        :param detected_gestures: List of gestures of each hand.
-        :param num_hands: Number of detected hands.
-        :return: String with joined gestures or None if there are no gestures.
+        Feeds wrist and fingertip positions into the per-hand motion detectors.
+        A hand that was missing in the previous frame starts a new history, so reappearing
+        elsewhere is not taken for a swipe.
+        :param labels: Stable identity of each detected hand.
+        :param landmarks: Array of shape (N, 21, 3).
+        :param timestamp: Frame time in seconds.
+        :return: The first completed motion gesture or None.
         """
 
-        if num_hands == 2 and detected_gestures[0] == detected_gestures[1]:
-            return f"{detected_gestures[0]} {detected_gestures[1]}"
-        return ", ".join(g for g in detected_gestures if g)
+        for label in list(self.motion):
+            if label not in self.tracker.tracks:
+                del self.motion[label]
+
+        detected = None
+        for label, hand in zip(labels, landmarks):
+            detector = self.motion.get(label)
+            if detector is None:
+                detector = self.motion[label] = MotionDetector()
+            elif label not in self._motion_labels:
+                detector.reset()
+            gesture = detector.update(hand[MOTION_POINTS, :2], timestamp)
+            detected = detected or gesture
+        self._motion_labels = set(labels)
+        return detected
 
-    def _process_detected_gesture(self, gesture: str, num_hands: int) -> None:
+    def classify_single_hand(self, hand_landmarks) -> GestureCode:
         """
-        Processes the recognized gesture: checks for repetitions and calls the appropriate action.
+        Classifies a single hand gesture based on the extended fingers.
+        :param hand_landmarks: A list of landmarks for a single hand.
+        :return: Code of the detected gesture, GestureCode.NONE if not recognized.
+        """
+
+        return GestureCode(int(self.classify_landmarks(stack_landmarks([hand_landmarks]))[0]))
+
+    def classify_landmarks(self, landmarks: np.ndarray) -> np.ndarray:
+        """
+        Classifies all hands of a frame in one vectorized pass with the rule-based classifier.
+        :param landmarks: Array of shape (N, 21, 3).
+        :return: Gesture codes of shape (N,), GestureCode.NONE where no gesture is recognized.
+        """
+
+        return classify_rules(landmarks)
+
+    def _get_combined_gesture(self, tracks: List[HandTrack]) -> Tuple[Optional[GestureCode], int, float]:
+        """
+        Combines per-hand states into one gesture with `combine_codes`: a gesture held by
+        two or more hands forms its two-hand combination from PAIR_CODES, a gesture held by
+        a single hand while the others are idle stays a one-hand gesture. A combination is
+        as confirmed as the second most confirmed hand showing it, so extra hands joining
+        in do not restart it.
+        :param tracks: Alive hand tracks ordered by label.
+        :return: Combined gesture, its confirmation count and score, or (None, 0, 0.0).
+        """
+
+        gesture, members = combine_codes([track.gesture or GestureCode.NONE for track in tracks])
+        if not gesture:
+            return None, 0, 0.0
+        if len(members) == 1:
+            track = tracks[members[0]]
+            return gesture, track.count, track.score
+        counts = sorted((tracks[i].count for i in members), reverse=True)
+        scores = sorted((tracks[i].score for i in members), reverse=True)
+        return gesture, counts[1], scores[1]
+
+    def _process_detected_gesture(self, gesture: GestureCode, count: int, score: float, timestamp: float) -> bool:
+        """
+        Processes the recognized gesture: checks whether it has been held long enough.
         :param gesture: Recognized gesture.
-        :param num_hands: Number of hands detected.
+        :param count: Number of frames the gesture has been held.
+        :param score: Confidence-weighted number of frames; confirms the gesture at GESTURE_THRESHOLD.
+        :param timestamp: Frame time in seconds.
+        :return: True if the gesture is confirmed and not in cooldown.
         """
 
-        if gesture == self.previous_gesture:
-            self.gesture_count += 1
-        else:
-            self.previous_gesture = gesture
-            self.gesture_count = 1
+        self.previous_gesture = gesture
+        self.gesture_count = count
+        self.gesture_score = score
+
+        # Tolerates float32 rounding in the sum of weights
+        if self.gesture_score >= GESTURE_THRESHOLD - 1e-3:
+            return self._start_cooldown(timestamp)
+        return False
+
+    def _start_cooldown(self, timestamp: float) -> bool:
+        """
+        Lets at most one gesture fire per cooldown period.
+        The cooldown is measured in frame time instead of sleeping, so the frame loop keeps running.
+        :param timestamp: Frame time in seconds.
+        :return: True if the cooldown was over and has been restarted.
+        """
 
-        if self.gesture_count >= GESTURE_THRESHOLD:
-            action_class = TwoHandsActions if num_hands == 2 else SingleHandActions
-            action_class().get_action(gesture)
-            time.sleep(2)
+        if timestamp < self.cooldown_until:
+            return False
+        self.cooldown_until = timestamp + ACTION_COOLDOWN_SECONDS
+        return True
@@ -0,0 +1,131 @@
+"""
+Live performance figures for a heads-up display.
+
+`PerformanceHud.sample` is meant to be called from a slow timer (a few times per second),
+not per frame: it only reads counters the pipeline and the inference backend keep anyway
+and turns their change since the previous sample into rates and mean latencies, so showing
+the HUD adds no work to the frame path.
+"""
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+from src.models import GESTURE_NAMES
+from src.settings.constants import GESTURE_THRESHOLD
+
+
+@dataclass
+class GestureProgress:
+    label: str
+    gesture: str
+    # Fraction of GESTURE_THRESHOLD reached, 0..1
+    progress: float
+
+
+@dataclass
+class HudSnapshot:
+    capture_fps: float = 0.0
+    inference_fps: float = 0.0
+    # Mean latency of every stage since the previous sample, in milliseconds
+    stage_ms: Dict[str, float] = field(default_factory=dict)
+    queue_depth: int = 0
+    dropped: int = 0
+    cpu_percent: float = 0.0
+    rss: int = 0
+    gestures: List[GestureProgress] = field(default_factory=list)
+    cooldown: float = 0.0
+
+    def lines(self) -> List[str]:
+        lines = [
+            f"capture   {self.capture_fps:6.1f} fps",
+            f"inference {self.inference_fps:6.1f} fps",
+            f"queue     {self.queue_depth:6d}   dropped {self.dropped}",
+            f"cpu       {self.cpu_percent:6.1f} %   rss {self.rss / 2 ** 20:.0f} MiB",
+        ]
+        lines += [f"{name:<11}{ms:5.2f} ms" for name, ms in self.stage_ms.items()]
+        for hand in self.gestures:
+            bar = "#" * round(hand.progress * 10)
+            lines.append(f"{hand.label:<8}{hand.gesture:<12}[{bar:<10}] {hand.progress:4.0%}")
+        if self.cooldown > 0:
+            lines.append(f"cooldown  {self.cooldown:4.1f} s")
+        return lines
+
+
+class PerformanceHud:
+    def __init__(
+        self,
+        pipeline,
+        hands=None,
+        processor=None,
+        clock: Callable[[], float] = time.monotonic,
+        process: Optional[psutil.Process] = None,
+    ):
+        """
+        :param pipeline: `Pipeline` whose per-stage stats are read; its first stage counts captured frames.
+        :param hands: Inference backend; `completed`, `in_flight` and `dropped` are read when it has them
+            (the Tasks LIVE_STREAM backend), otherwise every "infer" call counts as one inference.
+        :param processor: `HandsProcessor` whose hand tracks show confirmation progress.
+        :param clock: Time source in seconds, the same one used for frame timestamps.
+        :param process: Process whose CPU and RSS are shown; the current one by default.
+        """
+
+        self.pipeline = pipeline
+        self.hands = hands
+        self.processor = processor
+        self.clock = clock
+        self.process = process or psutil.Process(os.getpid())
+        # First cpu_percent call only starts the measurement
+        self.process.cpu_percent(None)
+        self._last_time = clock()
+        self._last_counts = self._counts()
+        self._last_stages = self._stage_totals()
+
+    def sample(self) -> HudSnapshot:
+        """Rates and latencies since the previous sample, plus the current process and confirmation state."""
+        now = self.clock()
+        elapsed = max(now - self._last_time, 1e-9)
+        counts, stages = self._counts(), self._stage_totals()
+        captured, inferred = (new - old for new, old in zip(counts, self._last_counts))
+
+        stage_ms = {}
+        for name, (calls, total) in stages.items():
+            old_calls, old_total = self._last_stages.get(name, (0, 0.0))
+            if calls > old_calls:
+                stage_ms[name] = (total - old_total) / (calls - old_calls) * 1000
+
+        self._last_time, self._last_counts, self._last_stages = now, counts, stages
+        return HudSnapshot(
+            capture_fps=captured / elapsed,
+            inference_fps=inferred / elapsed,
+            stage_ms=stage_ms,
+            queue_depth=getattr(self.hands, "in_flight", 0),
+            dropped=getattr(self.hands, "dropped", 0),
+            cpu_percent=self.process.cpu_percent(None),
+            rss=self.process.memory_info().rss,
+            gestures=self._progress(),
+            cooldown=max(self.processor.cooldown_until - now, 0.0) if self.processor else 0.0,
+        )
+
+    def _counts(self) -> Tuple[int, int]:
+        stats = self.pipeline.stats
+        captured = stats[self.pipeline.stages[0].name].calls if self.pipeline.stages else 0
+        if hasattr(self.hands, "completed"):
+            inferred = self.hands.completed
+        else:
+            inferred = stats["infer"].calls if "infer" in stats else 0
+        return captured, inferred
+
+    def _stage_totals(self) -> Dict[str, Tuple[int, float]]:
+        return {name: (stats.calls, stats.total) for name, stats in self.pipeline.stats.items()}
+
+    def _progress(self) -> List[GestureProgress]:
+        if self.processor is None:
+            return []
+        return [
+            GestureProgress(track.label, GESTURE_NAMES[track.gesture], min(track.score / GESTURE_THRESHOLD, 1.0))
+            for track in self.processor.tracker.tracks.values()
+            if track.gesture
+        ]
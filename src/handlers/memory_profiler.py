@@ -0,0 +1,164 @@
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+import psutil
+
+
+@dataclass
+class MemorySample:
+    frame: int
+    time: float
+    traced: int
+    rss: int
+
+
+class MemoryProfiler:
+    """
+    Opt-in memory instrumentation for long-running sessions.
+    Python allocations are traced with `tracemalloc`; every `interval` seconds a snapshot
+    is taken together with the process RSS, which also covers native buffers (OpenCV frames,
+    Qt images, MediaPipe graphs) that `tracemalloc` cannot see. Wrapping a pipeline stage
+    in `stage()` accumulates how much traced memory it grew and shrank by: a frame read in
+    "capture" and dropped in "display" shows up on both sides, while a leak grows one stage
+    without a matching release anywhere.
+    When disabled, every method is a no-op.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        interval: float = 10.0,
+        trace_frames: int = 5,
+        top: int = 15,
+        max_samples: int = 1000,
+    ):
+        self.enabled = enabled
+        self.interval = interval
+        self.trace_frames = trace_frames
+        self.top = top
+        self.max_samples = max_samples
+
+        self.frames = 0
+        self.samples: List[MemorySample] = []
+        self.stage_allocated: Dict[str, int] = {}
+        self.stage_released: Dict[str, int] = {}
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.latest: Optional[tracemalloc.Snapshot] = None
+        self._process = psutil.Process(os.getpid())
+        self._started_tracing = False
+        self._last_snapshot = float("-inf")
+
+    def start(self) -> "MemoryProfiler":
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracing = True
+        return self
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Attributes the change of traced memory during the wrapped code to a pipeline stage.
+        :param name: Stage name, e.g. "capture", "infer", "render".
+        """
+
+        if not self.enabled:
+            yield
+            return
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            delta = tracemalloc.get_traced_memory()[0] - before
+            totals = self.stage_allocated if delta >= 0 else self.stage_released
+            totals[name] = totals.get(name, 0) + abs(delta)
+
+    def tick(self, now: Optional[float] = None) -> None:
+        """
+        Counts a processed frame and takes a snapshot when the interval has passed.
+        :param now: Current time in seconds; the monotonic clock by default.
+        """
+
+        if not self.enabled:
+            return
+        self.frames += 1
+        now = time.monotonic() if now is None else now
+        if now - self._last_snapshot >= self.interval:
+            self._last_snapshot = now
+            self.snapshot(now)
+
+    def snapshot(self, now: Optional[float] = None) -> MemorySample:
+        """Takes a tracemalloc snapshot and records traced memory and RSS."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap>"))
+        )
+        if self.baseline is None:
+            self.baseline = snapshot
+        self.latest = snapshot
+
+        sample = MemorySample(
+            frame=self.frames,
+            time=time.monotonic() if now is None else now,
+            traced=tracemalloc.get_traced_memory()[0],
+            rss=self._process.memory_info().rss,
+        )
+        self.samples.append(sample)
+        if len(self.samples) > self.max_samples:
+            # Keep the first sample as the reference point and thin out the rest
+            self.samples = self.samples[:1] + self.samples[2::2]
+        return sample
+
+    def report(self) -> str:
+        """Formats RSS and traced memory growth, per-stage totals and the top allocation diffs."""
+        if not self.samples:
+            return "Memory profile: no samples"
+
+        first, last = self.samples[0], self.samples[-1]
+        lines = [
+            f"Memory profile: {self.frames} frames, {len(self.samples)} samples",
+            f"RSS:    {_mib(first.rss)} -> {_mib(last.rss)} ({_mib(last.rss - first.rss, sign=True)})",
+            f"Traced: {_mib(first.traced)} -> {_mib(last.traced)} ({_mib(last.traced - first.traced, sign=True)})",
+            "",
+            "Traced memory by stage (grown / released / net):",
+        ]
+        for name in sorted(set(self.stage_allocated) | set(self.stage_released)):
+            grown, released = self.stage_allocated.get(name, 0), self.stage_released.get(name, 0)
+            lines.append(f"  {name:<12} {_mib(grown)} / {_mib(released)} / {_mib(grown - released, sign=True)}")
+
+        if self.baseline is not None and self.latest is not self.baseline:
+            lines += ["", f"Top {self.top} allocation changes since the first snapshot:"]
+            for stat in self.latest.compare_to(self.baseline, "lineno")[: self.top]:
+                lines.append(f"  {stat}")
+
+        lines += ["", "frame,time,traced_bytes,rss_bytes"]
+        lines += [f"{s.frame},{s.time:.3f},{s.traced},{s.rss}" for s in self.samples]
+        return "\n".join(lines)
+
+    def write_report(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.report() + "\n")
+
+    def stop(self, report_path: str = "") -> None:
+        """
+        Takes a final snapshot, writes the report and stops tracing if this profiler started it.
+        :param report_path: Report file; nothing is written when empty.
+        """
+
+        if not self.enabled:
+            return
+        self.snapshot()
+        if report_path:
+            self.write_report(report_path)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def _mib(size: int, sign: bool = False) -> str:
+    return f"{size / 2 ** 20:{'+' if sign else ''}.2f} MiB"
@@ -0,0 +1,457 @@
+"""
+Composable frame pipeline shared by the command-line loop, the Qt window and offline tools.
+
+    source → preprocess → infer → classify → confirm → dispatch → control → render → sink
+
+A stage takes a `Frame`, fills in its part and returns it; returning None drops the frame.
+`Pipeline.run` chains the stages as generators over a frame source, `Pipeline.process` pushes
+one frame through them for callers driven by their own timer (the Qt window). Every stage,
+including the source, is timed individually and attributed in the memory profiler.
+"""
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import cv2
+import numpy as np
+
+from src.detection.landmarks import NUM_LANDMARKS, stack_landmarks
+from src.detection.overlay import LandmarkOverlay, fit_size
+from src.detection.zone import ActiveZone
+from src.event_log import log_event
+from src.handlers.hand_tracker import HandTrack
+from src.handlers.memory_profiler import MemoryProfiler
+from src.models import GESTURE_NAMES, GestureCode
+from src.settings.constants import CUE_CANDIDATE_FRAMES
+
+Size = Tuple[int, int]
+
+
+@dataclass
+class Frame:
+    """Everything the stages know about one captured frame."""
+
+    index: int
+    timestamp: float
+    # Captured BGR image
+    image: np.ndarray
+    # Inference input: the active zone of the image, in RGB
+    rgb: Optional[np.ndarray] = None
+    # MediaPipe-like results with landmarks in full-frame coordinates
+    results: Any = None
+    landmarks: np.ndarray = field(default_factory=lambda: np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32))
+    # False when the backend returned a result an earlier frame already consumed
+    fresh: bool = True
+    motion: Optional[GestureCode] = None
+    tracks: List[HandTrack] = field(default_factory=list)
+    # Gesture confirmed in this frame and what its action returned
+    gesture: Optional[GestureCode] = None
+    action: Optional[str] = None
+    # Image to show, possibly downscaled to the preview size
+    output: Optional[np.ndarray] = None
+    # Set by a sink to end `Pipeline.run`
+    stop: bool = False
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    total: float = 0.0
+    last: float = 0.0
+    maximum: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total += elapsed
+        self.last = elapsed
+        self.maximum = max(self.maximum, elapsed)
+
+
+class Stage(ABC):
+    """Base class of pipeline stages."""
+
+    name = "stage"
+
+    @abstractmethod
+    def __call__(self, frame: Frame) -> Optional[Frame]:
+        ...
+
+
+class FunctionStage(Stage):
+    """Turns a plain function of a frame into a named stage."""
+
+    def __init__(self, name: str, func: Callable[[Frame], Optional[Frame]]):
+        self.name = name
+        self.func = func
+
+    def __call__(self, frame: Frame) -> Optional[Frame]:
+        return self.func(frame)
+
+
+class Pipeline:
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        profiler: Optional[MemoryProfiler] = None,
+        timer: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        :param stages: Stages in processing order; names must be unique.
+        :param profiler: Memory profiler attributing allocations to stages; disabled when None.
+        :param timer: Clock used to time the stages.
+        """
+
+        self.stages = list(stages)
+        self.profiler = profiler or MemoryProfiler(enabled=False)
+        self.timer = timer
+        self.stats: Dict[str, StageStats] = {stage.name: StageStats() for stage in self.stages}
+
+    def stage(self, name: str) -> Stage:
+        return next(stage for stage in self.stages if stage.name == name)
+
+    def process(self, frame: Frame) -> Optional[Frame]:
+        """
+        Pushes one frame through all stages.
+        :param frame: Captured frame.
+        :return: The processed frame, or None if a stage dropped it.
+        """
+
+        timestamp = frame.timestamp
+        for stage in self.stages:
+            frame = self._call(stage, frame)
+            if frame is None:
+                break
+        self.profiler.tick(timestamp)
+        return frame
+
+    def run(self, source: Iterable[Frame], source_name: str = "source") -> Iterator[Frame]:
+        """
+        Chains the stages as generators over a source and yields the processed frames
+        until the source ends or a stage sets `Frame.stop`.
+        :param source: Iterable of captured frames, pulled lazily.
+        :param source_name: Name under which reading the source is timed.
+        """
+
+        stream = self._timed_source(iter(source), source_name)
+        for stage in self.stages:
+            stream = self._chain(stage, stream)
+        for frame in stream:
+            self.profiler.tick(frame.timestamp)
+            yield frame
+            if frame.stop:
+                break
+
+    def report(self) -> str:
+        lines = [f"{'stage':<12} {'calls':>8} {'mean ms':>9} {'max ms':>9}"]
+        for name, stats in self.stats.items():
+            lines.append(f"{name:<12} {stats.calls:>8} {stats.mean * 1000:>9.2f} {stats.maximum * 1000:>9.2f}")
+        return "\n".join(lines)
+
+    def _call(self, stage: Stage, frame: Frame) -> Optional[Frame]:
+        start = self.timer()
+        with self.profiler.stage(stage.name):
+            frame = stage(frame)
+        self.stats[stage.name].add(self.timer() - start)
+        return frame
+
+    def _chain(self, stage: Stage, stream: Iterator[Frame]) -> Iterator[Frame]:
+        for frame in stream:
+            frame = self._call(stage, frame)
+            if frame is not None:
+                yield frame
+
+    def _timed_source(self, source: Iterator[Frame], name: str) -> Iterator[Frame]:
+        stats = self.stats.setdefault(name, StageStats())
+        while True:
+            start = self.timer()
+            with self.profiler.stage(name):
+                frame = next(source, None)
+            stats.add(self.timer() - start)
+            if frame is None:
+                return
+            yield frame
+
+
+def capture_frames(capture, clock: Callable[[], float] = time.monotonic) -> Iterator[Frame]:
+    """
+    Reads frames from a `cv2.VideoCapture`-like object while it is open.
+    Failed reads are skipped, as cameras occasionally drop a frame.
+    :param capture: Opened capture.
+    :param clock: Source of frame timestamps in seconds.
+    """
+
+    index = 0
+    while capture.isOpened():
+        ok, image = capture.read()
+        if not ok:
+            continue
+        yield Frame(index, clock(), image)
+        index += 1
+
+
+class Preprocess(Stage):
+    """Optionally mirrors the frame and converts the active zone to RGB for inference."""
+
+    name = "preprocess"
+
+    def __init__(self, zone: Optional[ActiveZone] = None, mirror: bool = False):
+        self.zone = zone or ActiveZone()
+        self.mirror = mirror
+
+    def __call__(self, frame: Frame) -> Frame:
+        if self.mirror:
+            frame.image = cv2.flip(frame.image, 1)
+        frame.rgb = cv2.cvtColor(self.zone.crop(frame.image), cv2.COLOR_BGR2RGB)
+        return frame
+
+
+class Infer(Stage):
+    """
+    Finds hands with a MediaPipe Hands-like object and maps them back to the full frame.
+    With a stride above 1 only every n-th frame is inferred; the frames in between reuse its hands
+    and are not fresh. A result tagged with the `timestamp_ms` of the previous one (an asynchronous
+    backend that had nothing new) marks the frame as not fresh too.
+    """
+
+    name = "infer"
+
+    def __init__(self, hands, zone: Optional[ActiveZone] = None, stride: int = 1):
+        self.hands = hands
+        self.zone = zone or ActiveZone()
+        self.stride = stride
+        self._skipped = 0
+        self._last: Optional[Tuple[Any, np.ndarray]] = None
+        self._last_stamp: Optional[int] = None
+
+    def __call__(self, frame: Frame) -> Frame:
+        if self._last is not None and self._skipped + 1 < self.stride:
+            self._skipped += 1
+            frame.results, frame.landmarks = self._last
+            frame.fresh = False
+            return frame
+        size = (frame.image.shape[1], frame.image.shape[0])
+        results = self.hands.process(frame.rgb)
+        stamp = getattr(results, "timestamp_ms", None)
+        frame.fresh = stamp is None or stamp != self._last_stamp
+        self._last_stamp = stamp
+        frame.results = self.zone.map_results(results, size)
+        frame.landmarks = stack_landmarks(frame.results.multi_hand_landmarks or [])
+        self._skipped = 0
+        self._last = (frame.results, frame.landmarks)
+        return frame
+
+
+class Classify(Stage):
+    """
+    Classifies the hands and updates per-hand confirmation state (`HandsProcessor.classify`).
+    A frame that is not fresh is no new observation: it neither counts towards confirmation
+    nor enters the motion history, and only gets the current tracks.
+    """
+
+    name = "classify"
+
+    def __init__(self, processor):
+        self.processor = processor
+
+    def __call__(self, frame: Frame) -> Frame:
+        if not frame.fresh:
+            frame.motion, frame.tracks = None, self.processor.tracker.alive()
+            return frame
+        frame.motion, frame.tracks = self.processor.classify(
+            frame.landmarks, frame.results.multi_handedness, frame.timestamp
+        )
+        return frame
+
+
+class Confirm(Stage):
+    """Decides whether a gesture fires in this frame (`HandsProcessor.confirm`)."""
+
+    name = "confirm"
+
+    def __init__(self, processor):
+        self.processor = processor
+
+    def __call__(self, frame: Frame) -> Frame:
+        frame.gesture = self.processor.confirm(frame.motion, frame.tracks, frame.timestamp)
+        return frame
+
+
+class Dispatch(Stage):
+    """Calls the action of a confirmed gesture (`HandsProcessor.dispatch`)."""
+
+    name = "dispatch"
+
+    def __init__(self, processor):
+        self.processor = processor
+
+    def __call__(self, frame: Frame) -> Frame:
+        if frame.gesture:
+            log_event("gesture_detected", gesture=GESTURE_NAMES[frame.gesture])
+            frame.action = self.processor.dispatch(frame.gesture, frame.timestamp)
+        return frame
+
+
+class Control(Stage):
+    """Updates the continuous controls (`HandsProcessor.update_controls`)."""
+
+    name = "control"
+
+    def __init__(self, processor):
+        self.processor = processor
+
+    def __call__(self, frame: Frame) -> Frame:
+        if self.processor.controls:
+            self.processor.update_controls(frame.landmarks, frame.timestamp, frame.tracks)
+        return frame
+
+
+class Cues(Stage):
+    """
+    Plays a tick when a hand has held a gesture for `CUE_CANDIDATE_FRAMES` frames and a chime
+    when a gesture fires. The tick sounds once per track and is re-armed only after the track's
+    count falls back below the threshold, so flickering classification does not tick every frame.
+    """
+
+    name = "cues"
+
+    def __init__(self, player, candidate_frames: int = CUE_CANDIDATE_FRAMES):
+        self.player = player
+        self.candidate_frames = candidate_frames
+        # Labels of the tracks that already ticked for their current hold
+        self.ticked: Set[str] = set()
+
+    def __call__(self, frame: Frame) -> Frame:
+        started = False
+        holding = set()
+        for track in frame.tracks:
+            if track.gesture and track.count >= self.candidate_frames:
+                holding.add(track.label)
+                started |= track.label not in self.ticked
+        self.ticked = holding
+        if frame.gesture:
+            self.player.play("confirm")
+        elif started:
+            self.player.play("candidate")
+        return frame
+
+
+class Render(Stage):
+    """
+    Draws landmarks, the active zone and optionally the fired gesture.
+    With `at_preview` the frame is downscaled first and the overlay drawn at preview size.
+    """
+
+    name = "render"
+
+    def __init__(
+        self,
+        overlay: Optional[LandmarkOverlay] = None,
+        zone: Optional[ActiveZone] = None,
+        bounds: Union[None, Size, Callable[[], Optional[Size]]] = None,
+        at_preview: bool = True,
+        show_gesture: bool = False,
+        interpolation: int = cv2.INTER_AREA,
+        due: Optional[Callable[[Frame], bool]] = None,
+    ):
+        """
+        :param overlay: Landmark overlay; a disabled one draws nothing.
+        :param zone: Active zone to outline.
+        :param bounds: Preview bounds, or a function returning them for every frame (e.g. a widget size);
+            None keeps the captured size.
+        :param at_preview: Draw the overlay after downscaling instead of on the captured frame.
+        :param show_gesture: Write the name of the fired gesture on the frame.
+        :param interpolation: OpenCV interpolation used to downscale to the preview size.
+        :param due: Tells whether a frame is shown at all; frames it rejects are passed on
+            without an output image, so nobody pays for rendering a preview nobody sees.
+        """
+
+        self.overlay = overlay or LandmarkOverlay(enabled=False)
+        self.zone = zone or ActiveZone()
+        self.bounds = bounds
+        self.at_preview = at_preview
+        self.show_gesture = show_gesture
+        self.interpolation = interpolation
+        self.due = due
+
+    def __call__(self, frame: Frame) -> Frame:
+        if self.due is not None and not self.due(frame):
+            return frame
+        image = frame.image
+        bounds = self.bounds() if callable(self.bounds) else self.bounds
+        size = fit_size((image.shape[1], image.shape[0]), bounds) if bounds else None
+
+        if self.at_preview:
+            output = self.overlay.render(image, frame.landmarks, size, self.interpolation)
+        elif size:
+            output = cv2.resize(self.overlay.draw(image, frame.landmarks), size, interpolation=self.interpolation)
+        else:
+            output = self.overlay.draw(image, frame.landmarks)
+        self.zone.draw(output)
+
+        if self.show_gesture and frame.gesture:
+            cv2.putText(
+                output, f"Gesture: {GESTURE_NAMES[frame.gesture]}", (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2
+            )
+        frame.output = output
+        return frame
+
+
+class RecordClips(Stage):
+    """Buffers rendered frames and saves a clip around every fired gesture."""
+
+    name = "clips"
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def __call__(self, frame: Frame) -> Frame:
+        self.recorder.push(frame.output)
+        if frame.gesture:
+            self.recorder.trigger(GESTURE_NAMES[frame.gesture])
+        return frame
+
+
+class Display(Stage):
+    """Shows the rendered frame with an OpenCV-like sink and stops on 'q'."""
+
+    name = "display"
+
+    def __init__(self, sink=cv2, window: str = "Hand Recognition"):
+        self.sink = sink
+        self.window = window
+
+    def __call__(self, frame: Frame) -> Frame:
+        self.sink.imshow(self.window, frame.output)
+        if self.sink.waitKey(1) & 0xFF == ord("q"):
+            frame.stop = True
+        return frame
+
+
+def recognition_stages(
+    processor,
+    hands,
+    zone: Optional[ActiveZone] = None,
+    mirror: bool = False,
+) -> List[Stage]:
+    """
+    The stages every assembly shares: preprocess → infer → classify → confirm → dispatch → control.
+    :param processor: `HandsProcessor` holding confirmation state and actions.
+    :param hands: MediaPipe Hands-like object.
+    :param zone: Active zone; the whole frame when None.
+    :param mirror: Mirror frames before inference, as a selfie view does.
+    """
+
+    zone = zone or ActiveZone()
+    return [
+        Preprocess(zone, mirror=mirror),
+        Infer(hands, zone),
+        Classify(processor),
+        Confirm(processor),
+        Dispatch(processor),
+        Control(processor),
+    ]
@@ -0,0 +1,155 @@
+"""
+Stand-ins for the camera, MediaPipe Hands and the display window, so the whole
+recognition loop can run headless, deterministically and faster than real time.
+"""
+import os
+from types import SimpleNamespace
+from typing import Iterable, List, Optional, Sequence, Union
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class FakeVideoCapture:
+    """
+    `cv2.VideoCapture` replacement serving frames from arrays, an image directory or a video file.
+    Time is simulated: `clock()` returns the timestamp of the last frame read at the configured FPS.
+    """
+
+    def __init__(self, source: Union[str, Sequence[np.ndarray]], fps: float = 30.0, loop: bool = False):
+        if isinstance(source, str):
+            source = _load_frames(source)
+        self.frames = list(source)
+        self.fps = fps
+        self.loop = loop
+        self.index = 0
+        self.opened = bool(self.frames)
+        self.props = {cv2.CAP_PROP_FPS: fps}
+        if self.frames:
+            height, width = self.frames[0].shape[:2]
+            self.props[cv2.CAP_PROP_FRAME_WIDTH] = width
+            self.props[cv2.CAP_PROP_FRAME_HEIGHT] = height
+        self.props[cv2.CAP_PROP_FOURCC] = cv2.VideoWriter_fourcc(*"MJPG")
+
+    def isOpened(self) -> bool:
+        return self.opened
+
+    def read(self):
+        if not self.opened:
+            return False, None
+        if self.index >= len(self.frames):
+            if not self.loop:
+                self.opened = False
+                return False, None
+        frame = self.frames[self.index % len(self.frames)]
+        self.index += 1
+        # A real capture returns a fresh buffer for every frame
+        return True, frame.copy()
+
+    def clock(self) -> float:
+        return self.index / self.fps
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self.clock() * 1000
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.index)
+        return float(self.props.get(prop, 0))
+
+    def set(self, prop: int, value: float) -> bool:
+        # Frames are prerecorded, so the format cannot be renegotiated
+        return False
+
+    def release(self) -> None:
+        self.opened = False
+
+
+def _load_frames(path: str) -> List[np.ndarray]:
+    if os.path.isdir(path):
+        names = sorted(name for name in os.listdir(path) if name.lower().endswith(IMAGE_EXTENSIONS))
+        return [cv2.imread(os.path.join(path, name)) for name in names]
+
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def make_results(hands: Optional[np.ndarray], labels: Optional[Sequence[str]] = None, score: float = 0.95):
+    """
+    Builds an object shaped like the result of `mp.solutions.hands.Hands.process`.
+    :param hands: Array of shape (N, 21, 3) with normalized landmarks, or None for no hands.
+    :param labels: Handedness of every hand, defaults to "Right", "Left", ...
+    :param score: Handedness score of every hand.
+    :return: Object with `multi_hand_landmarks` and `multi_handedness`.
+    """
+
+    if hands is None or len(hands) == 0:
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+    labels = labels or [("Right", "Left")[i % 2] for i in range(len(hands))]
+    landmarks = [
+        SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in hand])
+        for hand in hands
+    ]
+    handedness = [
+        SimpleNamespace(classification=[SimpleNamespace(index=i, label=label, score=score)])
+        for i, label in enumerate(labels)
+    ]
+    return SimpleNamespace(multi_hand_landmarks=landmarks, multi_handedness=handedness)
+
+
+class FakeHands:
+    """
+    `mp.solutions.hands.Hands` replacement returning scripted results, one per `process` call.
+    Script entries are (N, 21, 3) landmark arrays, None for frames without hands,
+    or ready-made results from `make_results`.
+    """
+
+    def __init__(self, script: Iterable, loop: bool = False):
+        self.script = [entry if hasattr(entry, "multi_hand_landmarks") else make_results(entry) for entry in script]
+        self.loop = loop
+        self.calls = 0
+
+    def process(self, image: np.ndarray):
+        index = self.calls
+        self.calls += 1
+        if index >= len(self.script):
+            if not self.loop or not self.script:
+                return make_results(None)
+            index %= len(self.script)
+        return self.script[index]
+
+    def close(self) -> None:
+        pass
+
+
+class HeadlessSink:
+    """
+    Replacement for the `cv2.imshow` / `cv2.waitKey` display. Counts frames and keeps the last one.
+    `quit_after` makes `waitKey` report 'q' after that many frames, like a user closing the window.
+    """
+
+    def __init__(self, quit_after: Optional[int] = None):
+        self.quit_after = quit_after
+        self.frames_shown = 0
+        self.last_frame: Optional[np.ndarray] = None
+
+    def imshow(self, name: str, frame: np.ndarray) -> None:
+        self.frames_shown += 1
+        self.last_frame = frame
+
+    def waitKey(self, delay: int = 0) -> int:
+        if self.quit_after is not None and self.frames_shown >= self.quit_after:
+            return ord("q")
+        return -1
+
+    def destroyAllWindows(self) -> None:
+        pass
@@ -1,4 +1,45 @@
+"""
+Runs gesture recognition on a camera and calls the mapped actions.
+Capture format options override the defaults in Settings; 0 or "" keeps the driver default.
+"""
+import argparse
+from dataclasses import replace
+from typing import Optional, Sequence
+
 from src.handlers.camera_handler import process_video
+from src.settings.config import Settings
+
+
+def parse_settings(argv: Optional[Sequence[str]] = None, settings: Optional[Settings] = None) -> Settings:
+    """
+    Builds Settings from the command line.
+    :param argv: Arguments without the program name; sys.argv when None.
+    :param settings: Defaults to override.
+    :return: The defaults with the given options applied.
+    """
+
+    settings = settings or Settings()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--camera", type=int, default=settings.camera_index, help="camera index")
+    parser.add_argument("--width", type=int, default=settings.frame_width, help="capture width in pixels")
+    parser.add_argument("--height", type=int, default=settings.frame_height, help="capture height in pixels")
+    parser.add_argument("--fps", type=int, default=settings.fps, help="capture frame rate")
+    parser.add_argument("--fourcc", default=settings.fourcc, help="capture pixel format, e.g. MJPG or YUYV")
+    args = parser.parse_args(argv)
+
+    return replace(
+        settings,
+        camera_index=args.camera,
+        frame_width=args.width,
+        frame_height=args.height,
+        fps=args.fps,
+        fourcc=args.fourcc,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    process_video(parse_settings(argv))
+
 
 if __name__ == "__main__":
-    process_video()
+    main()
@@ -1,4 +1,5 @@
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import Any, Dict, Tuple
 
 
 class GestureSet(str, Enum):
@@ -8,8 +9,99 @@ class GestureSet(str, Enum):
     STOP = "is_stop"
     OKAY = "is_okay"
 
+    # Single hand motion
+    SWIPE_LEFT = "is_swipe_left"
+    SWIPE_RIGHT = "is_swipe_right"
+    SWIPE_UP = "is_swipe_up"
+    SWIPE_DOWN = "is_swipe_down"
+    CIRCLE = "is_circle"
+
     # Two hands
     TWO_LIKES = "is_two_likes"
     TWO_DISLIKES = "is_two_dislike"
     TWO_STOPS = "is_two_stops"
     TWO_OKAY = "is_two_okay"
+
+
+class GestureCode(IntEnum):
+    """
+    Compact gesture codes used inside the recognition pipeline.
+    Member names match GestureSet; names are translated to and from codes only at the
+    edges (UI mapping, logs, file names), so the per-frame path compares small ints.
+    """
+
+    NONE = 0
+
+    LIKE = 1
+    DISLIKE = 2
+    STOP = 3
+    OKAY = 4
+
+    SWIPE_LEFT = 5
+    SWIPE_RIGHT = 6
+    SWIPE_UP = 7
+    SWIPE_DOWN = 8
+    CIRCLE = 9
+
+    TWO_LIKES = 10
+    TWO_DISLIKES = 11
+    TWO_STOPS = 12
+    TWO_OKAY = 13
+
+
+# Gesture name by code; NONE has an empty name
+GESTURE_NAMES: Tuple[str, ...] = ("",) + tuple(GestureSet[code.name].value for code in list(GestureCode)[1:])
+
+# Two-hand gesture formed when both hands show the same single-hand gesture
+_SAME_GESTURE_PAIRS = {
+    GestureCode.LIKE: GestureCode.TWO_LIKES,
+    GestureCode.DISLIKE: GestureCode.TWO_DISLIKES,
+    GestureCode.STOP: GestureCode.TWO_STOPS,
+    GestureCode.OKAY: GestureCode.TWO_OKAY,
+}
+
+# Combined code of two hands, indexed [left][right]
+PAIR_CODES: Tuple[Tuple[GestureCode, ...], ...] = tuple(
+    tuple(_SAME_GESTURE_PAIRS.get(left, GestureCode.NONE) if left == right else GestureCode.NONE for right in GestureCode)
+    for left in GestureCode
+)
+
+TWO_HAND_CODES = frozenset(code for row in PAIR_CODES for code in row if code)
+
+# Code by name, including the "<left> <right>" names of two-hand combinations
+GESTURE_CODES: Dict[str, GestureCode] = {name: GestureCode(code) for code, name in enumerate(GESTURE_NAMES) if name}
+GESTURE_CODES.update(
+    {
+        f"{GESTURE_NAMES[left]} {GESTURE_NAMES[right]}": PAIR_CODES[left][right]
+        for left in GestureCode
+        for right in GestureCode
+        if PAIR_CODES[left][right]
+    }
+)
+
+
+def to_code(gesture) -> GestureCode:
+    """
+    Translates a gesture name or code coming from outside the pipeline.
+    :param gesture: GestureCode, int, gesture name such as "is_like" or "is_stop is_stop", or None.
+    :return: The gesture code; GestureCode.NONE for anything unknown.
+    """
+
+    if isinstance(gesture, GestureCode):
+        return gesture
+    if isinstance(gesture, str):
+        return GESTURE_CODES.get(gesture, GestureCode.NONE)
+    if isinstance(gesture, int) and not isinstance(gesture, bool) and 0 <= gesture < len(GESTURE_NAMES):
+        return GestureCode(gesture)
+    return GestureCode.NONE
+
+
+def code_table(mapping: Dict[GestureCode, Any], default: Any = None) -> Tuple[Any, ...]:
+    """
+    Builds a lookup table indexed by gesture code.
+    :param mapping: Values for some of the codes.
+    :param default: Value for the other codes.
+    :return: Tuple with one entry per GestureCode.
+    """
+
+    return tuple(mapping.get(code, default) for code in GestureCode)
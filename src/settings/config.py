@@ -1,7 +1,113 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
 
 
 @dataclass
 class Settings:
     camera_index: int = 0
     debug: bool = True
+
+    # Cameras probed in the background at start-up (and released again). With keep_camera_warm a
+    # stopped camera stays open for a quick restart, for at most camera_warm_seconds (0: until exit)
+    camera_probe_count: int = 4
+    keep_camera_warm: bool = False
+    camera_warm_seconds: float = 60.0
+
+    # Requested capture format; 0 / "" keeps the driver default
+    frame_width: int = 640
+    frame_height: int = 480
+    fps: int = 30
+    fourcc: str = "MJPG"
+
+    # Landmark overlay; at_preview draws on the downscaled preview instead of the captured frame
+    draw_overlay: bool = True
+    overlay_at_preview: bool = True
+    preview_width: int = 0
+    # Highest preview frame rate in the window, capped by the display refresh rate; 0 uses the
+    # refresh rate. Recognition runs at the camera rate regardless
+    preview_max_fps: float = 0.0
+
+    # Resource governor: steps quality down while a frame takes longer than governor_budget_ms or
+    # the process uses more than governor_max_cpu percent of all cores, and back up once both stay
+    # under governor_recover of their limits; evaluated every governor_interval seconds
+    governor: bool = False
+    governor_budget_ms: float = 33.0
+    governor_max_cpu: float = 80.0
+    governor_recover: float = 0.6
+    governor_interval: float = 1.0
+
+    # Audio cues: a tick when a hand starts holding a gesture and a chime when one fires, mixed
+    # from buffers prepared at startup into one persistent output stream; audio_device "" is
+    # the default output, "null" discards the sound (tests, headless runs)
+    audio_cues: bool = False
+    audio_device: str = ""
+    audio_volume: float = 0.3
+
+    # Performance HUD in the mapper window, refreshed every hud_interval seconds
+    show_hud: bool = False
+    hud_interval: float = 0.5
+
+    # Clips around fired gestures; empty clip_dir disables recording, jpeg quality 0 keeps raw frames
+    clip_dir: str = ""
+    clip_pre_seconds: float = 3.0
+    clip_post_seconds: float = 2.0
+    clip_jpeg_quality: int = 0
+
+    # Action backend: "auto", "macos", "linux" or "dry-run"
+    action_backend: str = "auto"
+    action_workers: int = 1
+    action_timeout: float = 10.0
+    # Seconds between snapshots of the running processes used to skip launching running
+    # apps; 0 disables the check and every trigger launches its app
+    process_refresh_interval: float = 2.0
+
+    # Structured event log; empty path writes JSONL to stdout
+    event_log_path: str = ""
+    event_log_max_bytes: int = 1_000_000
+    event_log_backups: int = 3
+    event_log_rate_limit: float = 1.0
+
+    # Opt-in memory profiling (tracemalloc + RSS snapshots every interval seconds), report written on exit
+    memory_profile: bool = False
+    memory_profile_interval: float = 60.0
+    memory_report_path: str = "memory_report.txt"
+
+    # Active zone (left, top, right, bottom) in normalized frame coordinates; frames are cropped
+    # to it before inference, so hands outside it are ignored
+    active_zone: Tuple[float, float, float, float] = (0.0, 0.0, 1.0, 1.0)
+
+    # Landmark inference: "solutions" (legacy mp.solutions.hands, synchronous) or "tasks"
+    # (HandLandmarker from a local .task model; "live_stream" overlaps capture and inference,
+    # "video" processes every frame synchronously)
+    inference_backend: str = "solutions"
+    hand_landmarker_model: str = "models/hand_landmarker.task"
+    landmarker_mode: str = "live_stream"
+
+    # Hands detected per frame; drops to 1 while no two-hand gesture has an action
+    max_num_hands: int = 2
+
+    # Early rejection of unreliable hands and confidence-weighted confirmation:
+    # a frame counts fully towards confirmation at confidence_full and proportionally below it
+    min_handedness_score: float = 0.5
+    min_landmark_quality: float = 0.5
+    confidence_full: float = 0.9
+
+    # Gesture sequence macros: "is_like > is_stop" -> action key ("open_photos", "turn_music", ...),
+    # run in addition to the actions of the gestures in the sequence;
+    # each gesture must be confirmed within macro_timeout seconds of the previous one, which
+    # has to exceed the action cooldown, as no two gestures are confirmed closer than that
+    macros: Dict[str, str] = field(default_factory=dict)
+    macro_timeout: float = 3.0
+
+    # Continuous controls: channel ("pinch") -> target ("volume" or "scroll"). The channel
+    # value is smoothed (control_smoothing is the weight of the newest frame), changes below
+    # control_deadband are ignored and at most control_rate commands per second are sent
+    controls: Dict[str, str] = field(default_factory=dict)
+    control_smoothing: float = 0.3
+    control_deadband: float = 0.02
+    control_rate: float = 10.0
+
+    # Landmark classifier: "rules" (hand-tuned thresholds) or "mlp" (trained weights)
+    classifier: str = "rules"
+    classifier_weights: str = "models/gesture_mlp.npz"
+    classifier_threshold: float = 0.6
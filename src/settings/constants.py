@@ -1,5 +1,11 @@
 GESTURE_THRESHOLD = 50
 DELAY_SECONDS = 10
+ACTION_COOLDOWN_SECONDS = 2
+
+# Consecutive resource governor evaluations over budget before quality steps down,
+# and comfortably under it before quality steps back up
+GOVERNOR_DOWN_AFTER = 2
+GOVERNOR_UP_AFTER = 5
 
 FINGER_TIPS = [4, 8, 12, 16, 20]
 FINGER_BASES = [2, 5, 9, 13, 17]
@@ -7,3 +13,38 @@ FINGER_BASES = [2, 5, 9, 13, 17]
 THUMB_TIP = 4
 THUMB_BASE = 2
 INDEX_TIP = 8
+
+# Wrist to middle finger base distance below which a hand is too small (far or partial) to classify reliably
+MIN_PALM_SIZE = 0.05
+
+# How many consecutive frames a hand may be missing before its tracking state is dropped
+HAND_DROPOUT_FRAMES = 3
+
+# Farthest a wrist may move between frames and still be matched to the same hand when handedness cannot tell hands apart
+HAND_MATCH_DISTANCE = 0.15
+
+# Frames a hand must hold the same gesture before the candidate cue ticks, once per hold
+CUE_CANDIDATE_FRAMES = 3
+
+# Widest thumb to index tip distance, in palm sizes, that still counts as a pinch rather than a spread hand
+PINCH_MAX_SPREAD = 1.8
+
+# Dynamic (motion) gestures. Distances are in normalized image coordinates.
+MOTION_HISTORY_SIZE = 30
+MOTION_MIN_STEP = 0.004
+# A bigger jump between consecutive samples, or a longer gap between them, is not motion of the same
+# hand (it reappeared elsewhere or its identity swapped with another hand), so the history restarts
+MOTION_MAX_STEP = 0.12
+MOTION_MAX_GAP = 0.25
+SWIPE_WINDOW = 8
+SWIPE_MIN_DISTANCE = 0.25
+SWIPE_MIN_STRAIGHTNESS = 0.8
+SWIPE_MIN_SAMPLES = 4
+# Duration in seconds and mean speed in frame widths per second of a swipe
+SWIPE_MIN_DURATION = 0.08
+SWIPE_MAX_DURATION = 0.6
+SWIPE_MIN_SPEED = 0.6
+SWIPE_MAX_SPEED = 4.0
+CIRCLE_MIN_TURN = 5.5
+CIRCLE_MIN_PATH = 0.4
+CIRCLE_MAX_CLOSURE = 0.35
@@ -0,0 +1,179 @@
+"""
+Measures the throughput of the gesture classifiers on synthetic hands and reports where they disagree.
+
+    python -m src.tools.benchmark_classifiers --count 2000 --rotation 25 --noise 0.005 --occlusion 0.05
+    python -m src.tools.benchmark_classifiers --weights models/gesture_mlp.npz
+"""
+import argparse
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.detection.classifiers import NO_GESTURE_LABEL, MLPClassifier, train_mlp
+from src.detection.rules import classify_pip_rules, classify_rules
+from src.detection.synthetic import POSES, generate_dataset
+from src.models import GESTURE_NAMES
+from src.handlers.pipeline import Classify, Frame
+from src.handlers.simulation import make_results
+
+# Takes landmarks of shape (N, 21, 3) and returns N gesture names or codes, or None
+BatchClassifier = Callable[[np.ndarray], List[Optional[str]]]
+
+
+class PerHandClassifier:
+    """
+    Adapts a classifier of one MediaPipe-like hand to the benchmark. It is fed landmark objects
+    instead of an array; they are built before timing starts, as the camera loop gets them
+    from MediaPipe for free.
+    """
+
+    def __init__(self, classify_hand: Callable[[Any], Union[None, int, str]]):
+        self.classify_hand = classify_hand
+
+    def __call__(self, hands: List) -> List[Union[None, int, str]]:
+        return [self.classify_hand(hand) for hand in hands]
+
+
+class PipelineClassifier:
+    """
+    Feeds every hand as a frame of its own to the pipeline's Classify stage, so the benchmark
+    covers the per-frame work of the real recognition path: early rejection, confidence
+    weighting, tracking and motion history. A hand rejected as unreliable counts as no gesture.
+    """
+
+    def __init__(self, processor):
+        self.classify = Classify(processor)
+        self._image = np.zeros((1, 1, 3), dtype=np.uint8)
+        self._results = SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+        self._index = 0
+
+    def __call__(self, landmarks: np.ndarray) -> List[Optional[int]]:
+        predicted = []
+        for i in range(len(landmarks)):
+            self._index += 1
+            frame = Frame(self._index, self._index / 30, self._image, results=self._results, landmarks=landmarks[i:i + 1])
+            track = next((track for track in self.classify(frame).tracks if not track.missed), None)
+            predicted.append(track.gesture if track else None)
+        return predicted
+
+
+def rule_classifiers() -> Dict[str, BatchClassifier]:
+    """
+    Wraps the per-hand rule classifier of `HandsProcessor` and the pipeline's Classify stage as
+    batch classifiers, next to the vectorized rules run on a whole frame.
+    Conversion to MediaPipe-like landmark objects happens before timing starts, as the camera
+    loop gets them from MediaPipe for free.
+    """
+
+    from src.handlers import HandsProcessor
+    from src.settings.config import Settings
+
+    settings = Settings(action_backend="dry-run")
+    return {
+        "HandsProcessor": PerHandClassifier(HandsProcessor(settings).classify_single_hand),
+        "pipeline (classify)": PipelineClassifier(HandsProcessor(settings)),
+        "rules (batch)": classify_rules,
+        "PIP rules (batch)": classify_pip_rules,
+    }
+
+
+def run_benchmark(
+    classifiers: Dict[str, Union[BatchClassifier, PerHandClassifier]], landmarks: np.ndarray, repeat: int = 1
+) -> Dict[str, Tuple[np.ndarray, float]]:
+    """
+    Classifies all hands with every classifier.
+    :param classifiers: Classifiers by name.
+    :param landmarks: Array of shape (N, 21, 3).
+    :param repeat: Number of timed runs; the fastest one is reported.
+    :return: Predictions (None replaced by "none") and hands per second for every classifier.
+    """
+
+    objects = None
+    results = {}
+    for name, classify in classifiers.items():
+        if isinstance(classify, PerHandClassifier):
+            if objects is None:
+                objects = make_results(landmarks).multi_hand_landmarks or []
+            hands = objects
+        else:
+            hands = landmarks
+
+        best = float("inf")
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            predicted = classify(hands)
+            best = min(best, time.perf_counter() - start)
+        # Names are produced only here, for the report
+        predicted = np.array([
+            (GESTURE_NAMES[p] if isinstance(p, (int, np.integer)) else p) or NO_GESTURE_LABEL for p in predicted
+        ])
+        results[name] = predicted, len(landmarks) / best if best > 0 else float("inf")
+    return results
+
+
+def disagreements(predictions: Dict[str, np.ndarray], labels: np.ndarray) -> Dict[Tuple[str, str], Counter]:
+    """
+    Counts, for every pair of classifiers, the samples they classify differently.
+    :param predictions: Predicted labels by classifier name.
+    :param labels: True labels.
+    :return: For every pair of names, a Counter of (true label, first prediction, second prediction).
+    """
+
+    names = list(predictions)
+    report = {}
+    for i, first in enumerate(names):
+        for second in names[i + 1:]:
+            differ = predictions[first] != predictions[second]
+            report[first, second] = Counter(
+                zip(labels[differ], predictions[first][differ], predictions[second][differ])
+            )
+    return report
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000, help="samples per pose")
+    parser.add_argument("--rotation", type=float, default=15.0, help="maximum in-plane rotation, degrees")
+    parser.add_argument("--scale", type=float, nargs=2, default=(0.8, 1.2), help="hand size range")
+    parser.add_argument("--translation", type=float, default=0.1, help="maximum hand shift")
+    parser.add_argument("--noise", type=float, default=0.003, help="landmark jitter standard deviation")
+    parser.add_argument("--occlusion", type=float, default=0.0, help="probability of a landmark being occluded")
+    parser.add_argument("--weights", help="MLP weights; trained on a separate synthetic set when omitted")
+    parser.add_argument("--no-mlp", action="store_true", help="benchmark only the rule-based classifiers")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per classifier")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    variation = dict(
+        rotation=args.rotation, scale=tuple(args.scale), translation=args.translation,
+        noise=args.noise, occlusion=args.occlusion,
+    )
+    landmarks, labels = generate_dataset(args.count, seed=args.seed, **variation)
+
+    classifiers = rule_classifiers()
+    if not args.no_mlp:
+        if args.weights:
+            mlp = MLPClassifier.load(args.weights)
+        else:
+            train_x, train_y = generate_dataset(200, seed=args.seed + 1, **variation)
+            mlp = train_mlp(train_x, train_y, hidden_size=32, epochs=300, seed=args.seed)
+        classifiers["MLP"] = lambda hands: mlp.classify_codes(hands)[0]
+
+    results = run_benchmark(classifiers, landmarks, repeat=args.repeat)
+    print(f"{len(labels)} hands, poses: {', '.join(POSES)}")
+    for name, (predicted, rate) in results.items():
+        print(f"{name:>16}: {rate:>12,.0f} hands/s, accuracy {np.mean(predicted == labels):.3f}")
+
+    report = disagreements({name: predicted for name, (predicted, _) in results.items()}, labels)
+    for (first, second), counts in report.items():
+        total = sum(counts.values())
+        print(f"\n{first} vs {second}: {total} disagreements ({total / len(labels):.1%})")
+        for (label, a, b), n in counts.most_common(10):
+            print(f"  {n:>6}  true {label:<12} {first}={a:<12} {second}={b}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Records labeled hand landmarks from the camera for classifier training.
+
+    python -m src.tools.record_landmarks --label is_like --out recordings/like.npz
+    python -m src.tools.record_landmarks --label is_like --out like.npz --backend tasks --model hand_landmarker.task
+"""
+import argparse
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from src.detection.landmarker import VIDEO, create_hands
+from src.handlers.pipeline import Display, Frame, FunctionStage, Infer, Pipeline, Preprocess, capture_frames
+from src.settings.config import Settings
+
+
+def record(
+    label: str,
+    out: str,
+    count: int,
+    camera_index: int,
+    capture=None,
+    hands=None,
+    sink=cv2,
+    settings: Optional[Settings] = None,
+) -> int:
+    """
+    Captures frames until `count` single-hand samples are collected or 'q' is pressed.
+    :param label: Gesture name stored with every sample ("none" for negatives).
+    :param out: Output `.npz` path.
+    :param count: Number of samples to collect.
+    :param camera_index: Camera to read from.
+    :param capture: Opened `cv2.VideoCapture`-like object instead of the camera.
+    :param hands: MediaPipe Hands-like object; a single-hand detector of the configured backend
+        is created when None, in VIDEO mode for the "tasks" backend so that no frame is skipped.
+    :param sink: Display with `imshow`, `waitKey` and `destroyAllWindows`.
+    :param settings: Application settings choosing the inference backend.
+    :return: Number of recorded samples.
+    """
+
+    cap = capture or cv2.VideoCapture(camera_index)
+    hands = hands or create_hands(settings or Settings(), 1, mode=VIDEO)
+    samples = []
+
+    def collect(frame: Frame) -> Frame:
+        if len(frame.landmarks):
+            samples.append(frame.landmarks[0])
+        frame.stop = len(samples) >= count
+        frame.output = frame.image
+        cv2.putText(frame.output, f"{label}: {len(samples)}/{count}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+        return frame
+
+    pipeline = Pipeline([Preprocess(), Infer(hands), FunctionStage("collect", collect), Display(sink, "Recording")])
+    for _ in pipeline.run(capture_frames(cap), source_name="capture"):
+        pass
+
+    cap.release()
+    sink.destroyAllWindows()
+    hands.close()
+
+    landmarks = np.stack(samples) if samples else np.empty((0, 21, 3), dtype=np.float32)
+    np.savez(out, landmarks=landmarks, labels=np.array([label] * len(samples)))
+    return len(samples)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--label", required=True, help="gesture name, e.g. is_like, or 'none' for negatives")
+    parser.add_argument("--out", required=True, help="output .npz file")
+    parser.add_argument("--count", type=int, default=300, help="number of samples to record")
+    parser.add_argument("--camera", type=int, default=Settings().camera_index, help="camera index")
+    parser.add_argument("--backend", choices=("solutions", "tasks"), default=Settings().inference_backend)
+    parser.add_argument("--model", default=Settings().hand_landmarker_model, help="HandLandmarker .task file")
+    args = parser.parse_args(argv)
+
+    settings = Settings(camera_index=args.camera, inference_backend=args.backend, hand_landmarker_model=args.model)
+    recorded = record(args.label, args.out, args.count, args.camera, settings=settings)
+    print(f"Saved {recorded} samples to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
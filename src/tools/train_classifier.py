@@ -0,0 +1,61 @@
+"""
+Trains the landmark MLP classifier from recordings made with record_landmarks.
+
+    python -m src.tools.train_classifier recordings/*.npz --out models/gesture_mlp.npz
+"""
+import argparse
+from typing import List, Tuple
+
+import numpy as np
+
+from src.detection.classifiers import train_mlp
+from src.settings.config import Settings
+
+
+def load_recordings(paths: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenates several recordings into one dataset.
+    :param paths: `.npz` files with `landmarks` (N, 21, 3) and `labels` (N,) arrays.
+    :return: Landmarks and labels.
+    """
+
+    landmarks, labels = [], []
+    for path in paths:
+        with np.load(path, allow_pickle=False) as data:
+            landmarks.append(data["landmarks"].astype(np.float32))
+            labels.append(data["labels"].astype(str))
+    return np.concatenate(landmarks), np.concatenate(labels)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", nargs="+", help="recorded .npz files")
+    parser.add_argument("--out", default=Settings().classifier_weights, help="output weights file")
+    parser.add_argument("--hidden", type=int, default=32, help="hidden layer size, 0 for a linear model")
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--lr", type=float, default=0.01)
+    parser.add_argument("--val-split", type=float, default=0.2, help="fraction of samples held out for validation")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    landmarks, labels = load_recordings(args.recordings)
+    order = np.random.default_rng(args.seed).permutation(len(labels))
+    landmarks, labels = landmarks[order], labels[order]
+    split = int(len(labels) * (1 - args.val_split))
+
+    classifier = train_mlp(
+        landmarks[:split], labels[:split], hidden_size=args.hidden, epochs=args.epochs, learning_rate=args.lr, seed=args.seed
+    )
+    classifier.threshold = 0.0
+
+    for name, x, y in (("train", landmarks[:split], labels[:split]), ("val", landmarks[split:], labels[split:])):
+        if len(y):
+            predicted = np.array([p or "none" for p in classifier.classify_batch(x)])
+            print(f"{name} accuracy: {np.mean(predicted == y):.3f} ({len(y)} samples)")
+
+    classifier.save(args.out)
+    print(f"Saved weights to {args.out} (labels: {', '.join(classifier.labels)})")
+
+
+if __name__ == "__main__":
+    main()
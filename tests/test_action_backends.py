@@ -0,0 +1,120 @@
+import sys
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from src.actions import ActionBackend, DryRunBackend, LinuxBackend, MacOSBackend, SingleHandActions, TwoHandsActions, create_backend
+from src.actions import backends
+from src.actions.backends import CommandPool, CommandResult
+from src.settings.config import Settings
+
+
+class _RecordingPool:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, argv, timeout=None, detach=False):
+        self.submitted.append(argv)
+        future = Future()
+        future.set_result(CommandResult(argv, returncode=0))
+        return future
+
+
+@pytest.fixture
+def pool():
+    pool = CommandPool(size=2, timeout=5.0)
+    yield pool
+    pool.close()
+
+
+def test_pool_runs_commands(pool):
+    assert pool.submit([sys.executable, "-c", "pass"]).result(timeout=10).ok
+    result = pool.submit([sys.executable, "-c", "import sys; sys.exit(3)"]).result(timeout=10)
+    assert result.returncode == 3 and not result.ok
+
+
+def test_pool_reports_timeout(pool):
+    result = pool.submit([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.2).result(timeout=10)
+    assert result.error == "timeout"
+
+
+def test_pool_reports_missing_command(pool):
+    result = pool.submit(["definitely-not-a-command-xyz"]).result(timeout=10)
+    assert result.error and not result.ok
+    result = pool.submit(["definitely-not-a-command-xyz"], detach=True).result(timeout=10)
+    assert result.error and not result.ok
+
+
+def test_detached_launch_is_not_timed_out(pool, tmp_path):
+    # Приложение работает дольше таймаута: ответ приходит сразу после запуска, а процесс не убивается
+    marker = tmp_path / "alive"
+    script = f"import time, pathlib; time.sleep(1.5); pathlib.Path({str(marker)!r}).write_text('ok')"
+    result = pool.submit([sys.executable, "-c", script], timeout=0.2, detach=True).result(timeout=5)
+    assert result.ok and not marker.exists()
+    deadline = time.monotonic() + 10
+    while not marker.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert marker.read_text() == "ok"
+
+
+def test_pool_reuses_and_restarts_helpers(pool):
+    pool.warm_up()
+    first = pool._helpers[0].process.pid
+    pool.submit([sys.executable, "-c", "pass"]).result(timeout=10)
+    assert pool._helpers[0].process.pid == first
+
+    pool._helpers[0].process.kill()
+    pool._helpers[0].process.wait()
+    pool._helpers[0].reader.join(timeout=5)
+    results = [pool.submit([sys.executable, "-c", "pass"]).result(timeout=10) for _ in range(2)]
+    assert all(r.ok for r in results)
+    assert pool._helpers[0].process.pid != first
+
+
+def test_pool_survives_malformed_response(pool, tmp_path, monkeypatch):
+    # Помощник, который отвечает мусором на первый запрос
+    broken = tmp_path / "broken_helper.py"
+    broken.write_text("import sys\nsys.stdin.readline()\nprint('{not json', flush=True)\nsys.stdin.read()\n")
+    monkeypatch.setattr(backends, "HELPER_PATH", str(broken))
+    result = pool.submit([sys.executable, "-c", "pass"]).result(timeout=10)
+    assert result.error == "helper exited"
+    pool._helpers[1].reader.join(timeout=5)
+    assert not pool._helpers[1].alive
+
+    monkeypatch.undo()
+    assert pool.submit([sys.executable, "-c", "pass"]).result(timeout=10).ok
+
+
+def test_incomplete_backend_fails_on_construction():
+    class OpenOnly(ActionBackend):
+        def open_app(self, app):
+            return None
+
+    with pytest.raises(TypeError):
+        OpenOnly(_RecordingPool())
+
+
+def test_platform_commands():
+    mac_pool, linux_pool = _RecordingPool(), _RecordingPool()
+    MacOSBackend(mac_pool).open_app("Photos")
+    MacOSBackend(mac_pool).screenshot("/tmp/s.png")
+    LinuxBackend(linux_pool, apps={"Photos": ["xdg-open", "/pics"]}).open_app("Photos")
+    assert mac_pool.submitted == [["open", "-a", "Photos"], ["screencapture", "/tmp/s.png"]]
+    assert linux_pool.submitted == [["xdg-open", "/pics"]]
+
+
+def test_actions_use_backend():
+    backend = DryRunBackend()
+    assert SingleHandActions(backend).get_action("is_like") == "👍"
+    assert SingleHandActions(backend).get_action("is_okay") == "👌"
+    assert TwoHandsActions(backend).get_action("is_two_stops") == "🎵 Music opened"
+    assert [call[0] for call in backend.calls] == ["open_app", "screenshot", "activate_app"]
+    assert backend.calls[0] == ("open_app", "Photos")
+
+
+def test_create_backend():
+    assert isinstance(create_backend(Settings(action_backend="dry-run")), DryRunBackend)
+    assert isinstance(create_backend(Settings(action_backend="linux")), LinuxBackend)
+    with pytest.raises(ValueError):
+        create_backend(Settings(action_backend="windows"))
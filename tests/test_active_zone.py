@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from src.detection.synthetic import POSES
+from src.detection.zone import ActiveZone
+from src.handlers import HandsProcessor
+from src.handlers.camera_handler import process_video
+from src.handlers.pipeline import Frame, Infer, Preprocess
+from src.handlers.simulation import FakeHands, FakeVideoCapture, HeadlessSink, make_results
+from src.settings.config import Settings
+
+ZONE = (0.25, 0.5, 0.75, 1.0)
+
+
+class _RecordingHands(FakeHands):
+    """Запоминает размер изображений, переданных в инференс"""
+
+    def __init__(self, script, loop=False):
+        super().__init__(script, loop)
+        self.shapes = []
+
+    def process(self, image):
+        self.shapes.append(image.shape)
+        return super().process(image)
+
+
+def test_zone_pixels_and_crop_view():
+    zone = ActiveZone(ZONE)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    assert zone.pixels(640, 480) == (160, 240, 480, 480)
+    crop = zone.crop(frame)
+    assert crop.shape == (240, 320, 3)
+    assert np.shares_memory(crop, frame)
+    assert ActiveZone().crop(frame) is frame
+
+
+@pytest.mark.parametrize("rect", [(0.5, 0.0, 0.5, 1.0), (0.0, 0.8, 1.0, 0.2), (1.2, 0.0, 1.5, 1.0)])
+def test_empty_zone_is_rejected(rect):
+    with pytest.raises(ValueError):
+        ActiveZone(rect)
+
+
+def test_landmarks_are_mapped_back_to_the_frame():
+    zone = ActiveZone(ZONE)
+    hand = POSES["is_stop"][None]
+    mapped = zone.to_frame(hand, (640, 480))
+    assert np.allclose(mapped[..., 0], 0.25 + hand[..., 0] * 0.5)
+    assert np.allclose(mapped[..., 1], 0.5 + hand[..., 1] * 0.5)
+    assert np.allclose(mapped[..., 2], hand[..., 2] * 0.5)
+
+
+def test_map_results_leaves_input_untouched():
+    zone = ActiveZone(ZONE)
+    results = make_results(POSES["is_like"][None], ["Left"])
+    mapped = zone.map_results(results, (640, 480))
+    assert results.multi_hand_landmarks[0].landmark[0].x == pytest.approx(POSES["is_like"][0, 0])
+    assert mapped.multi_hand_landmarks[0].landmark[0].x == pytest.approx(0.25 + POSES["is_like"][0, 0] * 0.5)
+    assert mapped.multi_handedness is results.multi_handedness
+    assert ActiveZone().map_results(results, (640, 480)) is results
+
+
+def test_process_video_infers_on_the_zone_only():
+    settings = Settings(action_backend="dry-run", active_zone=ZONE)
+    capture = FakeVideoCapture([np.zeros((48, 64, 3), dtype=np.uint8)] * 5)
+    hands = _RecordingHands([POSES["is_stop"][None]], loop=True)
+    processor = HandsProcessor(settings)
+    process_video(settings, capture=capture, hands=hands, sink=HeadlessSink(), processor=processor, clock=capture.clock)
+
+    assert hands.shapes == [(24, 32, 3)] * 5
+    # Рука найдена в зоне и отслеживается в координатах всего кадра
+    assert processor.gesture_count == 5
+
+
+def test_infer_reports_landmarks_in_frame_coordinates():
+    hands = _RecordingHands([POSES["is_stop"][None]])
+    zone = ActiveZone(ZONE)
+    frame = Infer(hands, zone)(Preprocess(zone)(Frame(0, 0.0, np.zeros((48, 64, 3), dtype=np.uint8))))
+    assert hands.shapes == [(24, 32, 3)]
+    assert np.allclose(frame.landmarks, zone.to_frame(POSES["is_stop"][None], (64, 48)))
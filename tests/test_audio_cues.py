@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.detection.synthetic import POSES
+from src.handlers import HandsProcessor
+from src.handlers.audio_cues import CuePlayer, NullOutputStream, create_cue_player, tone
+from src.handlers.camera_handler import process_video
+from src.handlers.hand_tracker import HandTrack
+from src.handlers.pipeline import Cues, Frame, Pipeline, recognition_stages
+from src.handlers.simulation import FakeHands, FakeVideoCapture, HeadlessSink
+from src.settings.config import Settings
+from src.settings.constants import GESTURE_THRESHOLD
+
+
+def _player(**kwargs):
+    return CuePlayer("null", volume=1.0, **kwargs).start()
+
+
+def test_tone_starts_and_ends_quietly():
+    samples = tone(1000, 0.05, decay=100.0)
+    assert samples.dtype == np.float32 and len(samples) == round(0.05 * 44100)
+    assert abs(samples[0]) < 1e-3 and abs(samples[-1]) < 0.01 and np.abs(samples).max() <= 1.0
+
+
+def test_cue_is_played_across_callbacks():
+    cue = np.linspace(0.1, 0.5, 600, dtype=np.float32)
+    player = _player(cues={"beep": cue}, blocksize=256)
+    assert isinstance(player.stream, NullOutputStream) and player.stream.active
+
+    assert not player.stream.pull().any()
+    player.play("beep")
+    played = np.concatenate([player.stream.pull() for _ in range(3)])
+    np.testing.assert_allclose(played[:600], cue)
+    assert not played[600:].any() and player._voices == []
+
+
+def test_overlapping_cues_are_mixed_and_clipped():
+    player = _player(cues={"loud": np.full(100, 0.7, dtype=np.float32)})
+    player.play("loud")
+    player.play("loud")
+    out = player.stream.pull(100)
+    assert out.max() == pytest.approx(1.0)
+
+
+def test_play_without_a_stream_is_silent():
+    player = CuePlayer("null")
+    player.play("confirm")
+    assert player.played == 0
+    # Устройство не открылось — игрок молчит, а не падает
+    broken = CuePlayer("no-such-device")
+    broken.start()
+    broken.play("confirm")
+    assert broken.stream is None and broken.played == 0
+    broken.close()
+
+
+def test_disabled_cues_create_no_player():
+    assert create_cue_player(Settings()) is None
+    player = create_cue_player(Settings(audio_cues=True, audio_device="null"))
+    assert player.stream.active
+    player.close()
+    assert player.stream is None
+
+
+def test_cues_follow_candidate_and_confirmation():
+    settings = Settings(action_backend="dry-run")
+    processor = HandsProcessor(settings)
+    player = _player()
+    played = []
+    player.play = played.append
+    stages = recognition_stages(processor, FakeHands([POSES["is_stop"][None]], loop=True)) + [Cues(player)]
+    pipeline = Pipeline(stages)
+    for i in range(GESTURE_THRESHOLD + 5):
+        pipeline.process(Frame(i, i / 30, np.zeros((48, 64, 3), dtype=np.uint8)))
+    assert played == ["candidate", "confirm"]
+
+
+def test_candidate_cue_ticks_once_per_hold():
+    played = []
+    cues = Cues(SimpleNamespace(play=played.append), candidate_frames=3)
+    frame = Frame(0, 0.0, np.zeros((1, 1, 3), dtype=np.uint8))
+    track = HandTrack("Right")
+    # Удержание растёт, затем классификация мигает между жестами одной руки
+    for gesture, count in [(1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (2, 1), (1, 1), (1, 2), (1, 3)]:
+        track.gesture, track.count = gesture, count
+        frame.tracks = [track]
+        cues(frame)
+    assert played == ["candidate", "candidate"]
+    # Мигание без удержания до порога не тикает совсем
+    for gesture in [1, 2, 1, 2, 1, 2]:
+        track.gesture, track.count = gesture, 1
+        cues(frame)
+    assert played == ["candidate", "candidate"]
+
+
+def test_process_video_plays_cues_on_the_null_device():
+    settings = Settings(action_backend="dry-run", audio_cues=True, audio_device="null")
+    capture = FakeVideoCapture([np.zeros((48, 64, 3), dtype=np.uint8)] * (GESTURE_THRESHOLD + 5))
+    processor = process_video(
+        settings, capture, FakeHands([POSES["is_like"][None]], loop=True), HeadlessSink(), clock=capture.clock
+    )
+    assert processor.backend.calls == [("open_app", "Photos")]
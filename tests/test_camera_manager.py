@@ -0,0 +1,137 @@
+import threading
+import time
+
+import cv2
+
+import numpy as np
+import pytest
+
+from src.handlers.camera_manager import CameraManager
+from src.handlers.capture import configure_capture
+from src.handlers.simulation import FakeVideoCapture
+from src.settings.config import Settings
+
+
+class _Opener:
+    """Открывает «камеры» с перечисленными индексами и запоминает, в каком потоке это происходило"""
+
+    def __init__(self, available=(0, 2)):
+        self.available = available
+        self.opened = []
+        self.threads = set()
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, settings, index):
+        self.gate.wait(5)
+        self.threads.add(threading.current_thread().name)
+        if index not in self.available:
+            raise RuntimeError(f"Cannot open camera index {index}")
+        capture = FakeVideoCapture([np.zeros((48, 64, 3), dtype=np.uint8)], loop=True)
+        self.opened.append((index, capture))
+        return capture, configure_capture(capture, settings)
+
+
+def test_enumeration_runs_in_the_background_and_is_cached():
+    opener = _Opener()
+    manager = CameraManager(Settings(), opener, keep_warm=False)
+    future = manager.enumerate(4)
+    assert manager.enumerate(4) is future
+
+    devices = future.result(5)
+    assert [device.index for device in devices] == [0, 2]
+    assert str(devices[0]) == "Camera 0 (64x48)"
+    assert manager.devices == devices
+    assert threading.current_thread().name not in opener.threads
+    manager.close()
+    assert not any(capture.isOpened() for _, capture in opener.opened)
+
+
+def test_enumeration_does_not_keep_cameras_open():
+    opener = _Opener()
+    manager = CameraManager(Settings(), opener, keep_warm=True)
+    manager.enumerate(4).result(5)
+    assert not any(capture.isOpened() for _, capture in opener.opened)
+    manager.close()
+
+
+def test_stop_keeps_the_camera_open_and_start_reuses_it():
+    opener = _Opener()
+    manager = CameraManager(Settings(), opener, keep_warm=True)
+    capture, info = manager.open(0).result(5)
+    manager.release(0, capture, info)
+    assert capture.isOpened()
+
+    again = manager.open(0)
+    assert again.done() and again.result()[0] is capture
+
+    # Другая камера: прогретая закрывается, новая открывается в фоне
+    manager.release(0, capture, info)
+    other, _ = manager.open(2).result(5)
+    assert other is not capture and not capture.isOpened()
+    manager.close()
+
+
+def test_open_does_not_block_the_caller():
+    opener = _Opener()
+    opener.gate.clear()
+    manager = CameraManager(Settings(), opener, keep_warm=True)
+    future = manager.open(0)
+    assert not future.done()
+    opener.gate.set()
+    assert future.result(5)[0].isOpened()
+    manager.close()
+
+
+def test_open_failure_is_reported_through_the_future():
+    manager = CameraManager(Settings(), _Opener(available=()))
+    with pytest.raises(RuntimeError):
+        manager.open(1).result(5)
+    manager.close()
+
+
+def test_without_warm_cameras_release_closes():
+    opener = _Opener()
+    manager = CameraManager(Settings(), opener, keep_warm=False)
+    capture, info = manager.open(0).result(5)
+    manager.release(0, capture, info)
+    manager.close()
+    assert not capture.isOpened()
+
+
+def test_cameras_are_not_kept_warm_by_default():
+    opener = _Opener()
+    manager = CameraManager(Settings(), opener)
+    capture, info = manager.open(0).result(5)
+    manager.release(0, capture, info)
+    manager.close()
+    assert not capture.isOpened()
+
+
+def test_warm_camera_is_released_after_idle_timeout():
+    opener = _Opener()
+    manager = CameraManager(Settings(), opener, keep_warm=True, warm_timeout=0.05)
+    capture, info = manager.open(0).result(5)
+    manager.release(0, capture, info)
+    deadline = time.monotonic() + 5
+    while capture.isOpened() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not capture.isOpened()
+    assert manager.open(0).result(5)[0] is not capture
+    manager.close()
+
+
+def test_changed_format_is_restored_on_the_device_thread():
+    opener = _Opener()
+    manager = CameraManager(Settings(), opener, keep_warm=True)
+    capture, info = manager.open(0).result(5)
+    capture.set(cv2.CAP_PROP_FRAME_WIDTH, 32)
+    manager.release(0, capture, info, format_changed=True)
+
+    calls = []
+    original = capture.set
+    capture.set = lambda prop, value: calls.append(threading.current_thread().name) or original(prop, value)
+    again, restored = manager.open(0).result(5)
+    assert again is capture and restored.width == info.width
+    assert calls and threading.current_thread().name not in calls
+    manager.close()
@@ -0,0 +1,61 @@
+import cv2
+
+from src.handlers.capture import configure_capture, decode_fourcc
+from src.settings.config import Settings
+
+
+class _Device:
+    """Камера, которая принимает только перечисленные значения свойств"""
+
+    def __init__(self, supported):
+        self.supported = supported
+        self.props = {
+            cv2.CAP_PROP_FRAME_WIDTH: 1920,
+            cv2.CAP_PROP_FRAME_HEIGHT: 1080,
+            cv2.CAP_PROP_FPS: 5,
+            cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*"YUYV"),
+        }
+        self.calls = []
+
+    def set(self, prop, value):
+        self.calls.append(prop)
+        if value in self.supported.get(prop, ()):
+            self.props[prop] = value
+            return True
+        return False
+
+    def get(self, prop):
+        return self.props[prop]
+
+
+def test_decode_fourcc():
+    assert decode_fourcc(cv2.VideoWriter_fourcc(*"MJPG")) == "MJPG"
+    assert decode_fourcc(0) == ""
+
+
+def test_negotiated_format_accepted():
+    device = _Device({
+        cv2.CAP_PROP_FOURCC: [cv2.VideoWriter_fourcc(*"MJPG")],
+        cv2.CAP_PROP_FRAME_WIDTH: [640],
+        cv2.CAP_PROP_FRAME_HEIGHT: [480],
+        cv2.CAP_PROP_FPS: [30],
+    })
+    info = configure_capture(device, Settings())
+    assert (info.width, info.height, info.fps, info.fourcc) == (640, 480, 30, "MJPG")
+    assert info.mismatches == []
+    assert device.calls[0] == cv2.CAP_PROP_FOURCC
+
+
+def test_rejected_values_are_reported():
+    device = _Device({cv2.CAP_PROP_FRAME_WIDTH: [640], cv2.CAP_PROP_FRAME_HEIGHT: [480]})
+    info = configure_capture(device, Settings())
+    assert (info.width, info.height) == (640, 480)
+    assert [m.split()[0] for m in info.mismatches] == ["fourcc", "fps"]
+
+
+def test_driver_defaults_are_kept():
+    device = _Device({})
+    info = configure_capture(device, Settings(frame_width=0, frame_height=0, fps=0, fourcc=""))
+    assert device.calls == []
+    assert info.mismatches == []
+    assert str(info) == "1920x1080 @ 5 FPS, YUYV"
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.detection.classifiers import MLPClassifier, build_classifier, train_mlp
+from src.detection.landmarks import normalize_landmarks
+from src.settings.config import Settings
+
+
+def _dataset(n_per_class=60, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = {label: rng.uniform(0.2, 0.8, (21, 3)).astype(np.float32) for label in ("is_like", "is_stop", "none")}
+    landmarks, labels = [], []
+    for label, center in centers.items():
+        landmarks.append(center + rng.normal(0, 0.005, (n_per_class, 21, 3)).astype(np.float32))
+        labels += [label] * n_per_class
+    return np.concatenate(landmarks), np.array(labels)
+
+
+def test_normalize_is_translation_and_scale_invariant():
+    landmarks, _ = _dataset(n_per_class=1)
+    moved = landmarks * 0.5 + 0.1
+    assert np.allclose(normalize_landmarks(landmarks), normalize_landmarks(moved), atol=1e-4)
+
+
+@pytest.mark.parametrize("hidden_size", [0, 16])
+def test_train_and_classify(hidden_size):
+    landmarks, labels = _dataset()
+    classifier = train_mlp(landmarks, labels, hidden_size=hidden_size, epochs=200)
+    predicted = np.array([p or "none" for p in classifier.classify_batch(landmarks)])
+    assert np.mean(predicted == labels) > 0.95
+
+
+def test_save_load_roundtrip(tmp_path):
+    landmarks, labels = _dataset()
+    classifier = train_mlp(landmarks, labels, hidden_size=8, epochs=100)
+    path = str(tmp_path / "weights.npz")
+    classifier.save(path)
+
+    loaded = build_classifier(Settings(classifier="mlp", classifier_weights=path))
+    assert isinstance(loaded, MLPClassifier)
+    assert loaded.labels == classifier.labels
+    assert np.allclose(loaded.predict_proba(normalize_landmarks(landmarks)), classifier.predict_proba(normalize_landmarks(landmarks)))
+
+
+def test_none_label_maps_to_no_gesture():
+    landmarks, labels = _dataset()
+    classifier = train_mlp(landmarks, labels, hidden_size=8, epochs=200)
+    assert classifier.classify_batch(landmarks[labels == "none"][:5]) == [None] * 5
+
+
+def test_empty_batch():
+    landmarks, labels = _dataset(n_per_class=5)
+    classifier = train_mlp(landmarks, labels, hidden_size=0, epochs=5)
+    assert classifier.classify_batch(np.empty((0, 21, 3), dtype=np.float32)) == []
+
+
+def test_rules_backend_has_no_classifier():
+    assert build_classifier(Settings()) is None
+    with pytest.raises(ValueError):
+        build_classifier(Settings(classifier="unknown"))
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.handlers.clip_recorder import ClipRecorder
+
+
+def _frame(i):
+    return np.full((48, 64, 3), i % 256, dtype=np.uint8)
+
+
+def _frame_count(path):
+    cap = cv2.VideoCapture(path)
+    count = 0
+    while cap.read()[0]:
+        count += 1
+    cap.release()
+    return count
+
+
+@pytest.mark.parametrize("jpeg_quality", [0, 80])
+def test_clip_has_pre_and_post_roll(tmp_path, jpeg_quality):
+    recorder = ClipRecorder(str(tmp_path), fps=10, pre_seconds=1.0, post_seconds=0.5, jpeg_quality=jpeg_quality)
+    for i in range(30):
+        recorder.push(_frame(i))
+    recorder.trigger("is_like")
+    for i in range(30, 40):
+        recorder.push(_frame(i))
+    recorder.close()
+
+    assert len(recorder.saved) == 1
+    assert recorder.saved[0].endswith("_is_like.mp4")
+    assert _frame_count(recorder.saved[0]) == 10 + 5
+
+
+def test_pre_roll_is_bounded(tmp_path):
+    recorder = ClipRecorder(str(tmp_path), fps=10, pre_seconds=2.0)
+    for i in range(500):
+        recorder.push(_frame(i))
+    assert len(recorder.buffer) == 20
+    recorder.close()
+
+
+def test_trigger_before_first_frame_is_ignored(tmp_path):
+    recorder = ClipRecorder(str(tmp_path))
+    recorder.trigger("is_like")
+    recorder.close()
+    assert recorder.saved == []
+
+
+def test_unfinished_clip_is_written_on_close(tmp_path):
+    recorder = ClipRecorder(str(tmp_path), fps=10, pre_seconds=0.5, post_seconds=10.0)
+    for i in range(5):
+        recorder.push(_frame(i))
+    recorder.trigger("is_stop is_stop")
+    recorder.push(_frame(5))
+    recorder.close()
+    assert recorder.saved[0].endswith("_is_stop_is_stop.mp4")
+    assert _frame_count(recorder.saved[0]) == 6
+
+
+def test_failed_write_keeps_writer_running(tmp_path):
+    # Каталог для клипов нельзя создать: на его месте лежит файл
+    blocked = tmp_path / "clips"
+    blocked.write_text("")
+    recorder = ClipRecorder(str(blocked), fps=10, pre_seconds=0.5, post_seconds=0.0)
+    recorder.push(_frame(0))
+    recorder.trigger("is_like")
+    assert recorder.flush(timeout=5)
+    assert recorder._writer.is_alive()
+
+    recorder.output_dir = str(tmp_path / "ok")
+    recorder.trigger("is_like")
+    recorder.close()
+    assert len(recorder.saved) == 1
+
+
+def test_close_gives_up_on_stuck_writer(tmp_path, monkeypatch):
+    release = threading.Event()
+    recorder = ClipRecorder(str(tmp_path), fps=10, post_seconds=0.0)
+    monkeypatch.setattr(recorder, "_write", lambda clip: release.wait(10))
+    recorder.push(_frame(0))
+    recorder.trigger("is_like")
+    started = time.monotonic()
+    recorder.close(timeout=0.3)
+    assert time.monotonic() - started < 2
+    release.set()
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from src.detection.classifiers import train_mlp
+from src.detection.landmarks import landmark_quality
+from src.detection.synthetic import POSES, generate_dataset
+from src.handlers import HandsProcessor
+from src.handlers.simulation import make_results
+from src.settings.config import Settings
+from src.settings.constants import GESTURE_THRESHOLD
+
+STOP = POSES["is_stop"]
+
+
+def _processor(**settings):
+    return HandsProcessor(Settings(action_backend="dry-run", **settings))
+
+
+def _feed(processor, hands, score, frames):
+    results = make_results(hands, score=score)
+    fired = []
+    for frame in range(1, frames + 1):
+        if processor.classify_hands(results.multi_hand_landmarks, results.multi_handedness, frame / 30):
+            fired.append(frame)
+    return fired
+
+
+def test_landmark_quality():
+    wrist = STOP[0]
+    small = wrist + (STOP - wrist) * 0.1
+    shifted = STOP + (0.45, 0, 0)
+    quality = landmark_quality(np.stack([STOP, small, shifted]))
+    assert quality[0] == pytest.approx(1.0)
+    assert quality[1] < 0.5
+    assert 0 < quality[2] < 1
+
+
+def test_low_handedness_score_is_rejected_before_classification(monkeypatch):
+    processor = _processor(min_handedness_score=0.5)
+    calls = []
+    monkeypatch.setattr(processor, "classify_landmarks", lambda landmarks: calls.append(landmarks) or [3] * len(landmarks))
+
+    assert _feed(processor, STOP[None], score=0.3, frames=GESTURE_THRESHOLD * 2) == []
+    assert all(len(landmarks) == 0 for landmarks in calls)
+    assert processor.tracker.tracks == {}
+
+
+def test_partial_hand_is_rejected():
+    processor = _processor()
+    wrist = STOP[0]
+    far = wrist + (STOP - wrist) * 0.1
+    assert _feed(processor, far[None], score=0.95, frames=GESTURE_THRESHOLD * 2) == []
+    assert processor.previous_gesture is None
+
+
+def test_confirmation_is_weighted_by_confidence():
+    confident = _processor()
+    assert _feed(confident, STOP[None], score=0.95, frames=GESTURE_THRESHOLD)[0] == GESTURE_THRESHOLD
+
+    # Уверенность 0.6 при confidence_full = 0.9: каждый кадр засчитывается на 2/3
+    hesitant = _processor(confidence_full=0.9)
+    fired = _feed(hesitant, STOP[None], score=0.6, frames=GESTURE_THRESHOLD * 2)
+    assert fired[0] == int(np.ceil(GESTURE_THRESHOLD * 1.5))
+    assert hesitant.gesture_count >= hesitant.gesture_score
+
+
+def test_two_hands_confirm_at_the_less_confident_hand():
+    processor = _processor()
+    hands = np.stack([STOP - (0.2, 0, 0), STOP + (0.2, 0, 0)])
+    results = make_results(hands, ["Left", "Right"])
+    results.multi_handedness[0].classification[0].score = 0.54
+    for frame in range(10):
+        processor.classify_hands(results.multi_hand_landmarks, results.multi_handedness, frame / 30)
+    assert processor.gesture_count == 10
+    assert processor.gesture_score == pytest.approx(6.0, abs=1e-3)
+
+
+def test_mlp_reports_confidence():
+    landmarks, labels = generate_dataset(60, seed=0)
+    classifier = train_mlp(landmarks, labels, hidden_size=16, epochs=150)
+    gestures, scores = classifier.classify_scored(landmarks[:20])
+    assert gestures == classifier.classify_batch(landmarks[:20])
+    assert scores.shape == (20,) and np.all((scores > 0) & (scores <= 1))
+    assert classifier.classify_scored(landmarks[:0]) == ([], pytest.approx(np.empty(0)))
+
@@ -0,0 +1,137 @@
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+from src.actions.continuous import CoalescingDispatcher, ScrollTarget, VolumeTarget, _RelativeTarget, create_controls
+from src.detection.channels import ControlChannel, pinch_distance, pinch_pose
+from src.detection.landmarks import WRIST
+from src.detection.synthetic import POSES
+from src.handlers import HandsProcessor
+from src.handlers.hand_tracker import HandTrack
+from src.settings.config import Settings
+from src.settings.constants import INDEX_TIP, THUMB_TIP
+
+
+def _pinch(distance: float) -> np.ndarray:
+    """Кулак, у которого большой палец отведён от указательного на `distance` размеров ладони."""
+    hand = POSES["none"].copy()
+    palm = np.linalg.norm(hand[9, :2] - hand[0, :2])
+    hand[THUMB_TIP, :2] = hand[INDEX_TIP, :2] + [distance * palm, 0.0]
+    return hand[None]
+
+
+def test_pinch_distance_is_scale_invariant():
+    hand = _pinch(0.8)
+    assert pinch_distance(hand)[0] == pytest.approx(0.8, abs=1e-4)
+    scaled = hand.copy()
+    scaled[..., :2] *= 0.5
+    assert pinch_distance(scaled)[0] == pytest.approx(0.8, abs=1e-4)
+    assert pinch_pose(hand)[0] and not pinch_pose(POSES["is_stop"][None])[0]
+
+
+@pytest.mark.parametrize("pose", ["is_like", "is_dislike", "is_stop", "is_okay"])
+def test_static_gestures_are_not_the_pinch_pose(pose):
+    # У кулака с поднятым или опущенным большим пальцем указательный палец согнут
+    assert not pinch_pose(POSES[pose][None])[0]
+    # Слишком широко отведённый большой палец — уже не щипок
+    assert not pinch_pose(_pinch(2.5))[0]
+
+
+def test_channel_smooths_and_applies_deadband():
+    channel = ControlChannel("pinch", value_range=(0.0, 1.0), smoothing=0.5, deadband=0.05)
+    assert channel.update(_pinch(0.4)) == pytest.approx(0.4, abs=1e-4)
+    # Дрожание меньше зоны нечувствительности не порождает обновлений
+    assert channel.update(_pinch(0.44)) is None
+    assert channel.update(_pinch(0.8)) == pytest.approx(0.61, abs=1e-3)
+    # Открытая ладонь отпускает канал
+    assert channel.update(POSES["is_stop"][None]) is None and not channel.active
+    assert channel.update(np.empty((0, 21, 3), dtype=np.float32)) is None
+
+
+def test_dispatcher_coalesces_and_rate_limits():
+    sent = []
+    dispatcher = CoalescingDispatcher(lambda value: sent.append(value), rate=10.0)
+    for i in range(30):
+        dispatcher.submit(i / 30)
+        dispatcher.poll(i / 30)
+    # 30 кадров за секунду — не больше 10 команд, и последняя команда несёт свежее значение
+    assert 9 <= len(sent) <= 10 and dispatcher.coalesced >= 19
+    assert dispatcher.poll(1.1)
+    assert sent[-1] == pytest.approx(29 / 30)
+
+
+def test_dispatcher_waits_for_the_previous_command():
+    futures = []
+
+    def send(value):
+        futures.append(Future())
+        return futures[-1]
+
+    dispatcher = CoalescingDispatcher(send, rate=100.0)
+    dispatcher.submit(0.1)
+    assert dispatcher.poll(0.0)
+    for i in range(1, 50):
+        dispatcher.submit(i / 50)
+        assert not dispatcher.poll(i * 0.1)
+    futures[-1].set_result(None)
+    assert dispatcher.poll(5.0) and dispatcher.sent == 2 and dispatcher.pending is None
+
+
+def test_scroll_target_accumulates_whole_lines():
+    settings = Settings(action_backend="dry-run")
+    backend = HandsProcessor(settings).backend
+    target = ScrollTarget(backend, lines=10)
+    for value in (0.5, 0.52, 0.56, 0.61, 0.4):
+        target(value)
+    assert backend.calls == [("scroll", 1), ("scroll", -2)]
+    volume = VolumeTarget(backend)
+    # Первое значение только задаёт точку отсчёта: громкость не прыгает к положению руки
+    assert volume(0.9) is None and backend.calls[-1] == ("scroll", -2)
+    volume(0.856)
+    assert backend.calls[-1] == ("change_volume", -4)
+    volume.reset()
+    assert volume(0.1) is None and backend.calls[-1] == ("change_volume", -4)
+
+
+def test_relative_target_without_a_command_is_abstract():
+    class NoCommand(_RelativeTarget):
+        pass
+
+    with pytest.raises(TypeError):
+        NoCommand(None, 10)
+
+
+def test_unknown_control_is_rejected():
+    with pytest.raises(ValueError):
+        create_controls(Settings(controls={"pinch": "brightness"}), None)
+    with pytest.raises(ValueError):
+        create_controls(Settings(controls={"wave": "volume"}), None)
+
+
+def test_processor_sends_volume_at_the_configured_rate():
+    settings = Settings(action_backend="dry-run", controls={"pinch": "volume"}, control_rate=5.0)
+    processor = HandsProcessor(settings)
+    for i in range(60):
+        distance = 0.2 + 1.3 * i / 59
+        processor.update_controls(_pinch(distance), i / 30)
+    changes = [percent for call, percent in processor.backend.calls if call == "change_volume"]
+    assert 4 <= len(changes) <= 11
+    assert all(percent > 0 for percent in changes) and sum(changes) > 80
+
+
+def test_hand_holding_a_static_gesture_does_not_steer():
+    settings = Settings(action_backend="dry-run", controls={"pinch": "volume"}, control_rate=100.0)
+    processor = HandsProcessor(settings)
+    hand = _pinch(0.5)
+    track = HandTrack("Right", gesture=1, count=5, position=tuple(hand[0, WRIST, :2]))
+    for i in range(10):
+        hand = _pinch(0.5 + 0.1 * i)
+        processor.update_controls(hand, i / 30, [track])
+    assert processor.backend.calls == []
+    # Без удерживаемого жеста та же рука управляет громкостью
+    for i in range(10):
+        processor.update_controls(_pinch(0.5 + 0.1 * i), 1 + i / 30, [])
+    assert [call for call, _ in processor.backend.calls] and all(
+        call == "change_volume" for call, _ in processor.backend.calls
+    )
@@ -0,0 +1,121 @@
+import io
+import json
+import os
+import threading
+import time
+
+from src.event_log import EventLog
+
+
+def _records(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_events_are_written_as_jsonl():
+    stream = io.StringIO()
+    log = EventLog(stream=stream, rate_limit=0)
+    log.log("gesture_recognized", gesture="is_like")
+    log.log("action_started", action="open_app", app="Photos")
+    log.close()
+
+    records = _records(stream)
+    assert [r["event"] for r in records] == ["gesture_recognized", "action_started"]
+    assert records[0]["gesture"] == "is_like"
+    assert isinstance(records[0]["ts"], float)
+
+
+def test_log_does_not_write_synchronously():
+    stream = io.StringIO()
+    log = EventLog(stream=stream, flush_interval=60)
+    log.log("gesture_recognized", gesture="is_like")
+    assert stream.getvalue() == ""
+    log.flush()
+    assert len(_records(stream)) == 1
+    log.close()
+
+
+def test_repeated_events_are_rate_limited():
+    stream = io.StringIO()
+    log = EventLog(stream=stream, rate_limit=0.2)
+    for _ in range(100):
+        log.log("gesture_recognized", gesture="is_like")
+    log.log("gesture_recognized", gesture="is_stop")
+    time.sleep(0.25)
+    log.log("gesture_recognized", gesture="is_like")
+    log.close()
+
+    records = _records(stream)
+    assert [r["gesture"] for r in records] == ["is_like", "is_stop", "is_like"]
+    assert records[2]["suppressed"] == 99
+
+
+def test_file_rotation(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    log = EventLog(path=path, max_bytes=200, backups=2, rate_limit=0)
+    for i in range(30):
+        log.log("frame", index=i)
+        log.flush()
+    log.close()
+
+    assert os.path.exists(path + ".1")
+    assert os.path.exists(path + ".2")
+    assert not os.path.exists(path + ".3")
+    assert os.path.getsize(path + ".1") >= 200
+
+
+def test_queue_is_bounded():
+    stream = io.StringIO()
+    log = EventLog(stream=stream, rate_limit=0, flush_interval=60, max_queue=10)
+    for i in range(100):
+        log.log("frame", index=i)
+    log.close()
+    assert [r["index"] for r in _records(stream)] == list(range(90, 100))
+
+
+def test_rate_limit_state_of_stale_events_is_swept():
+    log = EventLog(stream=io.StringIO(), rate_limit=0.05, flush_interval=60)
+    for i in range(50):
+        log.log("action_failed", app=f"app_{i}")
+        log.log("action_failed", app=f"app_{i}")
+    time.sleep(0.1)
+    log.log("gesture_recognized", gesture="is_like")
+    assert list(log._last_seen) == [("gesture_recognized", "is_like")]
+    assert log._suppressed == {}
+    log.close()
+
+
+def test_rate_limit_state_is_capped():
+    log = EventLog(stream=io.StringIO(), rate_limit=60, flush_interval=60, max_keys=10)
+    for i in range(100):
+        log.log("frame", index=i)
+    assert len(log._last_seen) <= 10
+    log.close()
+
+
+def test_logging_from_several_threads():
+    stream = io.StringIO()
+    log = EventLog(stream=stream, rate_limit=60, flush_interval=60, max_keys=100_000)
+    # Частые очистки и вытеснение при переполнении идут одновременно с записью из других потоков
+    busy = EventLog(stream=io.StringIO(), rate_limit=1e-6, flush_interval=60, max_keys=50)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(2000):
+                log.log("frame", thread=n, index=i % 100)
+                busy.log("frame", thread=n, index=i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.close()
+    busy.close()
+
+    assert errors == []
+    # Каждое событие записано ровно один раз, остальные повторы подавлены
+    assert len(_records(stream)) == 8 * 100
+    assert sum(log._suppressed.values()) == 8 * (2000 - 100)
@@ -0,0 +1,55 @@
+import pytest
+
+from src.actions import DryRunBackend, SingleHandActions, TwoHandsActions
+from src.models import GESTURE_CODES, GESTURE_NAMES, PAIR_CODES, TWO_HAND_CODES, GestureCode, GestureSet, code_table, to_code
+
+
+def test_codes_match_gesture_names():
+    assert len(GESTURE_NAMES) == len(GestureCode) == len(GestureSet) + 1
+    for gesture in GestureSet:
+        code = GestureCode[gesture.name]
+        assert GESTURE_NAMES[code] == gesture.value
+        assert GESTURE_CODES[gesture.value] is code
+
+
+@pytest.mark.parametrize(
+    "gesture, expected",
+    [
+        ("is_like", GestureCode.LIKE),
+        (GestureCode.OKAY, GestureCode.OKAY),
+        (3, GestureCode.STOP),
+        ("is_stop is_stop", GestureCode.TWO_STOPS),
+        ("is_two_stops", GestureCode.TWO_STOPS),
+        ("is_likes", GestureCode.NONE),
+        ("", GestureCode.NONE),
+        (None, GestureCode.NONE),
+        (12345, GestureCode.NONE),
+        (True, GestureCode.NONE),
+    ],
+)
+def test_to_code(gesture, expected):
+    assert to_code(gesture) is expected
+
+
+def test_pair_codes():
+    assert PAIR_CODES[GestureCode.STOP][GestureCode.STOP] is GestureCode.TWO_STOPS
+    assert PAIR_CODES[GestureCode.LIKE][GestureCode.LIKE] is GestureCode.TWO_LIKES
+    assert PAIR_CODES[GestureCode.LIKE][GestureCode.STOP] is GestureCode.NONE
+    assert PAIR_CODES[GestureCode.CIRCLE][GestureCode.CIRCLE] is GestureCode.NONE
+    assert TWO_HAND_CODES == {GestureCode.TWO_LIKES, GestureCode.TWO_DISLIKES, GestureCode.TWO_STOPS, GestureCode.TWO_OKAY}
+
+
+def test_code_table():
+    table = code_table({GestureCode.LIKE: "a"}, default="-")
+    assert len(table) == len(GestureCode)
+    assert table[GestureCode.LIKE] == "a" and table[GestureCode.NONE] == "-"
+
+
+def test_actions_accept_codes_and_names():
+    backend = DryRunBackend()
+    single, two = SingleHandActions(backend), TwoHandsActions(backend)
+    assert single.get_action(GestureCode.LIKE) == single.get_action("is_like") == "👍"
+    assert single.get_action(GestureCode.SWIPE_LEFT) is None
+    assert two.get_action(GestureCode.TWO_STOPS) == "🎵 Music opened"
+    assert two.get_action(GestureCode.STOP) is None
+    assert backend.calls == [("open_app", "Photos"), ("open_app", "Photos"), ("activate_app", "Music")]
@@ -0,0 +1,165 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.detection.overlay import LandmarkOverlay
+from src.detection.synthetic import POSES
+from src.handlers.governor import QualityLevel, QualityLevers, ResourceGovernor, quality_levels
+from src.handlers import HandsProcessor
+from src.handlers.pipeline import Frame, FunctionStage, Infer, Pipeline, Preprocess, Render, recognition_stages
+from src.handlers.simulation import FakeHands
+from src.settings.config import Settings
+from src.settings.constants import GESTURE_THRESHOLD, GOVERNOR_DOWN_AFTER, GOVERNOR_UP_AFTER
+
+IMAGE = np.zeros((48, 64, 3), dtype=np.uint8)
+
+
+class _Process:
+    def __init__(self):
+        self.cpu = 0.0
+
+    def cpu_percent(self, interval=None):
+        return self.cpu
+
+
+class _Load:
+    """Стадия, которая «тратит» заданное время по искусственным часам конвейера"""
+
+    def __init__(self, cost_ms):
+        self.now = 0.0
+        self.cost_ms = cost_ms
+
+    def timer(self):
+        return self.now
+
+    def stage(self, frame):
+        self.now += self.cost_ms / 1000
+        return frame
+
+
+def _governed(cost_ms, levels=4):
+    load = _Load(cost_ms)
+    pipeline = Pipeline([FunctionStage("work", load.stage)], timer=load.timer)
+    applied = []
+    process = _Process()
+    strides = [QualityLevel(stride=i + 1) for i in range(levels)]
+    governor = ResourceGovernor(pipeline, strides, applied.append, budget_ms=20, max_cpu=80, process=process)
+    governor.cpu_count = 1
+    return load, pipeline, governor.start(), applied, process
+
+
+def _run(pipeline, governor, seconds, start=0.0, fps=30):
+    changes = []
+    for i in range(int(seconds * fps)):
+        now = start + i / fps
+        pipeline.process(Frame(i, now, IMAGE))
+        level = governor.tick(now)
+        if level:
+            changes.append(level)
+    return changes
+
+
+def test_quality_levels_skip_levers_that_change_nothing():
+    levels = quality_levels(Settings())
+    assert levels[0] == QualityLevel(1, (640, 480), 1, True, True)
+    assert levels[-1] == QualityLevel(0, (320, 240), 3, False, False)
+
+    # Без оверлея и без запрошенного разрешения остаются только остальные рычаги
+    reduced = quality_levels(Settings(draw_overlay=False, frame_width=0, frame_height=0))
+    assert len(reduced) == len(levels) - 2
+    assert len(set(reduced)) == len(reduced)
+
+
+def test_tasks_backend_has_no_model_complexity_lever():
+    levels = quality_levels(Settings(inference_backend="tasks"))
+    assert {level.model_complexity for level in levels} == {1}
+    assert len(levels) == len(quality_levels(Settings())) - 1
+
+
+def test_infer_stride_reuses_the_last_hands():
+    hands = FakeHands([POSES["is_stop"][None]], loop=True)
+    infer = Infer(hands, stride=3)
+    pipeline = Pipeline([Preprocess(), infer])
+    frames = [pipeline.process(Frame(i, i / 30, IMAGE)) for i in range(7)]
+    assert hands.calls == 3
+    assert all(len(frame.landmarks) == 1 for frame in frames)
+
+
+@pytest.mark.parametrize("stride", [1, 3])
+def test_stride_needs_as_many_detections_to_confirm(stride):
+    # Повторно использованный результат — не новое наблюдение и не приближает подтверждение
+    hands = FakeHands([POSES["is_stop"][None]], loop=True)
+    processor = HandsProcessor(Settings(action_backend="dry-run"))
+    stages = recognition_stages(processor, hands)
+    stages[1].stride = stride
+    pipeline = Pipeline(stages)
+    for i in range(GESTURE_THRESHOLD * stride + stride):
+        if pipeline.process(Frame(i, i / 30, IMAGE)).gesture:
+            break
+    assert i == (GESTURE_THRESHOLD - 1) * stride
+    assert hands.calls == GESTURE_THRESHOLD
+
+
+def test_steps_down_only_after_sustained_overload():
+    load, pipeline, governor, applied, _ = _governed(cost_ms=30)
+    assert applied == [QualityLevel(stride=1)]
+
+    # Перегрузка короче GOVERNOR_DOWN_AFTER оценок ещё не меняет качество
+    assert _run(pipeline, governor, GOVERNOR_DOWN_AFTER - 0.5) == []
+    changes = _run(pipeline, governor, 1.0, start=GOVERNOR_DOWN_AFTER - 0.5)
+    assert [level.stride for level in changes] == [2]
+    assert governor.frame_ms == pytest.approx(30)
+
+
+def test_cpu_pressure_also_degrades():
+    load, pipeline, governor, applied, process = _governed(cost_ms=1)
+    process.cpu = 95
+    assert [level.stride for level in _run(pipeline, governor, GOVERNOR_DOWN_AFTER + 0.5)] == [2]
+
+
+def test_hysteresis_holds_inside_the_band_and_recovers_slowly():
+    load, pipeline, governor, applied, _ = _governed(cost_ms=30)
+    _run(pipeline, governor, 10)
+    assert governor.index == 3
+
+    # 15 мс: ниже бюджета, но выше порога восстановления — уровень держится
+    load.cost_ms = 15
+    assert _run(pipeline, governor, 20, start=10) == []
+
+    load.cost_ms = 5
+    changes = _run(pipeline, governor, GOVERNOR_UP_AFTER + 0.5, start=30)
+    assert [level.stride for level in changes] == [3]
+    assert governor.index == 2
+
+
+def test_levers_apply_to_stages_capture_and_backend():
+    class _Capture:
+        def __init__(self):
+            self.requests = []
+
+        def set(self, prop, value):
+            self.requests.append((prop, value))
+            return True
+
+    hands = FakeHands([None], loop=True)
+    created = []
+    infer = Infer(hands)
+    render = Render(LandmarkOverlay())
+    capture = _Capture()
+    levers = QualityLevers(
+        Pipeline([infer, render]), capture, lambda complexity: created.append(complexity) or FakeHands([None])
+    )
+
+    levels = quality_levels(Settings())
+    levers.apply(levels[0])
+    assert capture.requests == [] and created == []
+
+    levers.apply(levels[-1])
+    assert infer.stride == 3 and infer.hands is not hands
+    assert created == [0]
+    assert not render.overlay.enabled and render.interpolation == cv2.INTER_NEAREST
+    assert capture.requests == [(cv2.CAP_PROP_FRAME_WIDTH, 320), (cv2.CAP_PROP_FRAME_HEIGHT, 240)]
+
+    levers.apply(levels[0])
+    assert created == [0, 1]
+    assert render.overlay.enabled and render.interpolation == cv2.INTER_AREA
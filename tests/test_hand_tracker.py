@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.detection.synthetic import POSES
+from src.handlers.hand_tracker import HandTracker, hand_labels
+from src.handlers.hands_handler import HandsProcessor
+from src.models import GestureCode
+
+
+def _hands(*gestures):
+    # Жест руки задаётся шаблонной позой, которую правила распознают однозначно
+    return [
+        SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in POSES[gesture]])
+        for gesture in gestures
+    ]
+
+
+def _handedness(*labels):
+    return [SimpleNamespace(classification=[SimpleNamespace(label=label, score=0.9)]) for label in labels]
+
+
+@pytest.fixture
+def processor():
+    return HandsProcessor()
+
+
+def test_tracker_counts_per_hand():
+    tracker = HandTracker()
+    for _ in range(3):
+        tracks = tracker.update(["Left", "Right"], ["is_like", "is_stop"])
+    assert [(t.label, t.gesture, t.count) for t in tracks] == [("Left", "is_like", 3), ("Right", "is_stop", 3)]
+
+
+def test_tracker_keeps_state_for_dropped_hand():
+    tracker = HandTracker(max_missed=2)
+    tracker.update(["Left", "Right"], ["is_stop", "is_stop"])
+    tracker.update(["Left"], ["is_stop"])
+    tracks = tracker.update(["Left", "Right"], ["is_stop", "is_stop"])
+    assert [t.count for t in tracks] == [3, 2]
+
+
+def test_tracker_drops_hand_after_max_missed():
+    tracker = HandTracker(max_missed=1)
+    tracker.update(["Left", "Right"], ["is_stop", "is_stop"])
+    tracker.update(["Left"], ["is_stop"])
+    tracks = tracker.update(["Left"], ["is_stop"])
+    assert [t.label for t in tracks] == ["Left"]
+
+
+def test_tracker_resets_on_gesture_change():
+    tracker = HandTracker()
+    tracker.update(["Left"], ["is_like"])
+    tracks = tracker.update(["Left"], ["is_stop"])
+    assert (tracks[0].gesture, tracks[0].count) == ("is_stop", 1)
+
+
+def test_hand_labels_fallback():
+    assert hand_labels(None, 2) == ["hand_0", "hand_1"]
+    assert hand_labels(_handedness("Left", "Left"), 2) == ["hand_0", "hand_1"]
+    assert hand_labels(_handedness("Right", "Left"), 2) == ["Right", "Left"]
+
+
+def test_two_hands_order_flip_does_not_restart(processor):
+    processor.classify_hands(_hands("is_stop", "is_stop"), _handedness("Left", "Right"))
+    processor.classify_hands(_hands("is_stop", "is_stop"), _handedness("Right", "Left"))
+    processor.classify_hands(_hands("is_stop", "is_stop"), _handedness("Left", "Right"))
+    assert processor.previous_gesture == GestureCode.TWO_STOPS
+    assert processor.gesture_count == 3
+
+
+def test_two_hands_single_frame_dropout_does_not_restart(processor):
+    processor.classify_hands(_hands("is_stop", "is_stop"), _handedness("Left", "Right"))
+    processor.classify_hands(_hands("is_stop"), _handedness("Right"))
+    processor.classify_hands(_hands("is_stop", "is_stop"), _handedness("Left", "Right"))
+    assert processor.previous_gesture == GestureCode.TWO_STOPS
+    assert processor.gesture_count == 2
+
+
+def test_two_hands_different_gestures(processor):
+    processor.classify_hands(_hands("is_like", "is_stop"), _handedness("Left", "Right"))
+    assert processor.previous_gesture is None
+
+
+def test_empty_frames_age_tracks(processor):
+    processor.classify_hands(_hands("is_stop"), _handedness("Right"))
+    assert "Right" in processor.tracker.tracks
+    for _ in range(processor.tracker.max_missed + 1):
+        processor.classify_hands(None)
+    assert processor.tracker.tracks == {}
+    assert processor.motion == {}
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.detection.synthetic import POSES
+from src.handlers import HandsProcessor
+from src.handlers.hud import PerformanceHud
+from src.handlers.pipeline import Frame, Pipeline, recognition_stages
+from src.handlers.simulation import FakeHands
+from src.settings.config import Settings
+from src.settings.constants import GESTURE_THRESHOLD
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Process:
+    """psutil.Process без обращения к системе"""
+
+    def cpu_percent(self, interval=None):
+        return 12.5
+
+    def memory_info(self):
+        return SimpleNamespace(rss=64 * 2 ** 20)
+
+
+def _setup(hands):
+    clock = _Clock()
+    processor = HandsProcessor(Settings(action_backend="dry-run"))
+    # Шаг таймера 1 мс на каждый замер: у каждой стадии ровно 1 мс на кадр
+    ticks = iter(np.arange(0, 10, 0.001))
+    pipeline = Pipeline(recognition_stages(processor, hands), timer=lambda: next(ticks))
+    hud = PerformanceHud(pipeline, hands, processor, clock=clock, process=_Process())
+    return clock, processor, pipeline, hud
+
+
+def _push(pipeline, clock, count, fps=30):
+    for _ in range(count):
+        pipeline.process(Frame(0, clock.now, np.zeros((48, 64, 3), dtype=np.uint8)))
+        clock.now += 1 / fps
+
+
+def test_rates_and_latency_since_previous_sample():
+    clock, processor, pipeline, hud = _setup(FakeHands([POSES["is_stop"][None]], loop=True))
+    _push(pipeline, clock, 15)
+    snapshot = hud.sample()
+
+    assert snapshot.capture_fps == pytest.approx(30)
+    assert snapshot.inference_fps == pytest.approx(30)
+    assert set(snapshot.stage_ms) == {"preprocess", "infer", "classify", "confirm", "dispatch", "control"}
+    assert snapshot.stage_ms["infer"] == pytest.approx(1.0)
+    assert (snapshot.cpu_percent, snapshot.rss) == (12.5, 64 * 2 ** 20)
+    assert (snapshot.queue_depth, snapshot.dropped) == (0, 0)
+
+    # Без новых кадров частоты падают до нуля, а стадии не показываются
+    clock.now += 1.0
+    idle = hud.sample()
+    assert idle.capture_fps == 0 and idle.stage_ms == {}
+
+
+def test_confirmation_progress_and_cooldown():
+    clock, processor, pipeline, hud = _setup(FakeHands([POSES["is_like"][None]], loop=True))
+    _push(pipeline, clock, GESTURE_THRESHOLD // 2)
+    [hand] = hud.sample().gestures
+    assert (hand.label, hand.gesture) == ("Right", "is_like")
+    assert hand.progress == pytest.approx(0.5, abs=0.05)
+
+    _push(pipeline, clock, GESTURE_THRESHOLD)
+    snapshot = hud.sample()
+    assert snapshot.gestures[0].progress == 1.0
+    assert snapshot.cooldown > 0
+    assert any(line.startswith("cooldown") for line in snapshot.lines())
+
+
+def test_live_stream_counters_are_read_from_the_backend():
+    hands = FakeHands([None], loop=True)
+    hands.completed, hands.in_flight, hands.dropped = 0, 1, 0
+    clock, _, pipeline, hud = _setup(hands)
+    _push(pipeline, clock, 30)
+    hands.completed, hands.dropped = 20, 10
+    snapshot = hud.sample()
+    assert snapshot.capture_fps == pytest.approx(30)
+    assert snapshot.inference_fps == pytest.approx(20)
+    assert (snapshot.queue_depth, snapshot.dropped) == (1, 10)
+    assert "dropped 10" in "\n".join(snapshot.lines())
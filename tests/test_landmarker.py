@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+from mediapipe.tasks.python.components.containers.category import Category
+from mediapipe.tasks.python.components.containers.landmark import NormalizedLandmark
+from mediapipe.tasks.python.vision import HandLandmarkerResult
+
+from src.detection.landmarker import LIVE_STREAM, VIDEO, TasksHands, create_hands, results_from_task
+from src.detection.landmarks import stack_landmarks
+from src.detection.synthetic import POSES
+from src.handlers import HandsProcessor
+from src.handlers.pipeline import Frame, Pipeline, recognition_stages
+from src.settings.config import Settings
+
+IMAGE = np.zeros((48, 64, 3), dtype=np.uint8)
+
+
+def _task_result(*poses, label="Right"):
+    return HandLandmarkerResult(
+        handedness=[[Category(index=0, score=0.9, category_name=label)] for _ in poses],
+        hand_landmarks=[[NormalizedLandmark(x=x, y=y, z=z) for x, y, z in POSES[pose]] for pose in poses],
+        hand_world_landmarks=[],
+    )
+
+
+class _FakeLandmarker:
+    """HandLandmarker stand-in: VIDEO отвечает сразу, LIVE_STREAM — когда тест вызовет finish()"""
+
+    def __init__(self, result):
+        self.result = result
+        self.timestamps = []
+        self.pending = []
+        self.hands = None
+        self.closed = False
+
+    def detect_for_video(self, image, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        return self.result
+
+    def detect_async(self, image, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        self.pending.append((image, timestamp_ms))
+
+    def finish(self):
+        image, timestamp = self.pending.pop(0)
+        self.hands._on_result(self.result, image, timestamp)
+
+    def close(self):
+        self.closed = True
+
+
+def _hands(mode, result, clock=lambda: 0.0):
+    landmarker = _FakeLandmarker(result)
+    hands = TasksHands("unused.task", mode=mode, clock=clock, landmarker=landmarker)
+    landmarker.hands = hands
+    return hands, landmarker
+
+
+def test_task_results_match_legacy_structure():
+    results = results_from_task(_task_result("is_stop", "is_like", label="Left"))
+    assert np.allclose(stack_landmarks(results.multi_hand_landmarks), np.stack([POSES["is_stop"], POSES["is_like"]]))
+    assert [h.classification[0].label for h in results.multi_handedness] == ["Left", "Left"]
+    assert results.multi_handedness[0].classification[0].score == pytest.approx(0.9)
+
+    empty = results_from_task(HandLandmarkerResult([], [], []))
+    assert empty.multi_hand_landmarks is None and empty.multi_handedness is None
+
+
+def test_video_mode_is_synchronous_with_increasing_timestamps():
+    hands, landmarker = _hands(VIDEO, _task_result("is_stop"))
+    for _ in range(3):
+        results = hands.process(IMAGE)
+        assert len(results.multi_hand_landmarks) == 1
+    # Часы стоят на месте, но MediaPipe требует строго возрастающих отметок
+    assert landmarker.timestamps == [0, 1, 2]
+
+
+def test_live_stream_returns_newest_finished_result_and_drops_while_busy():
+    hands, landmarker = _hands(LIVE_STREAM, _task_result("is_like"), clock=iter(np.arange(0, 1, 0.033)).__next__)
+
+    assert hands.process(IMAGE).multi_hand_landmarks is None
+    # Кадр ещё в обработке: следующий не ставится в очередь
+    assert hands.process(IMAGE).multi_hand_landmarks is None
+    assert (hands.submitted, hands.dropped, hands.in_flight) == (1, 1, 1)
+
+    landmarker.finish()
+    assert hands.in_flight == 0
+    assert len(hands.process(IMAGE).multi_hand_landmarks) == 1
+    assert hands.submitted == 2 and len(landmarker.pending) == 1
+
+
+def test_live_stream_resubmits_after_a_lost_frame():
+    times = iter([0.0, 0.5, 2.0])
+    hands, landmarker = _hands(LIVE_STREAM, _task_result("is_like"), clock=lambda: next(times))
+    hands.process(IMAGE)
+    hands.process(IMAGE)
+    hands.process(IMAGE)
+    assert hands.submitted == 2 and hands.dropped == 1
+
+
+def test_tasks_backend_runs_in_the_pipeline():
+    hands, _ = _hands(VIDEO, _task_result("is_stop"))
+    processor = HandsProcessor(Settings(action_backend="dry-run"))
+    frame = Pipeline(recognition_stages(processor, hands)).process(Frame(0, 0.0, IMAGE))
+    assert np.allclose(frame.landmarks, POSES["is_stop"][None])
+    assert processor.tracker.tracks["Right"].gesture == 3
+
+
+def test_live_stream_result_is_counted_once():
+    hands, landmarker = _hands(LIVE_STREAM, _task_result("is_stop"), clock=iter(np.arange(0, 1, 0.033)).__next__)
+    processor = HandsProcessor(Settings(action_backend="dry-run"))
+    pipeline = Pipeline(recognition_stages(processor, hands))
+
+    pipeline.process(Frame(0, 0.0, IMAGE))
+    landmarker.finish()
+    # Новый кадр отправлен, но вернулся тот же готовый результат: он учитывается только один раз
+    frames = [pipeline.process(Frame(i, i / 30, IMAGE)) for i in range(1, 4)]
+    assert [frame.fresh for frame in frames] == [True, False, False]
+    assert processor.tracker.tracks["Right"].count == 1
+    assert len(frames[-1].tracks) == 1
+
+    landmarker.finish()
+    assert pipeline.process(Frame(4, 4 / 30, IMAGE)).fresh
+    assert processor.tracker.tracks["Right"].count == 2
+
+
+def test_backend_selection_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        create_hands(Settings(inference_backend="tasks", hand_landmarker_model=str(tmp_path / "missing.task")))
+    with pytest.raises(ValueError):
+        create_hands(Settings(inference_backend="onnx"))
+    with pytest.raises(ValueError):
+        TasksHands("unused.task", mode="image", landmarker=object())
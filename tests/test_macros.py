@@ -0,0 +1,119 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.actions.macros import MACRO_ACTIONS, MacroAutomaton, format_sequence, parse_sequence, run_macro_action
+from src.detection.synthetic import POSES
+from src.handlers import HandsProcessor
+from src.handlers.simulation import make_results
+from src.models import GestureCode
+from src.settings.config import Settings
+from src.settings.constants import ACTION_COOLDOWN_SECONDS, GESTURE_THRESHOLD
+
+LIKE, STOP, OKAY, DISLIKE = GestureCode.LIKE, GestureCode.STOP, GestureCode.OKAY, GestureCode.DISLIKE
+
+
+def _feed(automaton, gestures, step=1.0):
+    return [automaton.advance(code, i * step) for i, code in enumerate(gestures)]
+
+
+def test_parse_and_format_sequences():
+    assert parse_sequence("is_like > is_stop") == (LIKE, STOP)
+    assert parse_sequence("is_stop is_stop>is_okay") == (GestureCode.TWO_STOPS, OKAY)
+    assert format_sequence((LIKE, STOP)) == "is_like > is_stop"
+    for text in ("", "is_like > ", "is_like > is_wave"):
+        with pytest.raises(ValueError):
+            parse_sequence(text)
+
+
+def test_unknown_action_is_rejected():
+    with pytest.raises(ValueError):
+        MacroAutomaton({"is_like > is_stop": "format_disk"})
+
+
+def test_sequence_fires_once_and_returns_to_root():
+    automaton = MacroAutomaton({"is_like > is_stop": "open_notes"})
+    assert _feed(automaton, [LIKE, STOP, STOP]) == [None, "open_notes", None]
+    assert automaton.state == 0
+
+
+def test_timeout_restarts_the_sequence():
+    automaton = MacroAutomaton({"is_like > is_stop": "open_notes"}, timeout=1.5)
+    assert _feed(automaton, [LIKE, STOP], step=2.0) == [None, None]
+    assert _feed(automaton, [LIKE, STOP], step=1.0) == [None, "open_notes"]
+
+
+def test_overlapping_macros_follow_failure_links():
+    automaton = MacroAutomaton({
+        "is_like > is_like > is_stop": "open_photos",
+        "is_like > is_stop": "open_notes",
+        "is_stop > is_okay": "take_screenshot",
+    })
+    # Лишний «лайк» в начале не сбрасывает распознавание
+    assert _feed(automaton, [LIKE, LIKE, LIKE, STOP]) == [None, None, None, "open_photos"]
+    # Более короткий макрос срабатывает как суффикс более длинной последовательности
+    assert _feed(automaton, [DISLIKE, LIKE, STOP]) == [None, None, "open_notes"]
+    assert _feed(automaton, [OKAY, STOP, OKAY]) == [None, None, "take_screenshot"]
+
+
+def test_automaton_matches_brute_force_on_many_macros():
+    codes = [LIKE, STOP, OKAY, DISLIKE]
+    sequences = [seq for n in (2, 3) for seq in itertools.product(codes, repeat=n)][::3]
+    actions = ["open_photos", "open_notes", "open_calendar", "take_screenshot", "turn_music"]
+    macros = {format_sequence(seq): actions[i % len(actions)] for i, seq in enumerate(sequences)}
+    automaton = MacroAutomaton(macros)
+    assert len(automaton.table) <= 1 + sum(len(seq) for seq in sequences)
+
+    stream = np.random.default_rng(0).choice(codes, size=500)
+    history = []
+    for i, code in enumerate(stream):
+        history.append(GestureCode(code))
+        fired = automaton.advance(code, float(i))
+        # Эталон: самый длинный макрос, которым заканчивается история после последнего срабатывания
+        suffixes = [format_sequence(history[-n:]) for n in (3, 2) if len(history) >= n]
+        expected = next((macros[suffix] for suffix in suffixes if suffix in macros), None)
+        assert fired == expected
+        if fired:
+            history.clear()
+
+
+def test_macro_gestures_are_tracked():
+    automaton = MacroAutomaton({"is_stop is_stop > is_like": "open_photos"})
+    assert automaton.gestures == {GestureCode.TWO_STOPS, LIKE}
+    automaton.compile({"is_okay > is_like": "open_photos"})
+    assert automaton.gestures == {OKAY, LIKE}
+
+
+def test_macro_actions_run_through_the_public_action_keys():
+    class _Actions:
+        def __init__(self):
+            self.keys = []
+
+        def run_action(self, key):
+            self.keys.append(key)
+            return key
+
+    single, two = _Actions(), _Actions()
+    assert MACRO_ACTIONS == {"open_photos", "open_notes", "open_calendar", "take_screenshot", "turn_music"}
+    assert run_macro_action("open_notes", single, two) == "open_notes"
+    assert run_macro_action("turn_music", single, two) == "turn_music"
+    assert (single.keys, two.keys) == (["open_notes"], ["turn_music"])
+
+
+def test_processor_runs_macro_after_confirmed_gestures():
+    settings = Settings(action_backend="dry-run", macros={"is_like > is_stop": "turn_music"})
+    processor = HandsProcessor(settings)
+    fired, timestamp = [], 0.0
+    for pose in ("is_like", "is_stop"):
+        results = make_results(POSES[pose][None], ["Right"])
+        for _ in range(GESTURE_THRESHOLD + round(ACTION_COOLDOWN_SECONDS * 30)):
+            timestamp += 1 / 30
+            gesture = processor.classify_hands(results.multi_hand_landmarks, results.multi_handedness, timestamp)
+            if gesture:
+                fired.append(gesture)
+                break
+
+    assert fired == [LIKE, STOP]
+    # Шаги макроса выполняют и свои действия: Фото и Календарь открываются по пути к макросу
+    assert processor.backend.calls == [("open_app", "Photos"), ("open_app", "Calendar"), ("activate_app", "Music")]
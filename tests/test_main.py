@@ -0,0 +1,17 @@
+from src.main import parse_settings
+from src.settings.config import Settings
+
+
+def test_capture_options_override_settings():
+    settings = parse_settings(["--width", "1280", "--height", "720", "--fps", "60", "--fourcc", "YUYV"])
+    assert (settings.frame_width, settings.frame_height, settings.fps, settings.fourcc) == (1280, 720, 60, "YUYV")
+
+
+def test_defaults_come_from_settings():
+    defaults = Settings(fps=15, clip_dir="clips")
+    settings = parse_settings([], defaults)
+    assert settings == defaults
+
+
+def test_zero_keeps_driver_default():
+    assert parse_settings(["--width", "0", "--fourcc", ""]).frame_width == 0
@@ -0,0 +1,75 @@
+import tracemalloc
+
+import numpy as np
+
+from src.detection.synthetic import generate_poses
+from src.handlers.camera_handler import process_video
+from src.handlers.memory_profiler import MemoryProfiler
+from src.handlers.simulation import FakeHands, FakeVideoCapture, HeadlessSink
+from src.settings.config import Settings
+
+
+def test_disabled_profiler_is_a_no_op():
+    profiler = MemoryProfiler(enabled=False).start()
+    with profiler.stage("infer"):
+        pass
+    profiler.tick()
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
+    assert profiler.samples == [] and profiler.stage_allocated == {}
+
+
+def test_allocations_are_attributed_to_stages():
+    profiler = MemoryProfiler().start()
+    kept = []
+    with profiler.stage("leaky"):
+        kept.append(bytearray(2 ** 20))
+    with profiler.stage("clean"):
+        bytearray(2 ** 20)
+    profiler.stop()
+
+    assert profiler.stage_allocated["leaky"] >= 2 ** 20
+    assert profiler.stage_allocated.get("clean", 0) < 2 ** 16
+    assert not tracemalloc.is_tracing()
+
+
+def test_report_is_written(tmp_path):
+    profiler = MemoryProfiler(interval=0).start()
+    for i in range(3):
+        with profiler.stage("capture"):
+            np.zeros(1000)
+        profiler.tick(float(i))
+    path = tmp_path / "reports" / "memory.txt"
+    profiler.stop(str(path))
+
+    report = path.read_text()
+    assert "Memory profile: 3 frames" in report
+    assert "Traced memory by stage" in report and "capture" in report
+    assert "allocation changes since the first snapshot" in report
+    assert len(profiler.samples) == 4
+
+
+def test_long_simulated_session_memory_is_bounded():
+    # Тысячи кадров через весь конвейер: память после прогрева не должна расти
+    frames = 3000
+    stop, like = generate_poses("is_stop", 1), generate_poses("is_like", 1)
+    script = [stop] * 70 + [None] * 10 + [like] * 70 + [None] * 10
+    capture = FakeVideoCapture([np.zeros((120, 160, 3), dtype=np.uint8)], loop=True)
+    profiler = MemoryProfiler(interval=10.0)
+
+    process_video(
+        Settings(action_backend="dry-run", memory_report_path=""),
+        capture=capture,
+        hands=FakeHands(script, loop=True),
+        sink=HeadlessSink(quit_after=frames),
+        clock=capture.clock,
+        profiler=profiler,
+    )
+
+    assert profiler.frames == frames
+    warm = next(s for s in profiler.samples if s.frame >= frames // 5)
+    last = profiler.samples[-1]
+    assert last.traced - warm.traced < 256 * 1024
+    assert last.rss - warm.rss < 32 * 2 ** 20
+    stages = set(profiler.stage_allocated) | set(profiler.stage_released)
+    assert {"capture", "infer", "classify", "render", "display"} <= stages
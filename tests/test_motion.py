@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.detection.motion import LandmarkHistory, MotionDetector
+from src.models import GestureCode
+
+
+def _points(x, y):
+    return np.tile(np.array([x, y], dtype=np.float32), (6, 1))
+
+
+def _run(detector, path):
+    detected = []
+    for i, (x, y) in enumerate(path):
+        gesture = detector.update(_points(x, y), i / 30)
+        if gesture:
+            detected.append(gesture)
+    return detected
+
+
+@pytest.mark.parametrize(
+    "dx, dy, expected",
+    [
+        (0.05, 0.0, GestureCode.SWIPE_RIGHT),
+        (-0.05, 0.0, GestureCode.SWIPE_LEFT),
+        (0.0, -0.05, GestureCode.SWIPE_UP),
+        (0.0, 0.05, GestureCode.SWIPE_DOWN),
+    ],
+)
+def test_swipe_directions(dx, dy, expected):
+    path = [(0.5 + dx * i, 0.5 + dy * i) for i in range(8)]
+    assert _run(MotionDetector(), path) == [expected]
+
+
+def test_circle():
+    path = [(0.5 + 0.15 * math.cos(a), 0.5 + 0.15 * math.sin(a)) for a in np.linspace(0, 2 * math.pi, 28)]
+    assert _run(MotionDetector(), path) == [GestureCode.CIRCLE]
+
+
+def test_still_hand_has_no_motion_gesture():
+    rng = np.random.default_rng(0)
+    path = 0.5 + rng.normal(0, 0.002, (100, 2))
+    assert _run(MotionDetector(), path) == []
+
+
+def test_slow_drift_is_not_a_swipe():
+    path = [(0.2 + 0.01 * i, 0.5) for i in range(60)]
+    assert _run(MotionDetector(), path) == []
+
+
+def test_history_window_features():
+    history = LandmarkHistory(capacity=4)
+    for i in range(6):
+        history.push(_points(0.1 * i, 0.0), i * 0.1)
+    assert history.size == 4
+    assert np.allclose(history.displacement(3), [0.3, 0.0])
+    assert history.path_length(3) == pytest.approx(0.3)
+    assert history.duration(3) == pytest.approx(0.3)
+    assert np.allclose(history.velocity, [1.0, 0.0])
+
+
+def test_single_jump_is_not_a_swipe():
+    path = [(0.2, 0.5)] * 5 + [(0.6, 0.5)] * 5
+    assert _run(MotionDetector(), path) == []
+
+
+def test_reappearing_after_gap_is_not_a_swipe():
+    detector = MotionDetector()
+    for i in range(5):
+        assert detector.update(_points(0.2 + 0.01 * i, 0.5), i / 30) is None
+    # The hand returns a third of a second later, further along
+    for i in range(5):
+        assert detector.update(_points(0.5 + 0.01 * i, 0.5), 0.5 + i / 30) is None
+
+
+def test_too_fast_swipe_is_rejected():
+    detector = MotionDetector()
+    detected = [detector.update(_points(0.2 + 0.1 * i, 0.5), i / 1000) for i in range(6)]
+    assert not any(detected)
+
+
+def test_history_restarts_on_large_step():
+    history = LandmarkHistory()
+    for i in range(3):
+        history.push(_points(0.01 * i, 0.0), i / 30)
+    history.push(_points(0.5, 0.0), 0.1)
+    assert history.size == 1
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.actions import TwoHandsActions
+from src.detection.rules import classify_pip_rules, classify_rules, combine_codes
+from src.detection.synthetic import POSES
+from src.handlers import HandsProcessor
+from src.handlers.hand_tracker import HandTracker
+from src.handlers.pipeline import Frame, Pipeline, recognition_stages
+from src.handlers.simulation import FakeHands, make_results
+from src.models import GestureCode, code_table
+from src.settings.config import Settings
+
+LIKE, STOP, OKAY = GestureCode.LIKE, GestureCode.STOP, GestureCode.OKAY
+
+
+def _row(*poses, spacing=0.25):
+    # Руки в ряд по горизонтали, центр ряда — в исходном положении шаблона
+    offsets = (np.arange(len(poses)) - (len(poses) - 1) / 2) * spacing
+    return np.stack([POSES[pose] + (offset, 0, 0) for pose, offset in zip(poses, offsets)]).astype(np.float32)
+
+
+@pytest.mark.parametrize("classify", [classify_rules, classify_pip_rules])
+def test_rules_classify_templates(classify):
+    landmarks = np.stack([POSES[name] for name in ("is_like", "is_dislike", "is_stop", "is_okay", "none")])
+    assert classify(landmarks).tolist() == [1, 2, 3, 4, 0]
+    assert classify(landmarks[:0]).shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "codes, gesture, members",
+    [
+        ([], GestureCode.NONE, []),
+        ([0, 0, 0], GestureCode.NONE, []),
+        ([STOP], STOP, [0]),
+        ([0, LIKE, 0, 0], LIKE, [1]),
+        ([STOP, STOP], GestureCode.TWO_STOPS, [0, 1]),
+        ([STOP, 0, STOP, STOP], GestureCode.TWO_STOPS, [0, 2, 3]),
+        ([LIKE, LIKE, STOP, STOP, STOP], GestureCode.TWO_STOPS, [2, 3, 4]),
+        ([STOP, STOP, LIKE], GestureCode.TWO_STOPS, [0, 1]),
+        ([LIKE, STOP], GestureCode.NONE, []),
+        ([GestureCode.CIRCLE, GestureCode.CIRCLE], GestureCode.NONE, []),
+    ],
+)
+def test_combine_codes(codes, gesture, members):
+    combined, indices = combine_codes(codes)
+    assert combined is gesture
+    assert indices.tolist() == members
+
+
+def test_tracker_identifies_hands_by_position():
+    tracker = HandTracker()
+    first = tracker.identify([(0.2, 0.5), (0.5, 0.5), (0.8, 0.5)])
+    assert len(set(first)) == 3
+    tracker.update(first, [STOP] * 3, positions=np.array([(0.2, 0.5), (0.5, 0.5), (0.8, 0.5)]))
+
+    # Порядок рук изменился, руки немного сдвинулись, одна ушла и появилась новая
+    again = tracker.identify([(0.82, 0.52), (0.19, 0.5), (0.5, 0.1)])
+    assert again[:2] == [first[2], first[0]]
+    assert again[2] not in first
+
+
+def test_group_confirms_two_hand_gesture_through_reordering():
+    processor = HandsProcessor(Settings(action_backend="dry-run"))
+    hands = _row("is_stop", "none", "is_stop", "is_stop")
+    order = np.array([0, 1, 2, 3])
+    rng = np.random.default_rng(0)
+    for frame in range(10):
+        # Одинаковая handedness у всех рук: личность руки держится только по положению запястья
+        rng.shuffle(order)
+        results = make_results(hands[order], ["Right"] * 4)
+        processor.classify_hands(results.multi_hand_landmarks, results.multi_handedness, frame / 30)
+
+    assert len(processor.tracker.tracks) == 4
+    assert processor.previous_gesture is GestureCode.TWO_STOPS
+    assert processor.gesture_count == 10
+
+
+def test_single_gesture_among_idle_hands():
+    processor = HandsProcessor(Settings(action_backend="dry-run"))
+    results = make_results(_row("none", "is_like", "none"))
+    processor.classify_hands(results.multi_hand_landmarks, results.multi_handedness, 0.0)
+    assert processor.previous_gesture == LIKE
+
+
+def test_max_num_hands_drops_to_one_without_two_hand_actions():
+    processor = HandsProcessor(Settings(action_backend="dry-run", max_num_hands=4))
+    assert processor.two_actions.is_active()
+    assert processor.max_num_hands == 4
+
+    # Жест двумя руками в интерфейсе привязан к "none"
+    processor.two_actions._ui_mapping = code_table({GestureCode.TWO_STOPS: TwoHandsActions._no_action})
+    assert not processor.two_actions.is_active()
+    assert processor.max_num_hands == 1
+
+
+def test_pipeline_combines_many_hands():
+    hands = _row("is_stop", "is_okay", "is_stop")
+    processor = HandsProcessor(Settings(action_backend="dry-run", max_num_hands=3))
+    pipeline = Pipeline(recognition_stages(processor, FakeHands([make_results(hands)])))
+    frame = pipeline.process(Frame(0, 0.0, np.zeros((48, 64, 3), dtype=np.uint8)))
+    assert len(frame.landmarks) == 3 and len(frame.tracks) == 3
+    assert processor.previous_gesture is GestureCode.TWO_STOPS
@@ -0,0 +1,55 @@
+import numpy as np
+
+from src.detection.overlay import HAND_CONNECTIONS, LandmarkOverlay, fit_size
+
+
+def _hands(n):
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.1, 0.9, (n, 21, 3)).astype(np.float32)
+
+
+def test_connections_cover_all_landmarks():
+    assert len(HAND_CONNECTIONS) == 21
+    assert set(HAND_CONNECTIONS.ravel()) == set(range(21))
+
+
+def test_draws_joints_and_connections():
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    landmarks = _hands(2)
+    LandmarkOverlay().draw(frame, landmarks)
+
+    x, y = np.rint(landmarks[0, 0, :2] * (160, 120)).astype(int)
+    assert frame[y, x, 1] > 0
+    assert frame[..., 0].any()
+
+
+def test_disabled_overlay_leaves_frame_untouched():
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    LandmarkOverlay(enabled=False).draw(frame, _hands(3))
+    assert not frame.any()
+
+
+def test_no_hands():
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    assert LandmarkOverlay().draw(frame, np.empty((0, 21, 3))) is frame
+    assert not frame.any()
+
+
+def test_render_at_preview_size():
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    preview = LandmarkOverlay().render(frame, _hands(1), (320, 240))
+    assert preview.shape == (240, 320, 3)
+    assert preview.any()
+    assert not frame.any()
+
+
+def test_fit_size_keeps_aspect_ratio():
+    assert fit_size((640, 480), (400, 400)) == (400, 300)
+    assert fit_size((640, 480), (1, 1)) == (1, 1)
+
+
+def test_fit_size_treats_non_positive_bounds_as_unbounded():
+    assert fit_size((640, 480), (0, 0)) == (640, 480)
+    assert fit_size((640, 480), (320, 0)) == (320, 240)
+    assert fit_size((640, 480), (-5, 240)) == (320, 240)
+    assert fit_size((0, 0), (100, 100)) == (100, 100)
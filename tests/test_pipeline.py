@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.detection.synthetic import POSES
+from src.handlers import HandsProcessor
+from src.handlers.pipeline import Frame, FunctionStage, Pipeline, Render, capture_frames, recognition_stages
+from src.handlers.simulation import FakeHands, FakeVideoCapture, HeadlessSink
+from src.models import GestureCode
+from src.settings.config import Settings
+from src.settings.constants import GESTURE_THRESHOLD
+from src.tools.record_landmarks import record
+
+
+def _frames(count):
+    return [Frame(i, i / 30, np.zeros((48, 64, 3), dtype=np.uint8)) for i in range(count)]
+
+
+def test_stages_run_in_order_and_are_timed():
+    seen = []
+    first = FunctionStage("first", lambda frame: seen.append(("first", frame.index)) or frame)
+    # Нечётные кадры отбрасываются и до второй стадии не доходят
+    drop = FunctionStage("drop_odd", lambda frame: None if frame.index % 2 else frame)
+    second = FunctionStage("second", lambda frame: seen.append(("second", frame.index)) or frame)
+
+    pipeline = Pipeline([first, drop, second])
+    out = [frame.index for frame in pipeline.run(_frames(4))]
+
+    assert out == [0, 2]
+    assert seen == [("first", 0), ("second", 0), ("first", 1), ("first", 2), ("second", 2), ("first", 3)]
+    assert {name: stats.calls for name, stats in pipeline.stats.items()} == {
+        "first": 4, "drop_odd": 4, "second": 2, "source": 5,
+    }
+    assert all(stats.total >= 0 for stats in pipeline.stats.values())
+    assert "drop_odd" in pipeline.report()
+
+
+def test_stop_ends_the_run_without_reading_further():
+    capture = FakeVideoCapture([np.zeros((4, 4, 3), dtype=np.uint8)] * 10)
+
+    def stop_at_third(frame):
+        frame.stop = frame.index == 2
+        return frame
+
+    pipeline = Pipeline([FunctionStage("stop", stop_at_third)])
+    assert [frame.index for frame in pipeline.run(capture_frames(capture, capture.clock))] == [0, 1, 2]
+    assert capture.index == 3
+
+
+def test_process_pushes_a_single_frame():
+    pipeline = Pipeline([FunctionStage("drop", lambda frame: None)])
+    assert pipeline.process(_frames(1)[0]) is None
+    assert pipeline.stats["drop"].calls == 1
+
+
+def test_recognition_stages_match_classify_hands():
+    settings = Settings(action_backend="dry-run")
+    processor = HandsProcessor(settings)
+    stages = recognition_stages(processor, FakeHands([POSES["is_stop"][None]], loop=True))
+    render = Render()
+    pipeline = Pipeline(stages + [render])
+
+    fired = [frame for frame in pipeline.run(_frames(GESTURE_THRESHOLD + 5)) if frame.gesture]
+    assert [frame.index + 1 for frame in fired] == [GESTURE_THRESHOLD]
+    assert fired[0].gesture is GestureCode.STOP and fired[0].action == "✋"
+    assert fired[0].output.shape == (48, 64, 3)
+    assert processor.backend.calls == [("open_app", "Calendar")]
+
+
+def test_render_skips_frames_that_are_not_shown():
+    # Превью с частотой 10 кадров/с при камере 30 кадров/с: рисуется каждый третий кадр
+    shown = []
+
+    def due(frame):
+        if shown and frame.timestamp - shown[-1] < 0.1 - 1e-9:
+            return False
+        shown.append(frame.timestamp)
+        return True
+
+    rendered = [frame.index for frame in Pipeline([Render(due=due)]).run(_frames(9)) if frame.output is not None]
+    assert rendered == [0, 3, 6]
+
+
+@pytest.mark.parametrize("mirror", [False, True])
+def test_mirror_flips_before_inference(mirror):
+    image = np.zeros((4, 8, 3), dtype=np.uint8)
+    image[:, 0] = 255
+    hands = FakeHands([None])
+    stages = recognition_stages(HandsProcessor(Settings(action_backend="dry-run")), hands, mirror=mirror)
+    frame = Pipeline(stages).process(Frame(0, 0.0, image))
+    assert frame.rgb[0, -1 if mirror else 0, 0] == 255
+
+
+def test_record_landmarks_uses_the_pipeline(tmp_path):
+    script = [POSES["is_like"][None], None, POSES["is_like"][None], POSES["is_like"][None]]
+    capture = FakeVideoCapture([np.zeros((48, 64, 3), dtype=np.uint8)] * 10)
+    sink = HeadlessSink()
+    out = tmp_path / "like.npz"
+
+    assert record("is_like", str(out), 3, 0, capture=capture, hands=FakeHands(script), sink=sink) == 3
+    assert sink.frames_shown == 4
+    data = np.load(out)
+    assert data["landmarks"].shape == (3, 21, 3)
+    assert list(data["labels"]) == ["is_like"] * 3
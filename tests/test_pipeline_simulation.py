@@ -0,0 +1,103 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.actions import DryRunBackend
+from src.handlers import HandsProcessor
+from src.handlers.camera_handler import process_video
+from src.models import GestureCode
+from src.handlers.simulation import FakeHands, FakeVideoCapture, HeadlessSink, make_results
+from src.settings.config import Settings
+from src.settings.constants import GESTURE_THRESHOLD
+
+FPS = 30.0
+
+
+def _stop_hand(x_offset=0.0):
+    """Открытая ладонь: все пальцы выпрямлены вверх и к камере"""
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[0] = (0.5 + x_offset, 0.8, 0.0)
+    for finger, x in enumerate((0.62, 0.55, 0.5, 0.45, 0.4)):
+        for joint in range(4):
+            index = 1 + finger * 4 + joint
+            hand[index] = (x + x_offset + (0.02 * joint if finger == 0 else 0), 0.65 - 0.1 * joint, -0.02 * joint)
+    return hand
+
+
+class _TimedBackend(DryRunBackend):
+    """Запоминает номер кадра, на котором было вызвано действие"""
+
+    def __init__(self, capture):
+        super().__init__()
+        self.capture = capture
+        self.frames = []
+
+    def _record(self, *call):
+        self.frames.append(self.capture.index)
+        return super()._record(*call)
+
+
+def _run(script, frames, sink=None):
+    settings = Settings(action_backend="dry-run")
+    capture = FakeVideoCapture([np.zeros((48, 64, 3), dtype=np.uint8)] * frames, fps=FPS)
+    processor = HandsProcessor(settings)
+    backend = _TimedBackend(capture)
+    processor.single_actions.backend = processor.two_actions.backend = backend
+    sink = sink or HeadlessSink()
+    process_video(settings, capture=capture, hands=FakeHands(script, loop=True), sink=sink, processor=processor, clock=capture.clock)
+    return backend, sink, processor
+
+
+def test_held_gesture_is_dispatched_once_confirmed():
+    backend, sink, _ = _run([_stop_hand()[None]], frames=60)
+    assert backend.calls == [("open_app", "Calendar")]
+    assert backend.frames == [GESTURE_THRESHOLD]
+    assert sink.frames_shown == 60
+
+
+def test_cooldown_uses_frame_time():
+    backend, _, _ = _run([_stop_hand()[None]], frames=150)
+    # 2 секунды перезарядки = 60 кадров при 30 FPS
+    assert len(backend.frames) == 2
+    assert backend.frames[1] - backend.frames[0] in (60, 61)
+
+
+def test_no_hands_no_actions():
+    backend, sink, processor = _run([None], frames=100)
+    assert backend.calls == []
+    assert processor.previous_gesture is None
+    assert sink.frames_shown == 100
+
+
+def test_two_hands_with_order_flips_confirm_without_restart():
+    hands = np.stack([_stop_hand(-0.2), _stop_hand(0.2)])
+    script = [make_results(hands, ["Left", "Right"]), make_results(hands[::-1], ["Right", "Left"])]
+    _, _, processor = _run(script, frames=GESTURE_THRESHOLD - 1)
+    assert processor.previous_gesture == GestureCode.TWO_STOPS
+    assert processor.gesture_count == GESTURE_THRESHOLD - 1
+
+
+def test_quit_key_stops_the_loop():
+    _, sink, _ = _run([None], frames=100, sink=HeadlessSink(quit_after=10))
+    assert sink.frames_shown == 10
+
+
+def test_pipeline_runs_faster_than_real_time():
+    frames = 300
+    start = time.perf_counter()
+    backend, _, _ = _run([_stop_hand()[None]], frames=frames)
+    elapsed = time.perf_counter() - start
+    assert elapsed < frames / FPS
+    assert len(backend.calls) == 5
+
+
+@pytest.mark.parametrize("loop", [False, True])
+def test_fake_capture(loop):
+    frames = [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(3)]
+    capture = FakeVideoCapture(frames, loop=loop)
+    values = []
+    for _ in range(5):
+        ok, frame = capture.read()
+        values.append(int(frame[0, 0, 0]) if ok else None)
+    assert values == ([0, 1, 2, 0, 1] if loop else [0, 1, 2, None, None])
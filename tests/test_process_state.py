@@ -0,0 +1,96 @@
+import sys
+import time
+from types import SimpleNamespace
+
+from src.actions import DryRunBackend, LinuxBackend, SingleHandActions, TwoHandsActions
+from src.actions.process_state import ProcessMonitor, spawn
+
+
+def _monitor(names, interval=60.0):
+    running = list(names)
+    source = lambda attrs: [SimpleNamespace(info={"name": name}) for name in running]
+    monitor = ProcessMonitor(interval, process_iter=source)
+    monitor.refresh()
+    return monitor, running
+
+
+def test_snapshot_is_cached_between_refreshes():
+    monitor, running = _monitor(["Photos", "python3"])
+    assert monitor.is_running("photos") and not monitor.is_running("Notes")
+    running.append("Notes")
+    # Запрос не обходит таблицу процессов — до следующего снимка ничего не меняется
+    assert not monitor.is_running("Notes")
+    monitor.refresh()
+    assert monitor.is_running("Notes")
+    monitor.close()
+
+
+def test_background_thread_refreshes_lazily():
+    monitor = ProcessMonitor(0.01, process_iter=lambda attrs: [SimpleNamespace(info={"name": "Music"})])
+    assert monitor._thread is None and monitor.refreshes == 0
+    monitor.is_running("Music")
+    deadline = time.monotonic() + 2
+    while monitor.refreshes < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert monitor.is_running("Music")
+    monitor.close()
+    assert not monitor._thread.is_alive()
+
+
+def test_repeated_gestures_skip_the_launch():
+    monitor, running = _monitor([])
+    backend = DryRunBackend(processes=monitor)
+    actions = SingleHandActions(backend)
+    actions.get_action("is_like")
+    running.append("Photos")
+    monitor.refresh()
+    actions.get_action("is_like")
+    # Запущенные «Фото» не перезапускаются и не активируются — повтор жеста ничего не стоит
+    actions.get_action("is_dislike")
+    actions.get_action("is_like")
+    assert backend.calls == [("open_app", "Photos"), ("open_app", "Notes")]
+
+
+def test_running_music_is_left_alone():
+    monitor, _ = _monitor(["Music"])
+    backend = DryRunBackend(processes=monitor)
+    actions = TwoHandsActions(backend)
+    assert actions.get_action("is_two_stops") == "🎵 Music opened"
+    assert actions.get_action("is_two_stops") == "🎵 Music opened"
+    assert backend.calls == []
+    monitor, _ = _monitor([])
+    backend = DryRunBackend(processes=monitor)
+    TwoHandsActions(backend).get_action("is_two_stops")
+    assert backend.calls == [("activate_app", "Music")]
+
+
+def test_without_monitor_every_trigger_launches():
+    backend = DryRunBackend()
+    actions = SingleHandActions(backend)
+    actions.get_action("is_stop")
+    actions.get_action("is_stop")
+    assert backend.calls == [("open_app", "Calendar")] * 2
+
+
+def test_linux_process_names():
+    backend = LinuxBackend(apps={"Calendar": ["gnome-calendar"], "Photos": ["xdg-open", "~/Pictures"]})
+    assert backend.process_name("Calendar") == "gnome-calendar"
+    assert backend.process_name("Photos") is None
+    assert backend.process_name("Firefox") == "firefox"
+    backend.close()
+
+
+def test_linux_drops_a_monitor_that_cannot_match_anything():
+    monitor, _ = _monitor([])
+    backend = LinuxBackend(apps={"Photos": ["xdg-open", "~/Pictures"]}, processes=monitor)
+    assert backend.processes is None and monitor._stop.is_set() and monitor._thread is None
+    backend.close()
+
+
+def test_spawned_processes_are_reaped():
+    process = spawn([sys.executable, "-c", "pass"])
+    # Процесс подбирается сразу после завершения, не дожидаясь следующего запуска
+    deadline = time.monotonic() + 10
+    while process.returncode is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert process.returncode == 0
@@ -4,34 +4,42 @@ import subprocess
 import time
 import os
 
+class _Process:
+    """Подмена процесса из subprocess.Popen: сразу завершается"""
+    def __init__(self, cmd):
+        self.cmd = cmd
+
+    def wait(self, timeout=None):
+        return 0
+
 @pytest.fixture
 def actions():
     return SingleHandActions()
 
 def test_like_gesture_action(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     result = actions.get_action("is_like")
     assert result == "👍"
     assert called['cmd'] == ["open", "-a", "Photos"]
 
 def test_dislike_gesture_action(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     result = actions.get_action("is_dislike")
     assert result == "👎"
     assert called['cmd'] == ["open", "-a", "Notes"]
 
 def test_stop_gesture_action(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     result = actions.get_action("is_stop")
     assert result == "✋"
     assert called['cmd'] == ["open", "-a", "Calendar"]
 
 def test_okay_gesture_action(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     monkeypatch.setattr(time, "strftime", lambda fmt: "2024-01-01_12-00-00")
     monkeypatch.setattr(os.path, "expanduser", lambda path: "/mocked/path/screenshot_2024-01-01_12-00-00.png")
     result = actions.get_action("is_okay")
@@ -45,7 +53,7 @@ def test_unknown_gesture(actions):
 
 def test_like_gesture_action_multiple(monkeypatch, actions):
     called = []
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.append(cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.append(cmd)))
     for _ in range(3):
         result = actions.get_action("is_like")
         assert result == "👍"
@@ -53,7 +61,7 @@ def test_like_gesture_action_multiple(monkeypatch, actions):
 
 def test_dislike_gesture_action_multiple(monkeypatch, actions):
     called = []
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.append(cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.append(cmd)))
     for _ in range(2):
         result = actions.get_action("is_dislike")
         assert result == "👎"
@@ -61,7 +69,7 @@ def test_dislike_gesture_action_multiple(monkeypatch, actions):
 
 def test_stop_gesture_action_multiple(monkeypatch, actions):
     called = []
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.append(cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.append(cmd)))
     for _ in range(4):
         result = actions.get_action("is_stop")
         assert result == "✋"
@@ -69,7 +77,7 @@ def test_stop_gesture_action_multiple(monkeypatch, actions):
 
 def test_okay_gesture_action_multiple(monkeypatch, actions):
     called = []
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.append(cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.append(cmd)))
     monkeypatch.setattr(time, "strftime", lambda fmt: "2024-01-01_12-00-00")
     monkeypatch.setattr(os.path, "expanduser", lambda path: "/mocked/path/screenshot_2024-01-01_12-00-00.png")
     for _ in range(2):
@@ -79,28 +87,28 @@ def test_okay_gesture_action_multiple(monkeypatch, actions):
 
 def test_like_gesture_action_case(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     result = actions.get_action("IS_LIKE".lower())
     assert result == "👍"
     assert called['cmd'] == ["open", "-a", "Photos"]
 
 def test_dislike_gesture_action_case(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     result = actions.get_action("IS_DISLIKE".lower())
     assert result == "👎"
     assert called['cmd'] == ["open", "-a", "Notes"]
 
 def test_stop_gesture_action_case(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     result = actions.get_action("IS_STOP".lower())
     assert result == "✋"
     assert called['cmd'] == ["open", "-a", "Calendar"]
 
 def test_okay_gesture_action_case(monkeypatch, actions):
     called = {}
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: called.setdefault('cmd', cmd))
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(called.setdefault('cmd', cmd)))
     monkeypatch.setattr(time, "strftime", lambda fmt: "2024-01-01_12-00-00")
     monkeypatch.setattr(os.path, "expanduser", lambda path: "/mocked/path/screenshot_2024-01-01_12-00-00.png")
     result = actions.get_action("IS_OKAY".lower())
@@ -108,25 +116,25 @@ def test_okay_gesture_action_case(monkeypatch, actions):
     assert called['cmd'][0] == "screencapture"
 
 def test_private_like(monkeypatch, actions):
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: None)
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(cmd))
     assert actions._like_gesture_action() == "👍"
 
 def test_private_dislike(monkeypatch, actions):
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: None)
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(cmd))
     assert actions._dislike_gesture_action() == "👎"
 
 def test_private_stop(monkeypatch, actions):
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: None)
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(cmd))
     assert actions._stop_gesture_action() == "✋"
 
 def test_private_okay(monkeypatch, actions):
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: None)
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(cmd))
     monkeypatch.setattr(time, "strftime", lambda fmt: "2024-01-01_12-00-00")
     monkeypatch.setattr(os.path, "expanduser", lambda path: "/mocked/path/screenshot_2024-01-01_12-00-00.png")
     assert actions._okay_gesture_action() == "👌"
 
 def test_no_side_effects(monkeypatch, actions):
-    monkeypatch.setattr(subprocess, "Popen", lambda cmd: None)
+    monkeypatch.setattr(subprocess, "Popen", lambda cmd: _Process(cmd))
     before = actions.__dict__.copy()
     actions.get_action("is_like")
     after = actions.__dict__.copy()
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from src.detection.classifiers import NO_GESTURE_LABEL, train_mlp
+from src.detection.synthetic import POSES, generate_dataset, generate_poses
+from src.tools.benchmark_classifiers import disagreements, rule_classifiers, run_benchmark
+
+
+@pytest.fixture(scope="module")
+def classifiers():
+    return rule_classifiers()
+
+
+def test_generator_shape_and_reproducibility():
+    landmarks, labels = generate_dataset(10, seed=1)
+    again, _ = generate_dataset(10, seed=1)
+    assert landmarks.shape == (10 * len(POSES), 21, 3)
+    assert landmarks.dtype == np.float32
+    assert sorted(set(labels)) == sorted(POSES)
+    assert np.array_equal(landmarks, again)
+
+
+def test_clean_template_is_returned_without_variation():
+    hands = generate_poses("is_stop", 3, rotation=0, scale=(1, 1), translation=0, noise=0)
+    assert np.allclose(hands, POSES["is_stop"])
+
+
+def test_rotation_keeps_hand_size():
+    hands = generate_poses("is_like", 50, rotation=90, scale=(1, 1), translation=0, noise=0)
+    size = np.linalg.norm(hands[:, 9, :2] - hands[:, 0, :2], axis=1)
+    template = np.linalg.norm(POSES["is_like"][9, :2] - POSES["is_like"][0, :2])
+    assert np.allclose(size, template, atol=1e-5)
+
+
+def test_occlusion_displaces_landmarks():
+    clean = generate_poses("is_okay", 100, noise=0, rng=np.random.default_rng(0))
+    occluded = generate_poses("is_okay", 100, noise=0, occlusion=0.5, rng=np.random.default_rng(0))
+    moved = np.any(clean != occluded, axis=2).mean()
+    assert 0.3 < moved < 0.7
+
+
+def test_rule_classifiers_recognize_mild_variation(classifiers):
+    # Оба классификатора на правилах должны узнавать шаблоны при небольших искажениях
+    landmarks, labels = generate_dataset(50, seed=2, rotation=5, noise=0.001)
+    results = run_benchmark(classifiers, landmarks)
+    for predicted, rate in results.values():
+        assert np.array_equal(predicted, labels)
+        assert rate > 0
+
+
+def test_batch_rules_match_per_hand_rules(classifiers):
+    # Векторизованные правила должны давать те же ответы, что и разбор каждой руки по отдельности
+    landmarks, _ = generate_dataset(200, seed=5, rotation=30, noise=0.01, occlusion=0.05)
+    results = run_benchmark(classifiers, landmarks)
+    assert np.array_equal(results["rules (batch)"][0], results["HandsProcessor"][0])
+
+
+def test_pipeline_classify_matches_rules_on_reliable_hands(classifiers):
+    # Стадия Classify отбрасывает ненадёжные руки, остальные распознаёт теми же правилами
+    landmarks, _ = generate_dataset(200, seed=5, rotation=30, noise=0.01, occlusion=0.05)
+    results = run_benchmark(classifiers, landmarks)
+    pipeline, rules = results["pipeline (classify)"][0], results["rules (batch)"][0]
+    differ = pipeline != rules
+    assert np.all(pipeline[differ] == NO_GESTURE_LABEL)
+    assert differ.mean() < 0.5
+
+
+def test_disagreement_report(classifiers):
+    landmarks, labels = generate_dataset(100, seed=3, rotation=40, noise=0.01, occlusion=0.1)
+    mlp = train_mlp(*generate_dataset(100, seed=4), hidden_size=16, epochs=100)
+    per_hand = {name: classifiers[name] for name in ("HandsProcessor", "PIP rules (batch)")}
+    results = run_benchmark({**per_hand, "MLP": mlp.classify_batch}, landmarks)
+    predictions = {name: predicted for name, (predicted, _) in results.items()}
+
+    report = disagreements(predictions, labels)
+    assert set(report) == {
+        ("HandsProcessor", "PIP rules (batch)"), ("HandsProcessor", "MLP"), ("PIP rules (batch)", "MLP")
+    }
+    for (first, second), counts in report.items():
+        assert sum(counts.values()) == np.sum(predictions[first] != predictions[second])
+        for (label, a, b), n in counts.items():
+            assert a != b and label in POSES
+            assert n == np.sum((labels == label) & (predictions[first] == a) & (predictions[second] == b))
+    # Сильные искажения должны давать расхождения, в том числе отказы от распознавания
+    rows = [row for counts in report.values() for row in counts]
+    assert rows
+    assert any(NO_GESTURE_LABEL in (a, b) for _, a, b in rows)
@@ -1,8 +1,26 @@
+import io
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from src.actions.two_hands_actions import TwoHandsActions
+from src.event_log import EventLog, set_event_log
 import pickle
 
+
+@pytest.fixture
+def events():
+    stream = io.StringIO()
+    log = EventLog(stream=stream, rate_limit=0)
+    previous = set_event_log(log)
+
+    def read():
+        log.flush()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield read
+    set_event_log(previous)
+    log.close()
+
 # 1. Проверка инициализации класса
 def test_init_default_values():
     obj = TwoHandsActions()
@@ -100,37 +118,41 @@ def test_both_hands_detected_not_changed():
     obj.get_action("is_two_stops")
     assert obj.both_hands_detected is True
 
-# 15. print вызывается с правильным сообщением при распознавании жеста
-def test_print_gesture_recognized(capsys):
+# 15. событие gesture_recognized пишется при распознавании жеста
+def test_event_gesture_recognized(events):
     obj = TwoHandsActions()
     obj.get_action("is_two_stops")
-    captured = capsys.readouterr()
-    assert "Gesture recognized: is_two_stops" in captured.out
+    first = events()[0]
+    assert first["event"] == "gesture_recognized"
+    assert first["gesture"] == "is_two_stops"
 
-# 16. print вызывается с правильным сообщением при успешном открытии приложения
-def test_print_music_app_opened(capsys):
+# 16. событие action_done пишется при успешном открытии приложения
+def test_event_music_app_opened(events):
     obj = TwoHandsActions()
     with patch("subprocess.run") as mock_run:
         mock_run.return_value = MagicMock()
         obj.get_action("is_two_stops")
-        captured = capsys.readouterr()
-        assert "Music app opened successfully" in captured.out
+        last = events()[-1]
+        assert last["event"] == "action_done"
+        assert last["app"] == "Music"
 
-# 17. print вызывается с правильным сообщением при ошибке subprocess
-def test_print_error_opening_music(capsys):
+# 17. событие action_failed пишется при ошибке subprocess
+def test_event_error_opening_music(events):
     obj = TwoHandsActions()
     with patch("subprocess.run", side_effect=Exception("fail")):
         obj.get_action("is_two_stops")
-        captured = capsys.readouterr()
-        assert "Unexpected error" in captured.out
+        last = events()[-1]
+        assert last["event"] == "action_failed"
+        assert "Unexpected error" in last["error"]
 
-# 18. print вызывается с правильным сообщением при неожиданной ошибке
-def test_print_unexpected_error(capsys):
+# 18. событие action_failed пишется при неожиданной ошибке
+def test_event_unexpected_error(events):
     obj = TwoHandsActions()
     with patch("subprocess.run", side_effect=Exception("fail")):
         obj.get_action("is_two_stops")
-        captured = capsys.readouterr()
-        assert "Unexpected error" in captured.out
+        last = events()[-1]
+        assert last["event"] == "action_failed"
+        assert "fail" in last["error"]
 
 # 19. get_action возвращает None для нераспознанных жестов
 def test_get_action_none_for_unrecognized():
@@ -51,6 +51,11 @@ DEFAULT_SINGLE_MAPPING = {
     "is_dislike": "open_notes",
     "is_stop": "open_calendar",
     "is_okay": "take_screenshot",
+    "is_swipe_left": "none",
+    "is_swipe_right": "none",
+    "is_swipe_up": "none",
+    "is_swipe_down": "none",
+    "is_circle": "none",
 }
 
 DEFAULT_TWO_MAPPING = {
@@ -58,6 +63,28 @@ DEFAULT_TWO_MAPPING = {
     "is_two_stops": "turn_music",
 }
 
+# Названия жестов для макросов (последовательностей жестов)
+GESTURE_LABELS = {
+    "Like": "is_like",
+    "Dislike": "is_dislike",
+    "Stop": "is_stop",
+    "Okay": "is_okay",
+    "Swipe left": "is_swipe_left",
+    "Swipe right": "is_swipe_right",
+    "Swipe up": "is_swipe_up",
+    "Swipe down": "is_swipe_down",
+    "Circle": "is_circle",
+    "Two hands": "is_stop is_stop",
+}
+
+# Действия, доступные макросам (без "None")
+MACRO_ACTION_KEYS = SINGLE_ACTION_KEYS[:-1] + TWO_ACTION_KEYS[:-1]
+MACRO_ACTION_MAPPING = {key: {**SINGLE_ACTION_MAPPING, **TWO_ACTION_MAPPING}[key] for key in MACRO_ACTION_KEYS}
+MACRO_ACTION_REVERSE = {value: key for key, value in MACRO_ACTION_MAPPING.items()}
+
+# Макросы по умолчанию: последовательность имён жестов -> внутренний ключ действия
+DEFAULT_MACROS = {}
+
 # Старые константы для обратной совместимости (если используются где-то еще)
 ACTION_DEFINITIONS = {
     "open_photos": "Open Photos",
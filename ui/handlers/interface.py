@@ -10,6 +10,7 @@ def apply_mapping(single_map: Dict[str, str], two_map: Dict[str, str]) -> None:
     Monkey-patch action routing so gestures call the selected named action.
     - single_map: Maps gesture name (e.g., 'is_like') to action key (e.g., 'open_photos').
     - two_map: Maps gesture name (e.g., 'is_two_stops') to action key (e.g., 'turn_music').
+    The name-based mapping is translated once into tables indexed by gesture code.
     """
     try:
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -18,6 +19,7 @@ def apply_mapping(single_map: Dict[str, str], two_map: Dict[str, str]) -> None:
 
         from src.actions.single_hand_actions import SingleHandActions
         from src.actions.two_hands_actions import TwoHandsActions
+        from src.models import code_table, to_code
 
         # Store original methods if not already stored
         if not hasattr(SingleHandActions, "_orig_get_action"):
@@ -25,36 +27,28 @@ def apply_mapping(single_map: Dict[str, str], two_map: Dict[str, str]) -> None:
         if not hasattr(TwoHandsActions, "_orig_get_action"):
             TwoHandsActions._orig_get_action = TwoHandsActions.get_action
 
-        # Store the UI mapping on the classes
-        SingleHandActions._ui_mapping = dict(single_map)
-        TwoHandsActions._ui_mapping = dict(two_map)
+        def _no_action(self):
+            return None
 
-        def _patched_single_get_action(self, gesture: str):
-            mapping = getattr(self, "_ui_mapping", {})
-            action_key = mapping.get(gesture)
+        single_actions = {**SingleHandActions.ACTION_KEYS, "none": _no_action}
+        two_actions = {**TwoHandsActions.ACTION_KEYS, "none": TwoHandsActions._no_action}
 
-            action_map = {
-                "open_photos": self._like_gesture_action,
-                "open_notes": self._dislike_gesture_action,
-                "open_calendar": self._stop_gesture_action,
-                "take_screenshot": self._okay_gesture_action,
-                "none": lambda: None,
-            }
+        def _to_table(mapping: Dict[str, str], actions: Dict) -> tuple:
+            return code_table({
+                to_code(gesture): actions[key] for gesture, key in mapping.items() if key in actions and to_code(gesture)
+            })
 
-            action_func = action_map.get(action_key)
-            return action_func() if action_func else self._orig_get_action(gesture)
+        # Store the UI mapping on the classes as tables indexed by gesture code
+        SingleHandActions._ui_mapping = _to_table(single_map, single_actions)
+        TwoHandsActions._ui_mapping = _to_table(two_map, two_actions)
 
-        def _patched_two_get_action(self, gesture: str):
-            mapping = getattr(self, "_ui_mapping", {})
-            action_key = mapping.get(gesture)
+        def _patched_single_get_action(self, gesture):
+            action = self._ui_mapping[to_code(gesture)]
+            return action(self) if action else self._orig_get_action(gesture)
 
-            action_map = {
-                "turn_music": self._two_gesture_action,
-                "none": lambda: None,
-            }
-
-            action_func = action_map.get(action_key)
-            return action_func() if action_func else self._orig_get_action(gesture)
+        def _patched_two_get_action(self, gesture):
+            action = self._ui_mapping[to_code(gesture)]
+            return action(self) if action else self._orig_get_action(gesture)
 
         # Apply the patches
         SingleHandActions.get_action = _patched_single_get_action
@@ -1,14 +1,11 @@
-import sys
-
-from PyQt6.QtWidgets import QApplication
-
-from ui.handlers import GestureMapperWindow
-
 """
 Главный файл для запуска Gesture Mapper приложения
 """
 import sys
+
 from PyQt6.QtWidgets import QApplication
+
+from src.main import parse_settings
 from ui.window.gesture_mapper_window import GestureMapperWindow
 
 
@@ -16,11 +13,12 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Gesture Mapper")
 
-    window = GestureMapperWindow()
+    # Qt убирает из аргументов свои ключи, остальные — те же, что у src/main.py (--width, --fps, ...)
+    window = GestureMapperWindow(parse_settings(app.arguments()[1:]))
     window.show()
 
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
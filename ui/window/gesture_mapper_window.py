@@ -1,18 +1,24 @@
-from typing import Dict
+from typing import Dict, Optional
 import sys
 import os
+import time
 
 import cv2
-from PyQt6.QtCore import Qt, QProcess, QTimer
+from PyQt6.QtCore import Qt, QProcess, QTimer, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QGridLayout,
+    QCheckBox,
     QComboBox,
+    QSpinBox,
     QPushButton,
     QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
     QMessageBox,
     QStackedWidget,
     QHBoxLayout,
@@ -21,8 +27,13 @@ from PyQt6.QtWidgets import (
 
 # Импорты констант и функций
 from ui.core.constants import (
+    DEFAULT_MACROS,
     DEFAULT_SINGLE_MAPPING,
     DEFAULT_TWO_MAPPING,
+    GESTURE_LABELS,
+    MACRO_ACTION_KEYS,
+    MACRO_ACTION_MAPPING,
+    MACRO_ACTION_REVERSE,
     SINGLE_ACTION_KEYS,
     TWO_ACTION_KEYS,
     SINGLE_ACTION_MAPPING,
@@ -31,28 +42,88 @@ from ui.core.constants import (
     TWO_ACTION_REVERSE,
 )
 from ui.handlers.interface import apply_mapping
+from src.actions.macros import SEQUENCE_SEPARATOR, parse_sequence
+from src.handlers.audio_cues import create_cue_player
+from src.handlers.camera_manager import CameraManager
+from src.handlers.capture import open_capture
+from src.handlers.clip_recorder import ClipRecorder
+from src.handlers.governor import create_governor
+from src.handlers.hud import PerformanceHud
+from src.handlers.memory_profiler import MemoryProfiler
+from src.handlers.pipeline import Cues, Frame, FunctionStage, Pipeline, RecordClips, Render, recognition_stages
+from src.event_log import log_event
+from src.detection.overlay import LandmarkOverlay
+from src.detection.zone import ActiveZone
+from src.settings.config import Settings
 
 
 class GestureMapperWindow(QMainWindow):
-    def __init__(self):
+    # Результаты фонового потока камеры; сигналы доставляют их в GUI-поток
+    cameras_found = pyqtSignal(object)
+    camera_ready = pyqtSignal(object)
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """settings — начальные настройки, например из parse_settings (ключи --width, --fps, ...); по умолчанию Settings()"""
         super().__init__()
         self.setWindowTitle("Gesture Mapper")
         self.resize(1200, 750)
+        self.settings = settings or Settings()
 
         # State
         self.single_combos: Dict[str, QComboBox] = {}
         self.two_combos: Dict[str, QComboBox] = {}
+        self.zone_spins: Dict[str, QSpinBox] = {}
 
         # Camera state
         self.cap = None
+        self._capture_info = None
+        self._camera_index = None
+        # Индекс камеры, которая открывается в фоне, пока Start ждёт её
+        self._camera_opening: int | None = None
+        self._frame_index = 0
         self.camera_timer: QTimer | None = None
         self._camera_running = False
         self.video_label: QLabel | None = None
+        # Превью рисуется не чаще частоты обновления экрана и не рисуется, пока окно не видно
+        self._preview_interval = 0.0
+        self._last_preview = float("-inf")
+
+        # HUD производительности: обновляется своим медленным таймером, а не на каждом кадре
+        self.hud: PerformanceHud | None = None
+        self.hud_timer: QTimer | None = None
+        self.hud_label: QLabel | None = None
 
         # Gesture recognition (будет инициализировано при старте)
-        self.gesture_detector = None
-        self.single_actions = None
-        self.two_actions = None
+        self.processor = None  # HandsProcessor: классификация, подтверждение и действия
+        self.hands = None
+        self._hands_max = 0
+        self._hands_complexity = 1
+        self.pipeline = None
+        self.governor = None  # ResourceGovernor: снижает качество при нехватке CPU
+        self.action_backend = None
+        self.clip_recorder = None
+        # Звуковые сигналы: поток вывода открывается один раз и живёт до закрытия окна
+        self.cue_player = None
+
+        # Профилирование памяти (включается в Settings.memory_profile)
+        self.memory_profiler = MemoryProfiler(
+            self.settings.memory_profile, interval=self.settings.memory_profile_interval
+        ).start()
+
+        # Подменяемые зависимости (камера, MediaPipe) — для headless-запуска в тестах
+        self.capture_factory = open_capture
+        self.hands_factory = None
+
+        # Камеры перечисляются и открываются в фоновом потоке; остановленная камера по желанию
+        # остаётся открытой, но не дольше camera_warm_seconds
+        self.camera_manager = CameraManager(
+            self.settings,
+            lambda settings, index: self.capture_factory(settings, index),
+            self.settings.keep_camera_warm,
+            self.settings.camera_warm_seconds,
+        )
+        self.cameras_found.connect(self._on_cameras_found)
+        self.camera_ready.connect(self._on_camera_ready)
 
         # External Process
         self.process = QProcess(self)
@@ -70,6 +141,10 @@ class GestureMapperWindow(QMainWindow):
         self._apply_styles()
         self.statusBar().showMessage("Ready")
 
+        # Пока пользователь на приветственном экране, камеры уже опрашиваются
+        if self.settings.camera_probe_count:
+            self.camera_manager.enumerate(self.settings.camera_probe_count).add_done_callback(self.cameras_found.emit)
+
     def _build_welcome_screen(self):
         page = QWidget(self)
         layout = QVBoxLayout(page)
@@ -123,6 +198,11 @@ class GestureMapperWindow(QMainWindow):
             ("is_stop", "Stop"),
             ("is_okay", "Okay"),
             ("is_dislike", "Dislike"),
+            ("is_swipe_left", "Swipe left"),
+            ("is_swipe_right", "Swipe right"),
+            ("is_swipe_up", "Swipe up"),
+            ("is_swipe_down", "Swipe down"),
+            ("is_circle", "Circle"),
             ("is_two_stops", "Two hands"),
         ]
 
@@ -165,6 +245,55 @@ class GestureMapperWindow(QMainWindow):
             row.addWidget(combo, 1)
             left_layout.addLayout(row)
 
+        # Активная зона кадра в процентах: жесты вне неё не распознаются
+        zone_row = QHBoxLayout()
+        zone_row.setSpacing(10)
+        zone_label = QLabel("Active zone")
+        zone_label.setObjectName("gestureLabel")
+        zone_label.setFixedWidth(120)
+        zone_row.addWidget(zone_label)
+        for side, value in zip(("left", "top", "right", "bottom"), self.settings.active_zone):
+            spin = QSpinBox()
+            spin.setObjectName("zoneSpin")
+            spin.setRange(0, 100)
+            spin.setSingleStep(5)
+            spin.setPrefix(f"{side} ")
+            spin.setSuffix("%")
+            spin.setValue(round(value * 100))
+            self.zone_spins[side] = spin
+            zone_row.addWidget(spin, 1)
+        left_layout.addLayout(zone_row)
+
+        # Макросы: последовательность жестов ("Like > Stop") запускает действие
+        macro_row = QHBoxLayout()
+        macro_row.setSpacing(10)
+        macro_label = QLabel("Macro")
+        macro_label.setObjectName("gestureLabel")
+        macro_label.setFixedWidth(120)
+        self.macro_edit = QLineEdit()
+        self.macro_edit.setObjectName("macroEdit")
+        self.macro_edit.setPlaceholderText(f"Like {SEQUENCE_SEPARATOR} Stop")
+        self.macro_action_combo = QComboBox()
+        self.macro_action_combo.setObjectName("actionCombo")
+        self.macro_action_combo.addItems(MACRO_ACTION_KEYS)
+        add_macro_btn = QPushButton("Add")
+        add_macro_btn.setObjectName("addMacroButton")
+        add_macro_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        add_macro_btn.clicked.connect(self.on_add_macro_clicked)
+        macro_row.addWidget(macro_label)
+        macro_row.addWidget(self.macro_edit, 2)
+        macro_row.addWidget(self.macro_action_combo, 2)
+        macro_row.addWidget(add_macro_btn)
+        left_layout.addLayout(macro_row)
+
+        self.macro_list = QListWidget()
+        self.macro_list.setObjectName("macroList")
+        self.macro_list.setFixedHeight(80)
+        self.macro_list.setToolTip("Double-click a macro to remove it")
+        self.macro_list.itemDoubleClicked.connect(self.on_remove_macro)
+        self._set_macros(DEFAULT_MACROS)
+        left_layout.addWidget(self.macro_list)
+
         left_layout.addStretch()
         content_layout.addWidget(left_panel, 1)
 
@@ -181,6 +310,12 @@ class GestureMapperWindow(QMainWindow):
         self.video_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         right_layout.addWidget(self.video_label)
 
+        self.hud_label = QLabel()
+        self.hud_label.setObjectName("hudLabel")
+        self.hud_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+        self.hud_label.setVisible(False)
+        right_layout.addWidget(self.hud_label)
+
         content_layout.addWidget(right_panel, 1)
 
         root_layout.addLayout(content_layout, 1)
@@ -205,6 +340,17 @@ class GestureMapperWindow(QMainWindow):
         reset_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         reset_btn.clicked.connect(self.on_reset_clicked)
 
+        self.camera_combo = QComboBox()
+        self.camera_combo.setObjectName("cameraCombo")
+        self.camera_combo.addItem(f"Camera {self.settings.camera_index}", self.settings.camera_index)
+        self.camera_combo.setEnabled(False)
+        self.camera_combo.currentIndexChanged.connect(self.on_camera_selected)
+
+        self.hud_check = QCheckBox("HUD")
+        self.hud_check.setObjectName("hudCheck")
+        self.hud_check.setChecked(self.settings.show_hud)
+        self.hud_check.toggled.connect(self.on_hud_toggled)
+
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(70)
         buttons_layout.setContentsMargins(20, 0, 0, 0)
@@ -216,6 +362,8 @@ class GestureMapperWindow(QMainWindow):
         buttons_layout.addStretch()  # растягиваем пространство между левыми и правыми кнопками
 
         # Правая группа
+        buttons_layout.addWidget(self.camera_combo)
+        buttons_layout.addWidget(self.hud_check)
         buttons_layout.addWidget(reset_btn)
 
         root_layout.addLayout(buttons_layout)
@@ -235,7 +383,7 @@ class GestureMapperWindow(QMainWindow):
             self._initialize_gesture_recognition()
 
             # 3. Start the camera
-            self.start_camera(0)
+            self.start_camera(self.settings.camera_index)
 
         except Exception as e:
             msg = QMessageBox(self)
@@ -248,6 +396,51 @@ class GestureMapperWindow(QMainWindow):
         self.stop_camera()
         self.statusBar().showMessage("Camera stopped.", 3000)
 
+    def on_camera_selected(self, position: int):
+        index = self.camera_combo.itemData(position)
+        if index is not None:
+            self.settings.camera_index = index
+
+    def on_add_macro_clicked(self):
+        """Добавляет макрос из поля ввода; жесты можно писать названиями из списка слева"""
+        labels = {label.lower(): name for label, name in GESTURE_LABELS.items()}
+        names = [part.strip() for part in self.macro_edit.text().split(SEQUENCE_SEPARATOR)]
+        sequence = f" {SEQUENCE_SEPARATOR} ".join(labels.get(name.lower(), name) for name in names)
+        try:
+            parse_sequence(sequence)
+        except ValueError:
+            self.statusBar().showMessage(f"Unknown gesture in macro: {self.macro_edit.text()}", 3000)
+            return
+        self._add_macro(sequence, MACRO_ACTION_MAPPING[self.macro_action_combo.currentText()])
+        self.macro_edit.clear()
+
+    def on_remove_macro(self, item: QListWidgetItem):
+        self.macro_list.takeItem(self.macro_list.row(item))
+
+    def _add_macro(self, sequence: str, action: str):
+        # Повторная последовательность заменяет прежнее действие
+        for row in range(self.macro_list.count()):
+            if self.macro_list.item(row).data(Qt.ItemDataRole.UserRole)[0] == sequence:
+                self.macro_list.takeItem(row)
+                break
+        names = {name: label for label, name in GESTURE_LABELS.items()}
+        pretty = f" {SEQUENCE_SEPARATOR} ".join(names.get(part, part) for part in sequence.split(f" {SEQUENCE_SEPARATOR} "))
+        item = QListWidgetItem(f"{pretty}  →  {MACRO_ACTION_REVERSE.get(action, action)}")
+        item.setData(Qt.ItemDataRole.UserRole, (sequence, action))
+        self.macro_list.addItem(item)
+
+    def _set_macros(self, macros: Dict[str, str]):
+        self.macro_list.clear()
+        for sequence, action in macros.items():
+            self._add_macro(sequence, action)
+
+    def _macros(self) -> Dict[str, str]:
+        return dict(self.macro_list.item(row).data(Qt.ItemDataRole.UserRole) for row in range(self.macro_list.count()))
+
+    def on_hud_toggled(self, checked: bool):
+        self.settings.show_hud = checked
+        self._update_hud_timer()
+
     def on_apply_clicked(self):
         # Преобразуем красивые названия в внутренние ключи
         single_map = {
@@ -258,6 +451,12 @@ class GestureMapperWindow(QMainWindow):
         two_choice = TWO_ACTION_MAPPING.get(two_choice_pretty, "none")
         two_map = {k: two_choice for k in self.two_combos}
         apply_mapping(single_map, two_map)
+        self.settings.active_zone = tuple(
+            self.zone_spins[side].value() / 100 for side in ("left", "top", "right", "bottom")
+        )
+        self.settings.macros = self._macros()
+        if self.processor:
+            self.processor.macros.compile(self.settings.macros)
         self.statusBar().showMessage("Gesture mapping applied", 3000)
 
     def on_reset_clicked(self):
@@ -274,6 +473,9 @@ class GestureMapperWindow(QMainWindow):
             self.two_combos["is_stop is_stop"].setCurrentIndex(TWO_ACTION_KEYS.index(pretty_name_two))
         except ValueError:
             pass
+        for spin, value in zip(self.zone_spins.values(), Settings().active_zone):
+            spin.setValue(round(value * 100))
+        self._set_macros(DEFAULT_MACROS)
         self.statusBar().showMessage("Defaults restored. Click Start to apply and begin.", 3000)
 
     # -------- Gesture Recognition Initialization --------
@@ -286,116 +488,263 @@ class GestureMapperWindow(QMainWindow):
                 sys.path.insert(0, project_root)
 
             # Импортируем необходимые классы
-            from src.detection.gesture_detector import GestureDetector
-            from src.actions.single_hand_actions import SingleHandActions
-            from src.actions.two_hands_actions import TwoHandsActions
-
-            # Инициализируем детектор жестов
-            if self.gesture_detector is None:
-                self.gesture_detector = GestureDetector()
-                print("GestureDetector initialized")
-
-            # Инициализируем обработчики действий
-            if self.single_actions is None:
-                self.single_actions = SingleHandActions()
-                print("SingleHandActions initialized")
-
-            if self.two_actions is None:
-                self.two_actions = TwoHandsActions()
-                print("TwoHandsActions initialized")
+            from src.actions.backends import create_backend
+            from src.handlers import HandsProcessor
+            from src.detection.landmarker import create_hands
+
+            # Backend действий с заранее запущенным процессом-помощником
+            if self.action_backend is None:
+                self.action_backend = create_backend(self.settings)
+                if getattr(self.action_backend, "pool", None):
+                    self.action_backend.pool.warm_up()
+
+            # Тот же обработчик, что и в консольном режиме: правила или MLP, подтверждение, действия
+            if self.processor is None:
+                self.processor = HandsProcessor(self.settings, backend=self.action_backend)
+                log_event("component_initialized", component="HandsProcessor")
+
+            # MediaPipe ищет столько рук, сколько нужно текущим привязкам:
+            # без действий на жесты двумя руками достаточно одной
+            max_num_hands = self.processor.max_num_hands
+            # Модель, облегчённую governor-ом в прошлом запуске, новый запуск начинает с полной
+            if self.hands is not None and (self._hands_max != max_num_hands or self._hands_complexity != 1):
+                self.hands.close()
+                self.hands = None
+                self._hands_complexity = 1
+            if self.hands is None:
+                if self.hands_factory:
+                    self.hands = self.hands_factory()
+                else:
+                    self.hands = create_hands(self.settings, max_num_hands, model_complexity=self._hands_complexity)
+                self._hands_max = max_num_hands
+                log_event("component_initialized", component="Hands", max_num_hands=max_num_hands)
 
-            print("Gesture recognition initialized successfully")
+            log_event("gesture_recognition_ready")
 
         except Exception as e:
             raise RuntimeError(f"Failed to initialize gesture recognition: {e}")
 
     # -------- Camera Helpers --------
+    def _on_cameras_found(self, future):
+        """Заполняет список камер, когда фоновое перечисление закончилось"""
+        if future.exception() is not None:
+            self.statusBar().showMessage(f"Camera enumeration failed: {future.exception()}", 5000)
+            return
+        devices = future.result()
+        if not devices:
+            return
+        self.camera_combo.blockSignals(True)
+        self.camera_combo.clear()
+        for device in devices:
+            self.camera_combo.addItem(str(device), device.index)
+        selected = self.camera_combo.findData(self.settings.camera_index)
+        self.camera_combo.setCurrentIndex(max(selected, 0))
+        self.camera_combo.blockSignals(False)
+        self.settings.camera_index = self.camera_combo.currentData()
+        self.camera_combo.setEnabled(len(devices) > 1)
+
     def start_camera(self, index: int = 0):
-        if self._camera_running:
+        """Запрашивает камеру в фоне; запуск продолжается в _on_camera_ready, GUI-поток не ждёт"""
+        if self._camera_running or self._camera_opening is not None:
             self.statusBar().showMessage("Camera is already running.", 2000)
             return
 
-        self.cap = cv2.VideoCapture(index)
-        if not self.cap.isOpened():
-            self.cap.release()
-            self.cap = None
-            raise RuntimeError(f"Cannot open camera index {index}")
+        self._camera_opening = index
+        self.statusBar().showMessage(f"Opening camera {index}...")
+        self.camera_manager.open(index).add_done_callback(lambda future: self.camera_ready.emit((index, future)))
+
+    def _on_camera_ready(self, opened):
+        index, future = opened
+        if self._camera_opening != index:
+            # Stop нажали, пока камера открывалась
+            if future.exception() is None:
+                self.camera_manager.release(index, *future.result())
+            return
+        self._camera_opening = None
+        if future.exception() is not None:
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Icon.Critical)
+            msg.setWindowTitle("Start Error")
+            msg.setText(f"Failed to open camera:\n{future.exception()}")
+            msg.exec()
+            return
+        capture, capture_info = future.result()
+        self.cap, self._capture_info, self._camera_index = capture, capture_info, index
+        if self.settings.clip_dir and self.clip_recorder is None:
+            self.clip_recorder = ClipRecorder(
+                self.settings.clip_dir,
+                fps=capture_info.fps,
+                pre_seconds=self.settings.clip_pre_seconds,
+                post_seconds=self.settings.clip_post_seconds,
+                jpeg_quality=self.settings.clip_jpeg_quality,
+            )
+
+        self._build_pipeline()
 
         self._camera_running = True
         if self.camera_timer is None:
             self.camera_timer = QTimer(self)
             self.camera_timer.timeout.connect(self._update_frame)
-        self.camera_timer.start(30)  # ~33 FPS
-        self.statusBar().showMessage(f"Camera started (index {index})", 3000)
+        # Таймер под фактический FPS камеры, а не фиксированные ~33 FPS
+        fps = capture_info.fps or 33
+        self.camera_timer.start(max(1, int(1000 / fps)))
+        self._update_hud_timer()
+
+        message = f"Camera started (index {index}): {capture_info}"
+        if capture_info.mismatches:
+            message += " | not accepted: " + ", ".join(capture_info.mismatches)
+        self.statusBar().showMessage(message, 5000)
 
     def stop_camera(self):
         if self.camera_timer:
             self.camera_timer.stop()
+        self._camera_opening = None
         if self.cap:
-            try:
-                self.cap.release()
-            except Exception:
-                pass
+            # Формат, изменённый governor-ом, восстанавливается в потоке камеры при следующем открытии,
+            # модель MediaPipe — при следующем Start; GUI-поток здесь ничего не пересоздаёт
+            format_changed = self.governor is not None and self.governor.index > 0
+            self.camera_manager.release(self._camera_index, self.cap, self._capture_info, format_changed)
         self.cap = None
         self._camera_running = False
+        self._update_hud_timer()
         if self.video_label:
             self.video_label.clear()
             self.video_label.setText("Camera preview")
 
+    def _build_pipeline(self):
+        """Собирает конвейер кадра: общие стадии распознавания, затем отрисовка и превью в окне"""
+        zone = ActiveZone(self.settings.active_zone)
+        stages = recognition_stages(self.processor, self.hands, zone, mirror=True)
+        if self.cue_player is None:
+            self.cue_player = create_cue_player(self.settings)
+        if self.cue_player:
+            stages.append(Cues(self.cue_player))
+        # Ориентиры рисуются сразу в размере превью
+        bounds = (lambda: (self.video_label.width(), self.video_label.height())) if self.settings.overlay_at_preview else None
+        stages.append(
+            Render(
+                LandmarkOverlay(enabled=self.settings.draw_overlay),
+                zone,
+                bounds,
+                at_preview=self.settings.overlay_at_preview,
+                show_gesture=True,
+                due=self._render_due,
+            )
+        )
+        # Буфер клипов: кадр сохраняется по ссылке, запись идёт в фоновом потоке
+        if self.clip_recorder:
+            stages.append(RecordClips(self.clip_recorder))
+        stages.append(FunctionStage("preview", self._show_preview))
+        self.pipeline = Pipeline(stages, self.memory_profiler)
+        self._preview_interval = 1.0 / self._preview_fps()
+        self._last_preview = float("-inf")
+        self.hud = PerformanceHud(self.pipeline, self.hands, self.processor)
+
+        # Governor меняет модель MediaPipe только у настоящего бэкенда "solutions": подставной
+        # оставляет как есть, а у "tasks" одна модель, и пересоздавать её бесполезно
+        self.governor = None
+        if self.settings.governor:
+            governed = not self.hands_factory and self.settings.inference_backend != "tasks"
+            hands_factory = self._create_governed_hands if governed else None
+            self.governor = create_governor(
+                self.settings, self.pipeline, self.cap, hands_factory, self._hands_complexity
+            ).start()
+
+    def _create_governed_hands(self, model_complexity: int):
+        """Пересоздаёт MediaPipe с другой моделью по команде governor"""
+        from src.detection.landmarker import create_hands
+
+        self.hands = create_hands(self.settings, self._hands_max, model_complexity=model_complexity)
+        self._hands_complexity = model_complexity
+        self.hud.hands = self.hands
+        return self.hands
+
+    def _update_hud_timer(self):
+        """HUD работает только при включённой камере и видимом флажке"""
+        active = self._camera_running and self.settings.show_hud and self.hud is not None
+        self.hud_label.setVisible(active)
+        if not active:
+            if self.hud_timer:
+                self.hud_timer.stop()
+            return
+        if self.hud_timer is None:
+            self.hud_timer = QTimer(self)
+            self.hud_timer.timeout.connect(self._update_hud)
+        if not self.hud_timer.isActive():
+            # Первый замер сбрасывает счётчики, чтобы не усреднять время простоя
+            self.hud.sample()
+            self.hud_timer.start(max(100, int(self.settings.hud_interval * 1000)))
+
+    def _update_hud(self):
+        self.hud_label.setText("\n".join(self.hud.sample().lines()))
+
     def _update_frame(self):
         """Обновление кадра с камеры и распознавание жестов"""
-        if not self.cap or not self._camera_running:
+        if not self.cap or not self._camera_running or not self.pipeline:
             return
 
-        ok, frame = self.cap.read()
+        with self.memory_profiler.stage("capture"):
+            ok, image = self.cap.read()
         if not ok:
             return
 
-        frame = cv2.flip(frame, 1)  # Mirror effect
+        self._frame_index += 1
+        timestamp = time.monotonic()
+        self.pipeline.process(Frame(self._frame_index, timestamp, image))
+        if self.governor and self.governor.tick(timestamp):
+            self.statusBar().showMessage(
+                f"Quality level {self.governor.index}: {self.governor.frame_ms:.0f} ms/frame, CPU {self.governor.cpu:.0f}%",
+                3000,
+            )
+
+    def _preview_fps(self) -> float:
+        """Частота превью: частота обновления экрана, ограниченная Settings.preview_max_fps"""
+        screen = self.screen()
+        refresh = screen.refreshRate() if screen and screen.refreshRate() > 0 else 60.0
+        limit = self.settings.preview_max_fps
+        return min(refresh, limit) if limit > 0 else refresh
+
+    def _preview_visible(self) -> bool:
+        """Видно ли превью: окно не свёрнуто и показано на экране, видеовиджет на текущей странице"""
+        handle = self.windowHandle()
+        return (
+            not self.isMinimized()
+            and handle is not None
+            and handle.isExposed()
+            and self.video_label.isVisible()
+        )
 
-        # РАСПОЗНАВАНИЕ ЖЕСТОВ
-        if self.gesture_detector:
-            gesture = self.gesture_detector.detect(frame)
+    def _preview_due(self, frame) -> bool:
+        """Пора ли показать этот кадр; показывается всегда самый свежий кадр, промежуточные пропускаются"""
+        return frame.timestamp - self._last_preview >= self._preview_interval and self._preview_visible()
 
-            if gesture:
-                print(f"Detected gesture: {gesture}")
+    def _render_due(self, frame) -> bool:
+        # Буферу клипов нужен каждый отрисованный кадр, даже если превью не видно
+        return self.clip_recorder is not None or self._preview_due(frame)
 
-                # Обработка жеста двумя руками
-                if gesture == "is_two_stops":
-                    if self.two_actions:
-                        result = self.two_actions.get_action(gesture)
-                        if result:
-                            self.statusBar().showMessage(f"Action: {result}", 2000)
+    def _show_preview(self, frame):
+        """Стадия конвейера: показывает результат действия и кадр в окне"""
+        if frame.action:
+            self.statusBar().showMessage(f"Action: {frame.action}", 2000)
+        if frame.output is None or not self._preview_due(frame):
+            return frame
+        self._last_preview = frame.timestamp
 
-                # Обработка жеста одной рукой
-                else:
-                    if self.single_actions:
-                        result = self.single_actions.get_action(gesture)
-                        if result:
-                            self.statusBar().showMessage(f"Action: {result}", 2000)
-
-                # Визуализация жеста на экране
-                cv2.putText(frame, f"Gesture: {gesture}", (10, 50),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-
-            # Рисуем ориентиры руки
-            frame_rgb_for_detection = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.gesture_detector.hands.process(frame_rgb_for_detection)
-            frame = self.gesture_detector.draw_landmarks(frame, results)
-
-        # Отображение кадра
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        frame_rgb = cv2.cvtColor(frame.output, cv2.COLOR_BGR2RGB)
         h, w, ch = frame_rgb.shape
         bytes_per_line = ch * w
         q_img = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
 
         pixmap = QPixmap.fromImage(q_img)
-        scaled_pixmap = pixmap.scaled(
-            self.video_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.video_label.setPixmap(scaled_pixmap)
+        if not self.settings.overlay_at_preview:
+            smooth = self.governor is None or self.governor.level.smooth_preview
+            pixmap = pixmap.scaled(
+                self.video_label.size(),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
+            )
+        self.video_label.setPixmap(pixmap)
+        return frame
 
     # -------- Style --------
     def _apply_styles(self):
@@ -497,6 +846,57 @@ QWidget#mapperPage {
             color: #9ca3af;
         }
 
+        QLabel#hudLabel {
+            background: #111827;
+            color: #d1fae5;
+            border-radius: 12px;
+            padding: 10px 14px;
+            font-family: Menlo, Consolas, monospace;
+            font-size: 13px;
+        }
+
+        QComboBox#cameraCombo {
+            background: #e5e7eb;
+            color: #374151;
+            border: none;
+            border-radius: 18px;
+            padding: 8px 16px;
+            font-size: 15px;
+        }
+
+        QLineEdit#macroEdit {
+            background: #e5e7eb;
+            color: #374151;
+            border: none;
+            border-radius: 21px;
+            padding: 10px 18px;
+            font-size: 17px;
+        }
+
+        QPushButton#addMacroButton {
+            background-color: #1e1b8f;
+            color: white;
+            border: none;
+            border-radius: 21px;
+            padding: 10px 22px;
+            font-size: 17px;
+            font-weight: 600;
+        }
+
+        QListWidget#macroList {
+            background: #f3f4f6;
+            color: #374151;
+            border: none;
+            border-radius: 15px;
+            padding: 6px 12px;
+            font-size: 15px;
+        }
+
+        QCheckBox#hudCheck {
+            color: #374151;
+            font-size: 17px;
+        }
+
         /* Bottom Buttons */
         QPushButton#startButton {
             background-color: #15803d;
@@ -553,4 +953,14 @@ QWidget#mapperPage {
     def closeEvent(self, event):
         """Очистка ресурсов при закрытии окна"""
         self.stop_camera()
+        self.camera_manager.close()
+        if self.hands:
+            self.hands.close()
+        if self.action_backend:
+            self.action_backend.close()
+        if self.clip_recorder:
+            self.clip_recorder.close()
+        if self.cue_player:
+            self.cue_player.close()
+        self.memory_profiler.stop(self.settings.memory_report_path)
         event.accept()
\ No newline at end of file